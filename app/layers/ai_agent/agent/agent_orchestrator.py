@@ -1,20 +1,28 @@
 import time
 import asyncio
-from typing import Dict, Any, AsyncGenerator, Optional
+from typing import Dict, Any, AsyncGenerator, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
 from app.layers.ai_agent.agent.gemini_agent import GeminiAgent
+from app.layers.ai_agent.cache.query_cache import QueryResultCache
+from app.layers.ai_agent.llm.governor import LLMCapacityError
 from app.layers.ai_agent.parsers.query_parser import QueryParser
 from app.layers.ai_agent.parsers.intent_parser import IntentParser
 from app.layers.ai_agent.parsers.entity_extractor import EntityExtractor
+from app.layers.ai_agent.parsers.tool_result_parser import ToolResultParser
 from app.layers.ai_agent.schemas.output_schema import ContainerParseSchema
+from app.shared.config.settings.base import get_settings
 from app.shared.utils.logger import get_logger
 from app.shared.utils.cache import CacheManager
-from app.shared.config.constants.app_constants import ProcessingStep, StepStatus
+from app.shared.utils.metrics import get_metrics
+from app.shared.utils.query_stream import get_query_stream
+from app.shared.config.constants.app_constants import INTENT_TOOLS, LLMPriority, ProcessingStep, StepStatus
 from app.shared.schemas.sse_schema import SSEStepUpdate
 
+settings = get_settings()
 logger = get_logger(__name__)
+metrics = get_metrics()
 
 
 @dataclass
@@ -23,52 +31,93 @@ class AgentResult:
     processing_time_ms: int
     cached: bool
     raw_data:str
+    path: str = "llm"
 
 
 class AgentOrchestrator:
 
     def __init__(self):
-        self.gemini_agent = GeminiAgent()
+        self.cache = CacheManager()
+        self.gemini_agent = GeminiAgent(cache=self.cache)
         self.query_parser = QueryParser()
         self.intent_parser = IntentParser()
         self.entity_extractor = EntityExtractor()
-        self.cache = CacheManager()
+        self.tool_result_parser = ToolResultParser()
+        self.query_cache = QueryResultCache(self.cache)
+
+    async def startup(self):
+        try:
+            await self.cache.connect()
+        except Exception as e:
+            logger.warning(f"Redis unavailable at startup, connecting on first use: {e}")
+
+    async def shutdown(self):
+        await self.gemini_agent.shutdown()
+        await self.cache.disconnect()
+        logger.info("Agent orchestrator shut down")
 
-    async def process_query(self, query: str) -> AgentResult:
+    async def process_query(self, query: str, priority: LLMPriority = LLMPriority.INTERACTIVE) -> AgentResult:
         start_time = time.time()
 
         logger.info(f"Agent orchestrator processing query: {query}")
 
-        cache_key = f"query:{query.lower()}"
-        cached_result = await self.cache.get(cache_key)
-        # ignore cache result for noww
-        # if cached_result:
-        #     logger.info("Returning cached result")
-        #     cached_schema = ContainerParseSchema(**cached_result["data"])
-        #     return AgentResult(
-        #         data=cached_schema,
-        #         processing_time_ms=int((time.time() - start_time) * 1000),
-        #         cached=True,
-        #         raw_data=self._safe_get_message(cached_schema)
-        #     )
-
         try:
-            parsed = await self.gemini_agent.parse_query(query)
+            pre_parsed = self._pre_parse(query)
+            cached = False
 
-            processing_time = int((time.time() - start_time) * 1000)
+            stream = get_query_stream()
+            if stream:
+                stream.step(ProcessingStep.PARSE_QUERY, data={
+                    "container_candidates": pre_parsed["container_candidates"],
+                    "intent": pre_parsed["intent"].value,
+                    "confidence": pre_parsed["confidence"],
+                })
+
+            if self._is_cacheable(pre_parsed):
+                resolved = {}
+
+                async def compute() -> ContainerParseSchema:
+                    resolved["parsed"], resolved["path"] = await self._resolve(query, pre_parsed, priority)
+                    return resolved["parsed"]
+
+                if pre_parsed["force_refresh"]:
+                    parsed = await self.query_cache.refresh(pre_parsed["container_id"], pre_parsed["intent"], compute)
+                    path = resolved["path"]
+                else:
+                    lookup = await self.query_cache.get_or_compute(
+                        pre_parsed["container_id"], pre_parsed["intent"], compute
+                    )
+                    parsed = lookup.schema
+                    path = resolved.get("path", f"cache_{lookup.status}")
+                    cached = lookup.status != "miss"
+
+                    if lookup.status in ("hit", "stale"):
+                        parsed.served_from_cache = True
+                        parsed.data_age_seconds = (parsed.data_age_seconds or 0) + lookup.age_seconds
+            else:
+                parsed, path = await self._resolve(query, pre_parsed, priority)
 
-            cache_data = self.gemini_agent.get_schema_dict(parsed)
-            await self.cache.set(cache_key, {"data": cache_data}, ttl=300)
+            processing_time = int((time.time() - start_time) * 1000)
+            metrics.increment("agent_query_path", path=path)
+            metrics.observe(f"agent_query_ms_{path}", processing_time)
 
             raw_data = self._safe_get_message(parsed)
 
+            if stream:
+                stream.step(ProcessingStep.FORMAT_RESPONSE, data={"path": path})
+
             return AgentResult(
                 data=parsed,
                 processing_time_ms=processing_time,
-                cached=False,
-                raw_data=raw_data
+                cached=cached,
+                raw_data=raw_data,
+                path=path
             )
 
+        except LLMCapacityError:
+            # Overload is the caller's to report (503), not an answer
+            raise
+
         except Exception as e:
             logger.error(f"Error processing query: {str(e)}", exc_info=True)
             error_schema = ContainerParseSchema(
@@ -83,6 +132,165 @@ class AgentOrchestrator:
                 raw_data=f"Error: {str(e)}"
             )
 
+    async def _resolve(
+            self,
+            query: str,
+            pre_parsed: Dict[str, Any],
+            priority: LLMPriority = LLMPriority.INTERACTIVE
+    ) -> Tuple[ContainerParseSchema, str]:
+        if settings.FAST_PATH_ENABLED and pre_parsed["confidence"] >= settings.FAST_PATH_CONFIDENCE_THRESHOLD:
+            try:
+                return await self._resolve_fast_path(pre_parsed), "fast"
+            except Exception as e:
+                logger.warning(f"Fast path failed, falling back to LLM: {e}")
+                return await self._resolve_with_llm(query, pre_parsed, priority=priority), "fast_fallback"
+
+        # Only a query the rules mostly understand is worth hedging; zero
+        # confidence also covers more containers than MAX_CONTAINERS_PER_QUERY,
+        # which the rule path would fan out to
+        if settings.LLM_HEDGE_ENABLED and pre_parsed["confidence"] >= settings.LLM_HEDGE_MIN_CONFIDENCE:
+            return await self._resolve_hedged(query, pre_parsed, priority)
+
+        return await self._resolve_with_llm(query, pre_parsed, priority=priority), "llm"
+
+    async def _resolve_hedged(
+            self,
+            query: str,
+            pre_parsed: Dict[str, Any],
+            priority: LLMPriority = LLMPriority.INTERACTIVE
+    ) -> Tuple[ContainerParseSchema, str]:
+        """Runs the LLM under a latency budget. If it has not decided on a
+        tool call within LLM_HEDGE_AFTER_MS, the rule-based path starts
+        alongside it and the first valid answer wins; the other is
+        cancelled."""
+        decided = asyncio.Event()
+        llm_task = asyncio.create_task(self._resolve_with_llm(query, pre_parsed, decided, priority))
+
+        try:
+            await asyncio.wait_for(decided.wait(), settings.LLM_HEDGE_AFTER_MS / 1000)
+        except asyncio.TimeoutError:
+            pass
+
+        if decided.is_set() or llm_task.done():
+            return await llm_task, "llm"
+
+        logger.info(f"No tool decision after {settings.LLM_HEDGE_AFTER_MS}ms, hedging with the fast path")
+        fast_task = asyncio.create_task(self._resolve_fast_path(pre_parsed))
+        paths = {llm_task: "hedge_llm", fast_task: "hedge_fast"}
+        pending = set(paths)
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    if task.exception() is None:
+                        metrics.increment("llm_hedge", winner=paths[task])
+                        parsed = task.result()
+
+                        # Whatever the losing LLM streamed gives way to the
+                        # rule-based answer
+                        stream = get_query_stream()
+                        if stream and task is fast_task:
+                            stream.replace_text(parsed.message)
+
+                        return parsed, paths[task]
+
+                    logger.warning(f"Hedged {paths[task]} failed: {task.exception()}")
+
+            metrics.increment("llm_hedge", winner="none")
+            raise llm_task.exception()
+
+        finally:
+            for task in pending:
+                task.cancel()
+            # The loser unwinds (releasing its speculations and LLM slot)
+            # before the winner's answer moves on
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _resolve_with_llm(
+            self,
+            query: str,
+            pre_parsed: Dict[str, Any],
+            decided: Optional[asyncio.Event] = None,
+            priority: LLMPriority = LLMPriority.INTERACTIVE
+    ) -> ContainerParseSchema:
+        # Nearly every query ends up scraping the container it names, so the
+        # scrape starts now and overlaps the LLM turn instead of following it.
+        speculated = []
+        if settings.SPECULATIVE_SCRAPE_ENABLED:
+            speculator = self.gemini_agent.tool_registry.container_tools.speculator
+            for container_id in pre_parsed["container_candidates"][:settings.SPECULATIVE_SCRAPE_MAX_CONTAINERS]:
+                speculator.speculate(container_id, pre_parsed["force_refresh"])
+                speculated.append(container_id)
+
+        try:
+            return await self.gemini_agent.parse_query(query, decided, priority)
+        finally:
+            for container_id in speculated:
+                await speculator.release(container_id)
+
+    def _is_cacheable(self, pre_parsed: Dict[str, Any]) -> bool:
+        # Only a confident pre-parse yields a (container, intent) key that
+        # is known to describe the whole question.
+        return (
+            settings.QUERY_CACHE_ENABLED
+            and pre_parsed["container_id"] is not None
+            and len(pre_parsed["container_candidates"]) == 1
+            and pre_parsed["confidence"] >= settings.FAST_PATH_CONFIDENCE_THRESHOLD
+        )
+
+    def _pre_parse(self, query: str) -> Dict[str, Any]:
+        parsed_query = self.query_parser.parse(query)
+
+        return {
+            "container_id": self.entity_extractor.extract_container_id(parsed_query),
+            "container_candidates": parsed_query["container_candidates"],
+            "intent": self.intent_parser.classify_intent(parsed_query),
+            "force_refresh": parsed_query["force_refresh"],
+            "confidence": self.intent_parser.score_confidence(
+                parsed_query, settings.FAST_PATH_MAX_WORDS, settings.MAX_CONTAINERS_PER_QUERY
+            ),
+        }
+
+    async def _resolve_fast_path(self, pre_parsed: Dict[str, Any]) -> ContainerParseSchema:
+        container_ids = pre_parsed["container_candidates"]
+        if not container_ids:
+            raise ValueError("No valid container number in query")
+
+        intent = pre_parsed["intent"]
+        tool_name = INTENT_TOOLS[intent]
+        tool = self.gemini_agent.tool_registry.get_tool(tool_name)
+
+        logger.info(f"Fast path: {tool_name}({', '.join(container_ids)}), confidence {pre_parsed['confidence']}")
+
+        stream = get_query_stream()
+        if stream:
+            stream.step(ProcessingStep.SELECT_TOOL, message=tool_name, data={
+                "tier": "rules",
+                "tools": [{"name": tool_name, "args": {"container_id": container_id}} for container_id in container_ids],
+            })
+
+        calls = [
+            {"name": tool_name, "args": {"container_id": container_id, "force_refresh": pre_parsed["force_refresh"]}}
+            for container_id in container_ids
+        ]
+        responses = await asyncio.gather(*(tool(**call["args"]) for call in calls), return_exceptions=True)
+
+        if all(isinstance(response, Exception) for response in responses):
+            raise responses[0]
+
+        tool_calls = [
+            {**call, "response": {"status": "failed", "error": str(response)} if isinstance(response, Exception) else response}
+            for call, response in zip(calls, responses)
+        ]
+
+        parsed = self.tool_result_parser.from_tool_calls(tool_calls, confidence=pre_parsed["confidence"])
+        parsed.intent = intent.value
+        parsed.message = self.gemini_agent._generate_default_message(parsed)
+
+        return parsed
+
     def _safe_get_message(self, schema: Optional[ContainerParseSchema]) -> str:
         if schema is None:
             return "No data available"
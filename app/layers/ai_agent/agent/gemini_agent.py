@@ -1,24 +1,68 @@
 import json
-from typing import Dict, Any, Optional, List
+import time
+import uuid
+from contextlib import aclosing
+from typing import Dict, Any, AsyncIterator, Optional, List, Tuple, Union
 from google.genai import types
+from google.adk.events import Event
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.context_cache_config import ContextCacheConfig
 from google.adk.agents.llm_agent import LlmAgent
-from google.adk.agents import SequentialAgent
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.apps import App
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
+from pydantic import ValidationError
 import re
 import os
 import asyncio
 
+from app.layers.ai_agent.cache.llm_cache import LLMResponseCache
 from app.layers.ai_agent.schemas.output_schema import ContainerParseSchema
+from app.layers.ai_agent.parsers.query_parser import QueryParser
+from app.layers.ai_agent.parsers.tool_result_parser import ToolResultParser
 from app.layers.mcp.clients.workflow_client import WorkflowClient
 from app.layers.mcp.registry.tool_registry import ToolRegistry
+from app.layers.mcp.tools.projections import estimate_tokens, project_tool_result
+from app.shared.config.constants.app_constants import LLMPriority, ProcessingStep
 from app.shared.config.settings.base import get_settings
+from app.shared.utils.cache import CacheManager
+from app.shared.utils.helpers import normalize_container_id
 from app.shared.utils.logger import get_logger
+from app.shared.utils.metrics import get_metrics
+from app.shared.utils.query_stream import get_query_stream
 from app.layers.ai_agent.agent.base_agent import BaseAgent
-from app.layers.ai_agent.prompts.system_prompts import SYSTEM_INSTRUCTION, PARSER_INSTRUCTION
+from app.layers.ai_agent.llm.backends import build_llm
+from app.layers.ai_agent.llm.governor import GovernedLlm, LLMCapacityError, LLMGovernor, llm_priority
+from app.layers.ai_agent.prompts.prompt_manager import get_prompt_set
 
 settings = get_settings()
 logger = get_logger(__name__)
+metrics = get_metrics()
+
+# Session state key holding the full result of a tool call, by call ID
+TOOL_RECORD_STATE_PREFIX = "tool_record:"
+
+# Session state key carrying the response cache key of the model call in
+# progress from the before to the after model callback
+LLM_CACHE_KEY_STATE = "llm_cache_key"
+
+# Session state key holding tool results an escalated tier may reuse, by
+# call key
+REUSABLE_TOOL_RESULTS_STATE = "reusable_tool_results"
+
+# Model tiers of the cascade, cheapest first
+MODEL_TIERS = ["fast", "strong"]
+
+
+def _tool_call_key(name: str, args: Dict[str, Any]) -> str:
+    args = dict(args)
+    if args.get("container_id"):
+        args["container_id"] = normalize_container_id(args["container_id"]) or args["container_id"]
+    return f"{name}:{json.dumps(args, sort_keys=True, default=str)}"
 
 
 class GeminiAgent(BaseAgent):
@@ -30,7 +74,12 @@ class GeminiAgent(BaseAgent):
     tool_registry: ToolRegistry = None
     workflow_client: WorkflowClient = None
 
-    def __init__(self):
+    def __init__(
+            self,
+            model: Union[str, BaseLlm, None] = None,
+            prompt_variant: Optional[str] = None,
+            cache: Optional[CacheManager] = None
+    ):
         if not os.environ.get('GOOGLE_API_KEY'):
             os.environ['GOOGLE_API_KEY'] = settings.GOOGLE_API_KEY
             logger.info("Google API key set from settings")
@@ -38,115 +87,384 @@ class GeminiAgent(BaseAgent):
         self.workflow_client = WorkflowClient()
         self.tool_registry = ToolRegistry()
         self.tool_registry.initialize_with_workflow_client(self.workflow_client)
+        self.tool_result_parser = ToolResultParser()
 
         tools = self.tool_registry.get_all_tools()
         tool_names = self.tool_registry.list_tool_names()
         logger.info(f"Available tools: {tool_names}")
 
+        self.query_parser = QueryParser()
+        self.prompts = get_prompt_set(prompt_variant)
+        # Every model call takes a governor slot for just its own duration
+        self.governor = LLMGovernor(cache=cache if settings.LLM_GOVERNOR_REDIS_ENABLED else None)
+        models = {tier: GovernedLlm.wrap(model or build_llm(tier=tier), self.governor) for tier in MODEL_TIERS}
+
+        # Instructions are passed as static instructions so they form a
+        # fixed prompt prefix the backend can cache across queries.
         self.tool_agent = LlmAgent(
-            model="gemini-2.0-flash-exp",
+            model=models["strong"],
             name="tool_agent",
             description="Agent that extracts container IDs, determines intent, and calls appropriate tools",
-            instruction=SYSTEM_INSTRUCTION,
+            static_instruction=self.prompts.tool_instruction,
             tools=tools,
+            before_model_callback=self._cached_model_response,
+            after_model_callback=self._store_model_response,
+            before_tool_callback=self._reuse_tool_result,
+            after_tool_callback=self._project_tool_result,
+        )
+        self.fast_tool_agent = LlmAgent(
+            model=models["fast"],
+            name="fast_tool_agent",
+            description="Fast first tier of the tool agent for simple queries",
+            static_instruction=self.prompts.tool_instruction,
+            tools=tools,
+            before_model_callback=self._cached_model_response,
+            after_model_callback=self._store_model_response,
+            after_tool_callback=self._project_tool_result,
         )
         self.parser_agent = LlmAgent(
-            model="gemini-2.0-flash-exp",
+            model=models["strong"],
             name="parser_agent",
             description="Agent that parses tool results into structured ContainerParseSchema JSON",
-            instruction=PARSER_INSTRUCTION,
+            static_instruction=self.prompts.parser_instruction,
             tools=[],  # No tools for parser
+            before_model_callback=self._cached_model_response,
+            after_model_callback=self._store_model_response,
         )
 
-        logger.info(f"Gemini agents initialized")
+        # Runners and the session service are reused across queries; each
+        # query gets its own session.
+        self.session_service = InMemorySessionService()
+        self.tool_runner = Runner(
+            app=self._build_app(self.tool_agent),
+            session_service=self.session_service
+        )
+        self.fast_tool_runner = Runner(
+            app=self._build_app(self.fast_tool_agent),
+            session_service=self.session_service
+        )
+        self.tool_runners = {"fast": self.fast_tool_runner, "strong": self.tool_runner}
+        self.parser_runner = Runner(
+            app=self._build_app(self.parser_agent),
+            session_service=self.session_service
+        )
+        self.response_cache = LLMResponseCache(cache) if settings.LLM_RESPONSE_CACHE_ENABLED else None
+
+        logger.info(f"Gemini agents initialized with prompt variant {self.prompts.version}")
         logger.info(f"Tool agent: {len(tools)} tools registered")
-        logger.info(f"Parser agent: JSON output mode enabled")
 
-    def list_available_tools(self) -> List[str]:
-        return self.tool_registry.list_tool_names()
+    @staticmethod
+    def _build_app(agent: LlmAgent) -> App:
+        context_cache_config = None
+        if settings.LLM_CONTEXT_CACHE_ENABLED:
+            context_cache_config = ContextCacheConfig(
+                cache_intervals=settings.LLM_CONTEXT_CACHE_INTERVALS,
+                ttl_seconds=settings.LLM_CONTEXT_CACHE_TTL_SECONDS,
+                min_tokens=settings.LLM_CONTEXT_CACHE_MIN_TOKENS,
+            )
 
-    def get_tool_info(self, tool_name: str) -> Optional[Dict]:
-        return self.tool_registry.get_tool_metadata(tool_name)
+        return App(name=settings.APP_NAME, root_agent=agent, context_cache_config=context_cache_config)
 
-    async def get_agent(self):
-        return self.tool_agent
+    def _record_usage(self, agent: str, usage: types.GenerateContentResponseUsageMetadata):
+        labels = {"agent": agent, "variant": self.prompts.variant}
+        metrics.observe("llm_prompt_tokens", usage.prompt_token_count or 0, **labels)
+        metrics.observe("llm_cached_prompt_tokens", usage.cached_content_token_count or 0, **labels)
+        metrics.observe("llm_output_tokens", usage.candidates_token_count or 0, **labels)
 
-    async def setup_agent(self):
-        pass
+        logger.debug(
+            "LLM call usage",
+            prompt_tokens=usage.prompt_token_count,
+            cached_prompt_tokens=usage.cached_content_token_count,
+            output_tokens=usage.candidates_token_count,
+            **labels
+        )
 
-    async def parse_query(self, query: str) -> ContainerParseSchema:
-        logger.info(f"Starting two-agent pipeline for query: {query}")
+    async def _cached_model_response(
+            self,
+            callback_context: CallbackContext,
+            llm_request: LlmRequest
+    ) -> Optional[LlmResponse]:
+        if self.response_cache is None:
+            return None
 
-        session_service = InMemorySessionService()
-        await session_service.create_session(
+        key = self.response_cache.build_key(
+            llm_request.model, callback_context.agent_name, self.prompts.version, llm_request.contents
+        )
+        callback_context.state[LLM_CACHE_KEY_STATE] = key
+
+        content = await self.response_cache.get(key)
+        return LlmResponse(content=content) if content else None
+
+    async def _store_model_response(
+            self,
+            callback_context: CallbackContext,
+            llm_response: LlmResponse
+    ) -> None:
+        key = callback_context.state.get(LLM_CACHE_KEY_STATE)
+
+        if (
+            self.response_cache is None
+            or key is None
+            or llm_response.partial
+            or llm_response.error_code
+            or not llm_response.content
+            or not llm_response.content.parts
+        ):
+            return None
+
+        await self.response_cache.put(key, llm_response.content)
+
+    @staticmethod
+    def _reuse_tool_result(tool, args, tool_context) -> Optional[Dict[str, Any]]:
+        """An escalated tier gets the lower tier's result for an identical
+        tool call instead of running its workflow again."""
+        reusable = tool_context.state.get(REUSABLE_TOOL_RESULTS_STATE) or {}
+        response = reusable.get(_tool_call_key(tool.name, args))
+
+        if response is not None:
+            metrics.increment("llm_cascade_tool_reuse", tool=tool.name)
+
+        return response
+
+    def _project_tool_result(self, tool, args, tool_context, tool_response):
+        """The model sees only the fields relevant to the tool; the full
+        result rides along in the function response event's state delta for
+        building the structured response."""
+        tool_context.state[f"{TOOL_RECORD_STATE_PREFIX}{tool_context.function_call_id}"] = tool_response
+
+        projected = project_tool_result(tool.name, tool_response)
+
+        metrics.observe("tool_output_tokens", estimate_tokens(tool_response), tool=tool.name, form="full")
+        metrics.observe("tool_output_tokens", estimate_tokens(projected), tool=tool.name, form="projected")
+
+        return projected
+
+    async def _run_agent(
+            self,
+            runner: Runner,
+            text: str,
+            run_config: Optional[RunConfig] = None,
+            state: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Event]:
+        user_id = "api_user"
+        session_id = f"session-{uuid.uuid4()}"
+
+        await self.session_service.create_session(
             app_name=settings.APP_NAME,
-            user_id="sequential_user",
-            session_id="sequential_session"
+            user_id=user_id,
+            session_id=session_id,
+            state=state
         )
 
-        sequential_agent = SequentialAgent(
-            name="container_pipeline",
-            sub_agents=[self.tool_agent, self.parser_agent],
-            description="Two-stage pipeline: tool calling → JSON parsing"
-        )
+        try:
+            content = types.Content(
+                role="user",
+                parts=[types.Part(text=text)]
+            )
 
-        runner = Runner(
-            agent=sequential_agent,
-            app_name=settings.APP_NAME,
-            session_service=session_service
-        )
+            async for event in runner.run_async(
+                    user_id=user_id,
+                    session_id=session_id,
+                    new_message=content,
+                    run_config=run_config
+            ):
+                yield event
+
+        finally:
+            await self.session_service.delete_session(
+                app_name=settings.APP_NAME,
+                user_id=user_id,
+                session_id=session_id
+            )
 
-        content = types.Content(
-            role="user",
-            parts=[types.Part(text=query)]
-        )
+    def list_available_tools(self) -> List[str]:
+        return self.tool_registry.list_tool_names()
 
-        events = runner.run(
-            user_id="sequential_user",
-            session_id="sequential_session",
-            new_message=content
-        )
+    def get_tool_info(self, tool_name: str) -> Optional[Dict]:
+        return self.tool_registry.get_tool_metadata(tool_name)
 
-        tool_agent_response = None
-        parser_agent_response = None
-        final_schema = None
-
-        for event in events:
-            logger.debug(f"Event: {type(event).__name__}")
-
-            if event.is_final_response() and event.content:
-                raw_text = "".join([p.text for p in event.content.parts if p.text]).strip()
-
-                try:
-                    parsed = self.sanitize_response(raw_text)
-                    final_schema = parsed
-                    logger.info(
-                        f"Successfully parsed response from {event.agent_name if hasattr(event, 'agent_name') else 'agent'}")
-                except Exception as e:
-                    logger.debug(f"Response not parseable as schema (this is OK for tool agent): {e}")
-                    if tool_agent_response is None:
-                        tool_agent_response = raw_text
-
-        if final_schema is None:
-            logger.error("Pipeline failed to produce valid ContainerParseSchema")
-            logger.error(f"Tool agent response: {tool_agent_response[:500] if tool_agent_response else 'None'}")
-
-            return ContainerParseSchema(
-                message=tool_agent_response if len(tool_agent_response)>0 else "I apologize, but I encountered an error processing your request. Please try again or contact support.",
-                has_errors=True,
-                error_message="Failed to parse agent pipeline output into valid schema"
-            )
+    async def get_agent(self):
+        return self.tool_agent
+
+    async def setup_agent(self):
+        pass
 
-        if not final_schema.message:
-            final_schema.message = self._generate_default_message(final_schema)
-            logger.info(f"Generated default message: {final_schema.message}")
+    async def shutdown(self):
+        await self.tool_runner.close()
+        await self.fast_tool_runner.close()
+        await self.parser_runner.close()
+        logger.info("Gemini agent runners closed")
+
+    def _route(self, query: str) -> Tuple[str, Dict[str, Any]]:
+        parsed_query = self.query_parser.parse(query)
+
+        if not settings.LLM_CASCADE_ENABLED:
+            return "strong", parsed_query
+
+        # Long or multi-part questions go straight to the strong tier
+        if parsed_query["word_count"] > settings.LLM_CASCADE_MAX_WORDS:
+            metrics.increment("llm_cascade_routed", reason="long")
+            return "strong", parsed_query
+        if len(parsed_query["container_candidates"]) > 1 or parsed_query["intent_matches"] > 1:
+            metrics.increment("llm_cascade_routed", reason="multi_part")
+            return "strong", parsed_query
+
+        return "fast", parsed_query
+
+    @staticmethod
+    def _score_confidence(parsed_query: Dict[str, Any], schema: ContainerParseSchema,
+                          tool_calls: List[Dict[str, Any]]) -> float:
+        """Fills ContainerParseSchema.confidence for the cascade. The tool
+        agent replies in free text and the schema is built from tool output,
+        so the model reports no confidence of its own; a tier's answer is
+        scored against the rule-based parse of the same query instead."""
+        candidates = parsed_query["container_candidates"]
+
+        if not tool_calls:
+            # Asking for a container number is right only when none was given
+            return 0.3 if candidates else 0.9
+
+        if candidates and schema.container_id not in candidates:
+            return 0.5
+
+        return 0.9
+
+    async def parse_query(
+            self,
+            query: str,
+            decided: Optional[asyncio.Event] = None,
+            priority: LLMPriority = LLMPriority.INTERACTIVE
+    ) -> ContainerParseSchema:
+        """decided, when given, is set once the model has decided how to
+        answer: its first tool call or a reply without one."""
+        tier, parsed_query = self._route(query)
+        metrics.increment("llm_cascade_queries", tier=tier)
+
+        fast_tool_calls: List[Dict[str, Any]] = []
+
+        if tier == "fast":
+            try:
+                schema, fast_tool_calls = await self._run_tier("fast", query, parsed_query, decided, priority)
+            except LLMCapacityError:
+                raise
+            except Exception as e:
+                logger.warning(f"Fast tier failed, escalating: {e}")
+                reason = "schema" if isinstance(e, ValidationError) else "error"
+                metrics.increment("llm_cascade_escalations", reason=reason)
+            else:
+                if schema.confidence >= settings.LLM_CASCADE_CONFIDENCE_THRESHOLD:
+                    return schema
+
+                logger.info(f"Fast tier confidence {schema.confidence}, escalating")
+                metrics.increment("llm_cascade_escalations", reason="confidence")
+
+            # The strong tier's reply supersedes whatever the fast tier streamed
+            stream = get_query_stream()
+            if stream:
+                stream.replace_text()
+
+        # Only the answer escalates: tool calls the fast tier already made
+        # are served from its results instead of starting workflows again
+        schema, _ = await self._run_tier("strong", query, parsed_query, decided, priority, fast_tool_calls)
+        return schema
+
+    async def _run_tier(
+            self,
+            tier: str,
+            query: str,
+            parsed_query: Dict[str, Any],
+            decided: Optional[asyncio.Event] = None,
+            priority: LLMPriority = LLMPriority.INTERACTIVE,
+            reusable_tool_calls: Optional[List[Dict[str, Any]]] = None
+    ) -> Tuple[ContainerParseSchema, List[Dict[str, Any]]]:
+        """Returns the tier's answer and the tool calls it made, each
+        {"name", "args", "response"}."""
+        logger.info(f"Starting {tier} tool agent for query: {query}")
+        start_time = time.time()
+
+        calls: Dict[str, Dict[str, Any]] = {}
+        tool_calls: List[Dict[str, Any]] = []
+        message = None
+
+        # A listening client gets the reply text as the model writes it
+        stream = get_query_stream()
+        run_config = RunConfig(streaming_mode=StreamingMode.SSE) if stream else None
+
+        state = None
+        if reusable_tool_calls:
+            state = {REUSABLE_TOOL_RESULTS_STATE: {
+                _tool_call_key(call["name"], call["args"]): call["response"]
+                for call in reusable_tool_calls
+                if call["response"].get("status") == "success" or "results" in call["response"]
+            }}
+
+        # Tool results are already structured ContainerParser output, so they
+        # are taken from the function call events as-is; the model only
+        # contributes the natural-language reply. The run is closed explicitly
+        # so a cancelled one (hedge loser, escalated tier) deletes its
+        # session right away.
+        with llm_priority(priority):
+            async with aclosing(self._run_agent(self.tool_runners[tier], query, run_config, state)) as events:
+                async for event in events:
+                    logger.debug(f"Event: {type(event).__name__}")
+
+                    if event.partial:
+                        if stream and event.content:
+                            stream.text("".join(p.text for p in event.content.parts if p.text))
+                        continue
+
+                    new_calls = event.get_function_calls()
+                    for call in new_calls:
+                        calls[call.id] = {"name": call.name, "args": dict(call.args or {})}
+
+                    if stream and new_calls:
+                        stream.step(
+                            ProcessingStep.SELECT_TOOL,
+                            message=", ".join(call.name for call in new_calls),
+                            data={"tier": tier, "tools": [{"name": call.name, "args": dict(call.args or {})} for call in new_calls]},
+                        )
+
+                    if decided and (calls or event.is_final_response()):
+                        decided.set()
+
+                    state_delta = event.actions.state_delta if event.actions else {}
+                    for response in event.get_function_responses():
+                        call = calls.get(response.id, {"name": response.name, "args": {}})
+                        record = state_delta.get(f"{TOOL_RECORD_STATE_PREFIX}{response.id}", response.response)
+                        tool_calls.append({**call, "response": record or {}})
+
+                    if event.usage_metadata:
+                        self._record_usage(event.author, event.usage_metadata)
+
+                    if event.is_final_response() and event.content:
+                        message = "".join([p.text for p in event.content.parts if p.text]).strip()
+
+        final_schema = self.tool_result_parser.from_tool_calls(tool_calls)
+        final_schema.message = message or self._generate_default_message(final_schema)
+        if final_schema.confidence is None:
+            final_schema.confidence = self._score_confidence(parsed_query, final_schema, tool_calls)
+
+        metrics.observe("llm_tier_ms", int((time.time() - start_time) * 1000), tier=tier)
 
         logger.info(
-            f"Pipeline completed successfully. Container: {final_schema.container_id}, Intent: {final_schema.intent}")
-        return final_schema
+            f"Pipeline completed on {tier} tier. Container: {final_schema.container_id}, "
+            f"Intent: {final_schema.intent}, tool calls: {len(tool_calls)}")
+        return final_schema, tool_calls
 
     def _generate_default_message(self, schema: ContainerParseSchema) -> str:
 
+        if len(schema.containers) > 1:
+            return " ".join(
+                self._generate_default_message(ContainerParseSchema(
+                    container_id=result.container_id,
+                    intent=schema.intent,
+                    container_data=result.container_data,
+                    has_errors=result.has_errors,
+                    error_message=result.error_message,
+                ))
+                for result in schema.containers
+            )
+
         if schema.has_errors:
             return schema.error_message or "An error occurred while processing your request."
 
@@ -243,10 +561,18 @@ class GeminiAgent(BaseAgent):
 
         return self._generate_default_message(schema)
 
-    async def parse_raw_data(self, data: Dict[str, Any]) -> ContainerParseSchema:
-        return await self.execute_parser_agent(data)
-
-    async def execute_parser_agent(self, data: Dict[str, Any]) -> ContainerParseSchema:
+    async def parse_raw_data(
+            self,
+            data: Dict[str, Any],
+            priority: LLMPriority = LLMPriority.BATCH
+    ) -> ContainerParseSchema:
+        return await self.execute_parser_agent(data, priority)
+
+    async def execute_parser_agent(
+            self,
+            data: Dict[str, Any],
+            priority: LLMPriority = LLMPriority.BATCH
+    ) -> ContainerParseSchema:
         logger.info("Executing standalone parser agent")
 
         parsing_prompt = f"""Parse this data into ContainerParseSchema format.
@@ -257,40 +583,21 @@ Additional Context: {json.dumps({k: v for k, v in data.items() if k not in ['que
 
 Output valid JSON matching ContainerParseSchema. Include a helpful message field."""
 
-        session_service = InMemorySessionService()
-        await session_service.create_session(
-            app_name=settings.APP_NAME,
-            user_id="parser_user",
-            session_id="parser_session"
-        )
-
-        runner = Runner(
-            agent=self.parser_agent,
-            app_name=settings.APP_NAME,
-            session_service=session_service
-        )
-
-        content = types.Content(
-            role="user",
-            parts=[types.Part(text=parsing_prompt)]
-        )
-
-        events = runner.run(
-            user_id="parser_user",
-            session_id="parser_session",
-            new_message=content
-        )
-
         final_data = None
-        for event in events:
-            if event.is_final_response() and event.content:
-                raw_data = "".join([p.text for p in event.content.parts if p.text]).strip()
-                try:
-                    final_data = self.sanitize_response(raw_data)
-                    break
-                except Exception as e:
-                    logger.error(f"Parser failed: {e}")
-                    continue
+        with llm_priority(priority):
+            async with aclosing(self._run_agent(self.parser_runner, parsing_prompt)) as events:
+                async for event in events:
+                    if event.usage_metadata:
+                        self._record_usage(self.parser_agent.name, event.usage_metadata)
+
+                    if event.is_final_response() and event.content:
+                        raw_data = "".join([p.text for p in event.content.parts if p.text]).strip()
+                        try:
+                            final_data = self.sanitize_response(raw_data)
+                            break
+                        except Exception as e:
+                            logger.error(f"Parser failed: {e}")
+                            continue
 
         if final_data is None:
             raise ValueError("Parser agent failed to produce valid output")
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from google.genai import types
+
+from app.layers.ai_agent.parsers.query_parser import QueryParser
+from app.shared.config.settings.base import get_settings
+from app.shared.utils.cache import CacheManager
+from app.shared.utils.logger import get_logger
+from app.shared.utils.metrics import get_metrics
+
+settings = get_settings()
+logger = get_logger(__name__)
+metrics = get_metrics()
+
+# Tool result fields that differ between lookups of the same scrape data;
+# they never change what the model should answer
+VOLATILE_RESULT_FIELDS = {"last_updated", "scraped_at", "workflow_id"}
+
+# Data age does show up in the reply, which the prompts keep to the same
+# granularity, so it is keyed by that rough age instead of to the second
+AGE_RESULT_FIELDS = {"data_age_s", "age_seconds"}
+
+
+def _age_bucket(seconds: Any) -> Any:
+    if not isinstance(seconds, (int, float)):
+        return seconds
+    if seconds < 60:
+        return "<1m"
+    if seconds < 3600:
+        return f"{int(seconds // 60)}m"
+    return f"{int(seconds // 3600)}h"
+
+
+def _stable(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: _age_bucket(item) if key in AGE_RESULT_FIELDS else _stable(item)
+            for key, item in value.items()
+            if key not in VOLATILE_RESULT_FIELDS
+        }
+    if isinstance(value, list):
+        return [_stable(item) for item in value]
+    return value
+
+
+class LLMResponseCache:
+    """Model responses keyed on everything that decides them: model, agent,
+    instruction version, normalised text and the tool calls and results so
+    far, less the volatile result fields and with data age rounded. A
+    bounded in-process LRU sits in front of Redis; both expire entries
+    after LLM_RESPONSE_CACHE_TTL_SECONDS."""
+
+    def __init__(self, cache: Optional[CacheManager] = None, max_entries: int = None, ttl: int = None):
+        self.cache = cache
+        self.max_entries = max_entries or settings.LLM_RESPONSE_CACHE_MAX_ENTRIES
+        self.ttl = ttl or settings.LLM_RESPONSE_CACHE_TTL_SECONDS
+        self.query_parser = QueryParser()
+        self._local: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lookups = 0
+        self._hits = 0
+
+    def _normalize(self, text: str) -> str:
+        return self.query_parser.normalize(text).lower()
+
+    def build_key(self, model: str, agent: str, instruction_version: str, contents: List[types.Content]) -> str:
+        # Call IDs differ per run and never change the answer, so they are
+        # left out
+        turns = []
+        for content in contents:
+            for part in content.parts or []:
+                if part.text:
+                    turns.append([content.role, "text", self._normalize(part.text)])
+                elif part.function_call:
+                    turns.append([content.role, "call", part.function_call.name, part.function_call.args])
+                elif part.function_response:
+                    turns.append([
+                        content.role, "result", part.function_response.name, _stable(part.function_response.response)
+                    ])
+
+        payload = json.dumps([model, agent, instruction_version, turns], sort_keys=True, default=str)
+        return f"llm:response:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+    def _record(self, result: str):
+        self._lookups += 1
+        if result != "miss":
+            self._hits += 1
+
+        metrics.increment("llm_response_cache", result=result)
+        metrics.set_gauge("llm_response_cache_hit_rate", round(self._hits / self._lookups, 3))
+
+    def _store_local(self, key: str, entry: Dict[str, Any]):
+        self._local[key] = (time.time() + self.ttl, entry)
+        self._local.move_to_end(key)
+
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[types.Content]:
+        local = self._local.get(key)
+        if local is not None:
+            expires_at, entry = local
+            if expires_at > time.time():
+                self._local.move_to_end(key)
+                self._record("hit_local")
+                return types.Content.model_validate(entry)
+
+            del self._local[key]
+
+        if self.cache is not None:
+            entry = await self.cache.get(key)
+            if entry is not None:
+                self._store_local(key, entry)
+                self._record("hit_redis")
+                return types.Content.model_validate(entry)
+
+        self._record("miss")
+        return None
+
+    async def put(self, key: str, content: types.Content) -> bool:
+        entry = content.model_dump(mode="json", exclude_none=True)
+        for part in entry.get("parts", []):
+            part.get("function_call", {}).pop("id", None)
+
+        size = len(json.dumps(entry))
+        if size > settings.LLM_RESPONSE_CACHE_MAX_ENTRY_BYTES:
+            logger.debug(f"Not caching {size} byte model response")
+            return False
+
+        self._store_local(key, entry)
+        if self.cache is not None:
+            await self.cache.set(key, entry, ttl=self.ttl)
+
+        return True
@@ -0,0 +1,137 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+from app.layers.ai_agent.schemas.output_schema import ContainerParseSchema
+from app.layers.scraper.cache.scrape_cache import classify_container_state, max_age_for
+from app.shared.config.constants.app_constants import INTENT_OPERATIONS, QueryIntent
+from app.shared.config.settings.base import get_settings
+from app.shared.utils.cache import CacheManager
+from app.shared.utils.logger import get_logger
+from app.shared.utils.metrics import get_metrics
+from app.shared.utils.query_stream import shared_context
+
+settings = get_settings()
+logger = get_logger(__name__)
+metrics = get_metrics()
+
+
+@dataclass
+class QueryCacheResult:
+    schema: ContainerParseSchema
+    status: str  # hit, stale, miss or coalesced
+    age_seconds: int = 0
+
+
+class QueryResultCache:
+    """Answers keyed on the pre-parsed (container ID, intent) pair, so
+    differently phrased questions about the same box share an entry.
+
+    An entry is fresh for the scrape freshness policy of its intent and last
+    known container state. For QUERY_CACHE_STALE_SECONDS after that it is
+    still served, while one background task refreshes it. Concurrent misses
+    on the same key wait on a single computation."""
+
+    def __init__(self, cache: CacheManager = None):
+        self.cache = cache or CacheManager()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._refreshing: Set[str] = set()
+
+    @staticmethod
+    def _key(container_id: str, intent: QueryIntent) -> str:
+        return f"query:{container_id}:{intent.value}"
+
+    async def get_or_compute(
+            self,
+            container_id: str,
+            intent: QueryIntent,
+            compute: Callable[[], Awaitable[ContainerParseSchema]]
+    ) -> QueryCacheResult:
+        key = self._key(container_id, intent)
+
+        entry = await self.cache.get(key)
+        if entry is not None:
+            age_seconds = int(time.time() - entry["stored_at"])
+            schema = ContainerParseSchema(**entry["data"])
+
+            if age_seconds <= entry["max_age"]:
+                metrics.increment("query_cache", result="hit", intent=intent.value)
+                return QueryCacheResult(schema, "hit", age_seconds)
+
+            if key not in self._refreshing and key not in self._inflight:
+                self._refreshing.add(key)
+                task = self._start(key, intent, compute, stream=False)
+                task.add_done_callback(lambda t: self._finish_refresh(key, t))
+
+            metrics.increment("query_cache", result="stale", intent=intent.value)
+            return QueryCacheResult(schema, "stale", age_seconds)
+
+        if key in self._inflight:
+            metrics.increment("query_cache", result="coalesced", intent=intent.value)
+            schema = await asyncio.shield(self._inflight[key])
+            return QueryCacheResult(schema, "coalesced")
+
+        metrics.increment("query_cache", result="miss", intent=intent.value)
+        schema = await asyncio.shield(self._start(key, intent, compute))
+        return QueryCacheResult(schema, "miss")
+
+    async def refresh(
+            self,
+            container_id: str,
+            intent: QueryIntent,
+            compute: Callable[[], Awaitable[ContainerParseSchema]]
+    ) -> ContainerParseSchema:
+        return await self._compute_and_store(self._key(container_id, intent), intent, compute)
+
+    def _finish_refresh(self, key: str, task: asyncio.Task):
+        self._refreshing.discard(key)
+
+        if not task.cancelled() and task.exception():
+            logger.warning(f"Background refresh of {key} failed: {task.exception()}")
+            metrics.increment("query_cache_refresh_failed")
+
+    def _start(
+            self,
+            key: str,
+            intent: QueryIntent,
+            compute: Callable[[], Awaitable[ContainerParseSchema]],
+            stream: bool = True
+    ) -> asyncio.Task:
+        # Shielded so a disconnecting caller does not cancel the computation
+        # other callers are waiting on, and run in a shared context so its
+        # stream does not cancel that computation's workflows either. A
+        # background refresh reports to no stream.
+        task = asyncio.create_task(
+            self._compute_and_store(key, intent, compute),
+            context=shared_context(stream)
+        )
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return task
+
+    async def _compute_and_store(
+            self,
+            key: str,
+            intent: QueryIntent,
+            compute: Callable[[], Awaitable[ContainerParseSchema]]
+    ) -> ContainerParseSchema:
+        schema = await compute()
+
+        if schema.has_errors or not schema.container_data:
+            return schema
+
+        max_age = self.max_age(intent, schema)
+        await self.cache.set(
+            key,
+            {"data": schema.model_dump(), "stored_at": time.time(), "max_age": max_age},
+            ttl=max_age + settings.QUERY_CACHE_STALE_SECONDS,
+        )
+
+        return schema
+
+    @staticmethod
+    def max_age(intent: QueryIntent, schema: ContainerParseSchema) -> int:
+        operation = INTENT_OPERATIONS[intent]
+        state = classify_container_state(schema.container_data.model_dump(), operation) if schema.container_data else None
+        return max_age_for(operation, state)
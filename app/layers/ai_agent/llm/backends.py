@@ -0,0 +1,42 @@
+from typing import Callable, Dict, Optional, Union
+
+from google.adk.models.base_llm import BaseLlm
+
+from app.layers.ai_agent.llm.scripted_llm import ScriptedLlm
+from app.shared.config.settings.base import get_settings
+from app.shared.utils.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+
+def _gemini(tier: str) -> str:
+    # ADK resolves model names to its Gemini client through the LLM registry
+    return settings.LLM_FAST_MODEL if tier == "fast" else settings.LLM_MODEL
+
+
+def _scripted(tier: str) -> BaseLlm:
+    return ScriptedLlm(
+        model=f"scripted-{tier}",
+        latency_ms=settings.SCRIPTED_LLM_FAST_LATENCY_MS if tier == "fast" else settings.SCRIPTED_LLM_LATENCY_MS,
+        latency_jitter_ms=settings.SCRIPTED_LLM_LATENCY_JITTER_MS,
+        latency_distribution=settings.SCRIPTED_LLM_LATENCY_DISTRIBUTION,
+        latency_per_token_ms=settings.SCRIPTED_LLM_LATENCY_PER_TOKEN_MS,
+        seed=settings.SCRIPTED_LLM_SEED,
+    )
+
+
+LLM_BACKENDS: Dict[str, Callable[[str], Union[str, BaseLlm]]] = {
+    "gemini": _gemini,
+    "scripted": _scripted,
+}
+
+
+def build_llm(backend: Optional[str] = None, tier: str = "strong") -> Union[str, BaseLlm]:
+    backend = backend or settings.LLM_BACKEND
+
+    if backend not in LLM_BACKENDS:
+        raise ValueError(f"Unknown LLM backend '{backend}'. Available: {', '.join(LLM_BACKENDS)}")
+
+    logger.info(f"Using LLM backend: {backend} ({tier} tier)")
+    return LLM_BACKENDS[backend](tier)
@@ -0,0 +1,204 @@
+import asyncio
+import contextvars
+import heapq
+import itertools
+import random
+import time
+from collections import Counter
+from contextlib import aclosing, asynccontextmanager, contextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Iterator, List, Optional, Union
+
+from google.adk.models.base_llm import BaseLlm, LlmCapabilities
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.models.registry import LLMRegistry
+
+from app.shared.config.constants.app_constants import LLMPriority, LLM_PRIORITY_ORDER
+from app.shared.config.settings.base import get_settings
+from app.shared.exceptions.base_exceptions import RateLimitError
+from app.shared.utils.cache import CacheManager
+from app.shared.utils.logger import get_logger
+from app.shared.utils.metrics import get_metrics
+
+settings = get_settings()
+logger = get_logger(__name__)
+metrics = get_metrics()
+
+LEASE_KEY = "llm:leases"
+
+# Priority of the query whose agent run is in progress. Model calls happen
+# deep inside ADK, which passes them no per-query arguments.
+_current_priority: contextvars.ContextVar[LLMPriority] = contextvars.ContextVar(
+    "llm_priority", default=LLMPriority.INTERACTIVE
+)
+
+
+@contextmanager
+def llm_priority(priority: LLMPriority) -> Iterator[None]:
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class LLMCapacityError(RateLimitError):
+    """No LLM slot became free within the queue timeout"""
+
+    def __init__(self, priority: LLMPriority, retry_after: int):
+        self.retry_after = retry_after
+        super().__init__(
+            f"LLM capacity exhausted for {priority.value} requests",
+            {"priority": priority.value, "retry_after": retry_after}
+        )
+
+
+class LLMGovernor:
+    """Bounds LLM calls in flight per process. Waiters are served by
+    priority, then arrival, and fail fast with LLMCapacityError when no
+    slot frees up within the queue timeout. Given a cache, calls also take
+    a Redis lease so the limit holds across processes; the lease is renewed
+    while held, so its TTL only bounds how long a dead holder keeps it."""
+
+    def __init__(
+            self,
+            max_in_flight: int = None,
+            queue_timeout: float = None,
+            cache: Optional[CacheManager] = None
+    ):
+        self.max_in_flight = max_in_flight or settings.AGENT_MAX_CONCURRENT_RUNS
+        self.queue_timeout = queue_timeout or settings.LLM_QUEUE_TIMEOUT_SECONDS
+        self.cache = cache
+        self.in_flight = 0
+        self._waiters: List[list] = []
+        self._sequence = itertools.count()
+        self._depth: Counter = Counter()
+
+    def _record_depth(self, priority: LLMPriority):
+        metrics.set_gauge("llm_queue_depth", self._depth[priority], priority=priority.value)
+
+    def _release_local(self):
+        # Hand the slot straight to the next live waiter
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+        self.in_flight -= 1
+
+    async def _acquire_local(self, priority: LLMPriority, deadline: float):
+        if self.in_flight < self.max_in_flight and not self._waiters:
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, [LLM_PRIORITY_ORDER[priority], next(self._sequence), waiter])
+        self._depth[priority] += 1
+        self._record_depth(priority)
+
+        try:
+            await asyncio.wait_for(waiter, max(deadline - time.monotonic(), 0))
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over as the wait ended
+                self._release_local()
+            if isinstance(e, asyncio.TimeoutError):
+                raise self._capacity_error(priority)
+            raise
+        finally:
+            self._depth[priority] -= 1
+            self._record_depth(priority)
+
+    async def _acquire_lease(self, priority: LLMPriority, deadline: float) -> str:
+        while True:
+            lease_id = await self.cache.acquire_lease(
+                LEASE_KEY, settings.LLM_GLOBAL_MAX_CONCURRENT_RUNS, settings.LLM_LEASE_TTL_SECONDS
+            )
+            if lease_id:
+                return lease_id
+
+            if time.monotonic() >= deadline:
+                raise self._capacity_error(priority)
+
+            # Jitter keeps processes from polling in lockstep
+            await asyncio.sleep(settings.LLM_LEASE_POLL_INTERVAL * (1 + random.random()))
+
+    async def _renew_lease(self, lease_id: str):
+        while True:
+            await asyncio.sleep(settings.LLM_LEASE_TTL_SECONDS / 3)
+            await self.cache.renew_lease(LEASE_KEY, lease_id, settings.LLM_LEASE_TTL_SECONDS)
+
+    def _capacity_error(self, priority: LLMPriority) -> LLMCapacityError:
+        metrics.increment("llm_queue_timeouts", priority=priority.value)
+        logger.warning(f"No LLM slot for {priority.value} request within {self.queue_timeout}s")
+        return LLMCapacityError(priority, settings.LLM_RETRY_AFTER_SECONDS)
+
+    @asynccontextmanager
+    async def slot(self, priority: Optional[LLMPriority] = None) -> AsyncIterator[None]:
+        priority = priority or _current_priority.get()
+        start = time.monotonic()
+        deadline = start + self.queue_timeout
+
+        await self._acquire_local(priority, deadline)
+
+        lease_id = None
+        try:
+            if self.cache is not None:
+                lease_id = await self._acquire_lease(priority, deadline)
+        except BaseException:
+            self._release_local()
+            raise
+
+        metrics.observe("agent_run_wait_ms", int((time.monotonic() - start) * 1000), priority=priority.value)
+        metrics.set_gauge("agent_runs_in_flight", self.in_flight)
+
+        renewal = asyncio.create_task(self._renew_lease(lease_id)) if lease_id else None
+
+        try:
+            yield
+        finally:
+            if renewal:
+                renewal.cancel()
+                await self.cache.release_lease(LEASE_KEY, lease_id)
+            self._release_local()
+            metrics.set_gauge("agent_runs_in_flight", self.in_flight)
+
+
+class GovernedLlm(BaseLlm):
+    """Wraps a model so each call holds a governor slot only while the
+    model generates. Tool calls and the workflows behind them run between
+    model calls, outside the slot."""
+
+    llm: BaseLlm
+    governor: Any
+
+    @classmethod
+    def wrap(cls, model: Union[str, BaseLlm], governor: LLMGovernor) -> "GovernedLlm":
+        llm = LLMRegistry.new_llm(model) if isinstance(model, str) else model
+        return cls(model=llm.model, llm=llm, governor=governor)
+
+    @property
+    def capabilities(self) -> LlmCapabilities:
+        return self.llm.capabilities
+
+    async def generate_content_async(
+            self,
+            llm_request: LlmRequest,
+            stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        # ADK runs the tool calls of a complete response before asking for
+        # the next one, so complete responses are held back until the slot
+        # is released. Partial (streamed) text goes out as it arrives.
+        complete: List[LlmResponse] = []
+
+        async with self.governor.slot():
+            async with aclosing(self.llm.generate_content_async(llm_request, stream)) as responses:
+                async for response in responses:
+                    if response.partial:
+                        yield response
+                    else:
+                        complete.append(response)
+
+        for response in complete:
+            yield response
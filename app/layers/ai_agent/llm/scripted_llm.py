@@ -0,0 +1,181 @@
+import asyncio
+import json
+import math
+import random
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+from pydantic import PrivateAttr
+
+from app.layers.ai_agent.parsers.intent_parser import IntentParser
+from app.layers.ai_agent.parsers.query_parser import QueryParser
+from app.layers.mcp.tools.projections import estimate_tokens
+from app.shared.config.constants.app_constants import INTENT_TOOLS
+
+BATCH_TOOL_NAME = "get_containers_info"
+
+LATENCY_DISTRIBUTIONS = ["fixed", "uniform", "normal", "lognormal"]
+
+
+class ScriptedLlm(BaseLlm):
+    """Deterministic local stand-in for the Gemini backend. Tool calls come
+    from the same rules as the fast path, replies are rendered from the tool
+    responses, and latency is sampled from a distribution around latency_ms
+    plus a per prompt token cost so prompt size shows up in timings."""
+
+    model: str = "scripted"
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    latency_distribution: str = "fixed"
+    latency_per_token_ms: float = 0.0
+    seed: Optional[int] = None
+
+    _rng: random.Random = PrivateAttr()
+
+    def model_post_init(self, context: Any) -> None:
+        if self.latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution '{self.latency_distribution}'. "
+                f"Available: {', '.join(LATENCY_DISTRIBUTIONS)}"
+            )
+
+        self._rng = random.Random(self.seed)
+
+    @classmethod
+    def supported_models(cls) -> list[str]:
+        return [r"scripted.*"]
+
+    def sample_latency_ms(self, prompt_tokens: int) -> float:
+        base, jitter = self.latency_ms, self.latency_jitter_ms
+
+        if self.latency_distribution == "uniform":
+            sampled = self._rng.uniform(base - jitter, base + jitter)
+        elif self.latency_distribution == "normal":
+            sampled = self._rng.gauss(base, jitter)
+        elif self.latency_distribution == "lognormal" and base > 0:
+            # Median latency_ms with a long right tail, like hosted models
+            sampled = self._rng.lognormvariate(math.log(base), jitter / base)
+        else:
+            sampled = base
+
+        return max(sampled, 0.0) + prompt_tokens * self.latency_per_token_ms
+
+    @staticmethod
+    def _text(content: types.Content) -> str:
+        return "".join(part.text for part in content.parts or [] if part.text)
+
+    def _prompt_tokens(self, llm_request: LlmRequest) -> int:
+        system_instruction = llm_request.config.system_instruction if llm_request.config else None
+        tokens = estimate_tokens(system_instruction or "")
+        for content in llm_request.contents:
+            for part in content.parts or []:
+                tokens += estimate_tokens(part.model_dump(exclude_none=True))
+
+        return tokens
+
+    def _call_tool(self, llm_request: LlmRequest) -> types.Part:
+        query = next(
+            (self._text(content) for content in reversed(llm_request.contents) if content.role == "user"),
+            ""
+        )
+        parsed = QueryParser().parse(query)
+        candidates = parsed["container_candidates"]
+
+        if not candidates:
+            return types.Part(text="Please provide a container number (4 letters followed by 7 digits).")
+
+        args: Dict[str, Any] = {"force_refresh": parsed["force_refresh"]}
+        if len(candidates) > 1 and BATCH_TOOL_NAME in llm_request.tools_dict:
+            name = BATCH_TOOL_NAME
+            args["container_ids"] = candidates
+        else:
+            name = INTENT_TOOLS[IntentParser().classify_intent(parsed)]
+            args["container_id"] = candidates[0]
+
+        return types.Part(function_call=types.FunctionCall(name=name, args=args))
+
+    def _reply(self, llm_request: LlmRequest, responses: List[types.FunctionResponse]) -> types.Part:
+        call_args = {
+            part.function_call.id: part.function_call.args or {}
+            for content in llm_request.contents
+            for part in content.parts or []
+            if part.function_call
+        }
+
+        sentences = []
+        for response in responses:
+            result = response.response or {}
+            containers = result.get("containers") or {
+                call_args.get(response.id, {}).get("container_id", "The container"): result
+            }
+
+            for container_id, fields in containers.items():
+                if not fields.get("found", True):
+                    sentences.append(f"{container_id} was not found.")
+                    continue
+
+                details = ", ".join(f"{key} {value}" for key, value in fields.items() if key != "found")
+                sentences.append(f"{container_id}: {details}.")
+
+        return types.Part(text=" ".join(sentences))
+
+    def _parse(self, llm_request: LlmRequest) -> types.Part:
+        # Parser agent: no tools, answer with ContainerParseSchema JSON
+        text = self._text(llm_request.contents[-1]) if llm_request.contents else ""
+        parsed = QueryParser().parse(text)
+        intent = IntentParser().classify_intent(parsed)
+        container_id = parsed["container_id"] or None
+
+        data = {
+            "container_id": container_id,
+            "intent": intent.value,
+            "confidence": 0.9 if container_id else 0.3,
+            "message": f"Parsed {intent.value} request for {container_id or 'unknown container'}.",
+            "has_errors": container_id is None,
+            "error_message": None if container_id else "No container number found",
+        }
+
+        # Hosted models usually wrap JSON in a fenced block
+        return types.Part(text=f"```json\n{json.dumps(data, indent=2)}\n```")
+
+    async def generate_content_async(
+            self,
+            llm_request: LlmRequest,
+            stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        prompt_tokens = self._prompt_tokens(llm_request)
+        await asyncio.sleep(self.sample_latency_ms(prompt_tokens) / 1000)
+
+        last = llm_request.contents[-1] if llm_request.contents else None
+        responses = [part.function_response for part in (last.parts if last else []) or [] if part.function_response]
+
+        if responses:
+            part = self._reply(llm_request, responses)
+        elif llm_request.tools_dict:
+            part = self._call_tool(llm_request)
+        else:
+            part = self._parse(llm_request)
+
+        output_tokens = estimate_tokens(part.model_dump(exclude_none=True))
+
+        if stream and part.text:
+            # Stream the reply a few words at a time, then the full response
+            words = part.text.split(" ")
+            for i in range(0, len(words), 3):
+                await asyncio.sleep(self.latency_per_token_ms * 3 / 1000)
+                yield LlmResponse(
+                    content=types.Content(role="model", parts=[types.Part(text=(" " if i else "") + " ".join(words[i:i + 3]))]),
+                    partial=True,
+                )
+
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[part]),
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=prompt_tokens,
+                candidates_token_count=output_tokens,
+                total_token_count=prompt_tokens + output_tokens,
+            ),
+        )
@@ -17,3 +17,23 @@ class IntentParser:
             return QueryIntent.GET_LAST_FREE_DAY
 
         return QueryIntent.GET_INFO
+
+    def score_confidence(self, parsed_query: dict, max_words: int, max_containers: int = 1) -> float:
+        """Confidence that the rule-based parse captures the whole query.
+        Anything the rules cannot settle (no or too many containers, mixed
+        intents, long free-form text) scores low and goes to the LLM."""
+        if not 1 <= len(parsed_query.get("container_candidates", [])) <= max_containers:
+            return 0.0
+
+        intent_matches = parsed_query.get("intent_matches", 0)
+        if intent_matches > 1 or parsed_query.get("unverified_candidates"):
+            return 0.4
+
+        # Without an intent keyword the question could be anything ("can my
+        # driver go today?"), so only a keyword match clears the fast path
+        confidence = 1.0 if intent_matches == 1 else 0.6
+
+        if parsed_query.get("word_count", 0) > max_words:
+            confidence -= 0.5
+
+        return max(confidence, 0.0)
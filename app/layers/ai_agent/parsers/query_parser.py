@@ -1,6 +1,23 @@
 from typing import Dict, Any
 import re
 
+from app.shared.utils.helpers import normalize_container_id, validate_container_check_digit
+
+# Loose container number match: 4 letters + 7 digits, allowing spaces or
+# dashes between digit groups (ABCD 123 4567, ABCD-1234567)
+CONTAINER_CANDIDATE_PATTERN = re.compile(r"\b[A-Za-z]{4}(?:[\s-]?\d){7}\b")
+
+# Keywords hinting at each intent, matched on word boundaries
+INTENT_KEYWORDS = {
+    "holds": ["hold", "holds", "restriction", "restrictions", "blocking", "blocked", "customs"],
+    "lfd": ["lfd", "last free day", "free day", "free time", "demurrage"],
+    "location": ["where", "location", "located", "yard", "slot"],
+    "available": ["available", "availability", "pickup", "pick up", "ready"],
+    "info": ["info", "information", "details", "status"],
+}
+
+REFRESH_KEYWORDS = ["refresh", "live", "latest", "right now", "up to date"]
+
 
 class QueryParser:
 
@@ -22,3 +39,38 @@ class QueryParser:
                 found_keywords.append(keyword)
 
         return found_keywords
+
+    def parse(self, query: str) -> Dict[str, Any]:
+        # normalize() drops apostrophes, so expand "where's" before it does
+        normalized = self.normalize(re.sub(r"['’]s\b", " is", query))
+        query_lower = normalized.lower()
+
+        # Only numbers passing the ISO 6346 check count as containers; a
+        # word plus seven digits ("info 1234567") does not
+        candidates = []
+        unverified = []
+        for match in CONTAINER_CANDIDATE_PATTERN.findall(normalized):
+            candidate = normalize_container_id(re.sub(r"[\s-]", "", match))
+            target = candidates if validate_container_check_digit(candidate) else unverified
+            if candidate not in target:
+                target.append(candidate)
+
+        intents = [
+            intent for intent, keywords in INTENT_KEYWORDS.items()
+            if any(re.search(rf"\b{keyword}\b", query_lower) for keyword in keywords)
+        ]
+
+        # "info"/"status" words are generic; a more specific intent wins
+        specific = [intent for intent in intents if intent != "info"]
+        if specific:
+            intents = specific
+
+        return {
+            "container_id": candidates[0] if candidates else "",
+            "container_candidates": candidates,
+            "unverified_candidates": unverified,
+            "intent": intents[0] if intents else "",
+            "intent_matches": len(intents),
+            "word_count": len(normalized.split()),
+            "force_refresh": any(re.search(rf"\b{keyword}\b", query_lower) for keyword in REFRESH_KEYWORDS),
+        }
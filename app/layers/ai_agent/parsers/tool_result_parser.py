@@ -0,0 +1,112 @@
+from typing import Dict, Any, List, Optional, Tuple
+
+from app.layers.ai_agent.schemas.output_schema import (
+    ContainerDetailsSchema,
+    ContainerParseSchema,
+    ContainerResultSchema,
+    ToolCallInfo,
+)
+from app.shared.config.constants.app_constants import INTENT_TOOLS, QueryIntent
+from app.shared.utils.helpers import normalize_container_id
+
+BATCH_TOOL_NAME = "get_containers_info"
+
+TOOL_INTENTS = {tool_name: intent.value for intent, tool_name in INTENT_TOOLS.items()}
+TOOL_INTENTS[BATCH_TOOL_NAME] = QueryIntent.GET_INFO.value
+
+
+class ToolResultParser:
+    """Maps ContainerTools results straight into the output schemas."""
+
+    def to_container_details(self, data: Optional[Dict[str, Any]]) -> Optional[ContainerDetailsSchema]:
+        if not data or not data.get("container_number"):
+            return None
+
+        fields = {
+            name: value for name, value in data.items()
+            if name in ContainerDetailsSchema.model_fields and value is not None
+        }
+
+        # Only full info and availability results carry the flag
+        if "available" not in fields:
+            fields["available"] = data.get("status") == "Available"
+
+        return ContainerDetailsSchema(**fields)
+
+    def to_container_result(self, container_id: Optional[str], tool_result: Dict[str, Any]) -> ContainerResultSchema:
+        succeeded = tool_result.get("status") == "success"
+        cache = tool_result.get("cache") or {}
+
+        container_data = self.to_container_details(tool_result.get("data")) if succeeded else None
+
+        return ContainerResultSchema(
+            container_id=container_id,
+            container_data=container_data,
+            served_from_cache=bool(cache.get("hit")),
+            data_age_seconds=cache.get("age_seconds"),
+            has_errors=container_data is None,
+            error_message=None if container_data else (
+                tool_result.get("error") or f"Could not find container {container_id}. Please verify the number."
+            ),
+        )
+
+    @staticmethod
+    def _container_results(call: Dict[str, Any]) -> List[Tuple[Optional[str], Dict[str, Any]]]:
+        response = call["response"]
+
+        if "results" in response:
+            return [
+                (normalize_container_id(result.get("container_id", "")), result)
+                for result in response["results"]
+            ]
+
+        return [(normalize_container_id(call["args"].get("container_id", "")), response)]
+
+    def from_tool_calls(
+            self,
+            tool_calls: List[Dict[str, Any]],
+            confidence: Optional[float] = None
+    ) -> ContainerParseSchema:
+        """Builds the schema from the tool calls the agent made. Each call is
+        {"name", "args", "response"}. Every container gets one entry in
+        containers, taken from its last successful call; the first container
+        also fills the top-level fields."""
+        if not tool_calls:
+            return ContainerParseSchema(confidence=confidence)
+
+        results: Dict[Optional[str], ContainerResultSchema] = {}
+        for call in tool_calls:
+            for container_id, tool_result in self._container_results(call):
+                result = self.to_container_result(container_id, tool_result)
+                if container_id not in results or not result.has_errors:
+                    results[container_id] = result
+
+        containers = list(results.values())
+        primary = containers[0]
+
+        intent_call = next(
+            (call for call in reversed(tool_calls) if call["response"].get("status") == "success"),
+            tool_calls[-1]
+        )
+
+        errors = [result.error_message for result in containers if result.has_errors]
+
+        return ContainerParseSchema(
+            container_id=primary.container_id,
+            intent=TOOL_INTENTS.get(intent_call["name"]),
+            confidence=confidence,
+            container_data=primary.container_data,
+            containers=containers,
+            tools_used=[
+                ToolCallInfo(
+                    tool_name=call["name"],
+                    parameters=call["args"],
+                    success=call["response"].get("status") == "success"
+                )
+                for call in tool_calls
+            ],
+            served_from_cache=primary.served_from_cache,
+            data_age_seconds=primary.data_age_seconds,
+            has_errors=bool(errors),
+            error_message="; ".join(errors) if errors else None,
+        )
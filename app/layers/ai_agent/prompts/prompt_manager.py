@@ -0,0 +1,40 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from app.layers.ai_agent.prompts.system_prompts import (
+    SYSTEM_INSTRUCTION,
+    PARSER_INSTRUCTION,
+    SYSTEM_INSTRUCTION_COMPACT,
+    PARSER_INSTRUCTION_COMPACT,
+)
+from app.shared.config.settings.base import get_settings
+
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class PromptSet:
+    variant: str
+    tool_instruction: str
+    parser_instruction: str
+
+    @property
+    def version(self) -> str:
+        digest = hashlib.sha256(f"{self.tool_instruction}\n{self.parser_instruction}".encode()).hexdigest()
+        return f"{self.variant}-{digest[:12]}"
+
+
+PROMPT_VARIANTS: Dict[str, PromptSet] = {
+    "full": PromptSet("full", SYSTEM_INSTRUCTION, PARSER_INSTRUCTION),
+    "compact": PromptSet("compact", SYSTEM_INSTRUCTION_COMPACT, PARSER_INSTRUCTION_COMPACT),
+}
+
+
+def get_prompt_set(variant: Optional[str] = None) -> PromptSet:
+    variant = variant or settings.PROMPT_VARIANT
+
+    if variant not in PROMPT_VARIANTS:
+        raise ValueError(f"Unknown prompt variant '{variant}'. Available: {', '.join(PROMPT_VARIANTS)}")
+
+    return PROMPT_VARIANTS[variant]
@@ -35,6 +35,15 @@ class ToolCallInfo(BaseModel):
     success: bool = Field(description="Whether the tool call was successful")
 
 
+class ContainerResultSchema(BaseModel):
+    container_id: Optional[str] = Field(None, description="Container number")
+    container_data: Optional[ContainerDetailsSchema] = Field(None, description="Structured container information")
+    served_from_cache: bool = Field(False, description="Whether data was served from the scrape cache")
+    data_age_seconds: Optional[int] = Field(None, description="Age of cached data in seconds")
+    has_errors: bool = Field(False, description="Whether retrieving this container failed")
+    error_message: Optional[str] = Field(None, description="Error message if applicable")
+
+
 class ContainerParseSchema(BaseModel):
     container_id: Optional[str] = Field(
         None,
@@ -63,6 +72,11 @@ class ContainerParseSchema(BaseModel):
         description="Structured container information"
     )
 
+    containers: List[ContainerResultSchema] = Field(
+        default_factory=list,
+        description="Results for every container in the query; container_id and container_data mirror the first",
+    )
+
     tools_used: List[ToolCallInfo] = Field(
         default_factory=list,
         description="List of tool calls",
@@ -78,6 +92,16 @@ class ContainerParseSchema(BaseModel):
         description="Source of data"
     )
 
+    served_from_cache: bool = Field(
+        False,
+        description="Whether container data was served from the scrape cache"
+    )
+
+    data_age_seconds: Optional[int] = Field(
+        None,
+        description="Age of cached container data in seconds"
+    )
+
     has_errors: bool = Field(
         False,
         description="Whether an error occurred"
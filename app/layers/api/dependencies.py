@@ -1,14 +1,21 @@
 """API dependencies"""
+import time
 from typing import AsyncGenerator
-from fastapi import Depends, HTTPException, Header
+from fastapi import Depends, HTTPException, Header, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.shared.database.session import get_db
 from app.shared.database.repositories.repository_factory import RepositoryFactory
 from app.shared.config.settings.base import get_settings
 from app.shared.exceptions.api_exceptions import UnauthorizedError
 from app.layers.ai_agent.agent.agent_orchestrator import AgentOrchestrator
+from app.layers.api.services.container_service import ContainerService
+from app.layers.api.services.job_service import JobService
+from app.shared.utils.logger import get_logger
+from app.shared.utils.metrics import get_metrics
 
 settings = get_settings()
+logger = get_logger(__name__)
+metrics = get_metrics()
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -24,5 +31,51 @@ def get_repository_factory(
 
 
 
-def get_agent_orchestrator() -> AgentOrchestrator:
-    return AgentOrchestrator()
+def build_agent_orchestrator() -> AgentOrchestrator:
+    start_time = time.time()
+    orchestrator = AgentOrchestrator()
+
+    metrics.increment("agent_stack_builds")
+    metrics.observe("agent_stack_build_ms", int((time.time() - start_time) * 1000))
+
+    return orchestrator
+
+
+def get_agent_orchestrator(request: Request) -> AgentOrchestrator:
+    """Returns the orchestrator built once in the app lifespan. Outside the
+    lifespan (scripts, tests) it is built on first use and kept."""
+    start_time = time.time()
+
+    orchestrator = getattr(request.app.state, "agent_orchestrator", None)
+    if orchestrator is None:
+        logger.warning("Agent orchestrator not initialised at startup, building it now")
+        orchestrator = build_agent_orchestrator()
+        request.app.state.agent_orchestrator = orchestrator
+
+    metrics.observe("agent_dependency_resolve_ms", int((time.time() - start_time) * 1000))
+
+    return orchestrator
+
+
+def get_job_service(request: Request) -> JobService:
+    """Returns the job service built in the app lifespan, or builds it on
+    first use outside the lifespan."""
+    job_service = getattr(request.app.state, "job_service", None)
+    if job_service is None:
+        logger.warning("Job service not initialised at startup, building it now")
+        job_service = JobService()
+        request.app.state.job_service = job_service
+
+    return job_service
+
+
+def get_container_service(request: Request) -> ContainerService:
+    """Returns the container service built in the app lifespan, or builds it
+    on first use outside the lifespan."""
+    container_service = getattr(request.app.state, "container_service", None)
+    if container_service is None:
+        logger.warning("Container service not initialised at startup, building it now")
+        container_service = ContainerService()
+        request.app.state.container_service = container_service
+
+    return container_service
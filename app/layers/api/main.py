@@ -1,28 +1,96 @@
+import asyncio
+import time
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
+from app.layers.api.dependencies import build_agent_orchestrator
+from app.layers.api.services.container_service import ContainerService
+from app.layers.api.services.job_service import JobService
 from app.layers.api.middleware.error_handler import GlobalExceptionMiddleware
 from app.shared.config.settings.base import get_settings
 from app.shared.database.session import init_db, close_db
 from app.shared.utils.logger import get_logger
-from app.layers.api.routes.v1 import query, health
+from app.layers.api.routes.v1 import query, health, jobs, containers
 from app.layers.api.middleware.logging import LoggingMiddleware
 from app.layers.api.middleware.rate_limit import RateLimitMiddleware
+from app.layers.mcp.clients.workflow_client import connect_temporal_client
+from app.layers.scraper.temporal.config import WORKER_PROFILES
+from app.layers.scraper.temporal.worker import build_worker
+from app.shared.utils.metrics import get_metrics
 
 settings = get_settings()
 logger = get_logger(__name__)
 
 
+def _on_embedded_worker_exit(task: asyncio.Task):
+    # The worker only stops on its own when it fails; the API keeps serving,
+    # but eager starts lose their local worker, so this must be visible.
+    if not task.cancelled() and task.exception():
+        logger.error(f"Embedded workflow worker crashed: {task.exception()}")
+        get_metrics().increment("embedded_worker_crashed")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("🚀 Starting PNCT Container Query System (Layer 2: API)")
 
-    await init_db()
+    start_time = time.time()
 
-    yield
+    await init_db()
 
-    await close_db()
+    embedded_worker = None
+    embedded_worker_task = None
+    started = []  # services to shut down, in start order
+
+    try:
+        temporal_client = None
+        try:
+            temporal_client = await connect_temporal_client()
+        except Exception as e:
+            logger.warning(f"Temporal unavailable at startup, connecting on first use: {e}")
+
+        # A workflow worker sharing this process's client lets eagerly started
+        # workflows run their first task here without a task queue round trip.
+        if settings.API_EMBEDDED_WORKFLOW_WORKER and temporal_client:
+            embedded_worker = build_worker(temporal_client, WORKER_PROFILES["workflow"], None)
+            embedded_worker_task = asyncio.create_task(embedded_worker.run())
+            embedded_worker_task.add_done_callback(_on_embedded_worker_exit)
+            logger.info("Embedded workflow worker started")
+        elif settings.TEMPORAL_EAGER_WORKFLOW_START:
+            logger.info("Eager workflow start has no local worker; set API_EMBEDDED_WORKFLOW_WORKER to use it")
+
+        # Gemini agents, tool registry, workflow client and Redis connection are
+        # built once and shared by every request.
+        app.state.agent_orchestrator = build_agent_orchestrator()
+        await app.state.agent_orchestrator.startup()
+        started.append(app.state.agent_orchestrator)
+
+        app.state.job_service = JobService()
+        await app.state.job_service.startup()
+        started.append(app.state.job_service)
+
+        app.state.container_service = ContainerService()
+        await app.state.container_service.startup()
+        started.append(app.state.container_service)
+
+        get_metrics().observe("api_startup_ms", int((time.time() - start_time) * 1000))
+
+        yield
+
+    finally:
+        for service in reversed(started):
+            try:
+                await service.shutdown()
+            except Exception as e:
+                logger.error(f"{type(service).__name__} shutdown failed: {e}")
+
+        if embedded_worker:
+            if not embedded_worker_task.done():
+                await embedded_worker.shutdown()
+            await asyncio.gather(embedded_worker_task, return_exceptions=True)
+
+        await close_db()
     logger.info("👋 Shutting down PNCT Container Query System")
 
 
@@ -54,6 +122,8 @@ app.add_middleware(GlobalExceptionMiddleware)
 
 app.include_router(health.router, prefix=settings.API_PREFIX, tags=["Health"])
 app.include_router(query.router, prefix=settings.API_PREFIX, tags=["Query"])
+app.include_router(jobs.router, prefix=settings.API_PREFIX, tags=["Jobs"])
+app.include_router(containers.router, prefix=settings.API_PREFIX, tags=["Containers"])
 
 
 @app.get("/")
@@ -0,0 +1,129 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.layers.api.dependencies import get_container_service, get_db_session
+from app.layers.api.schemas.response import ContainerResponse
+from app.layers.api.services.container_service import CONTAINER_OPERATIONS, ContainerService, ContainerNotFoundError
+from app.shared.exceptions.api_exceptions import InvalidRequestError
+from app.shared.utils.logger import get_logger
+from app.shared.utils.metrics import get_metrics
+
+router = APIRouter()
+logger = get_logger(__name__)
+metrics = get_metrics()
+
+# Sub-resource -> scraper operation
+CONTAINER_VIEWS = {
+    "holds": "check_holds",
+    "location": "get_location",
+    "lfd": "get_lfd",
+    "availability": "check_availability",
+}
+
+
+def _split_fields(fields: Optional[str]) -> Optional[List[str]]:
+    if not fields:
+        return None
+
+    return [field.strip() for field in fields.split(",") if field.strip()]
+
+
+def _not_modified(request: Request, etag: str, last_modified: datetime) -> bool:
+    # If-None-Match takes precedence over If-Modified-Since (RFC 9110 13.1.3)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since:
+        return False
+
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+
+    return last_modified <= since
+
+
+async def _serve(
+        request: Request,
+        response: Response,
+        db: AsyncSession,
+        container_service: ContainerService,
+        container_id: str,
+        operation: str,
+        fields: Optional[str],
+        force_refresh: bool
+):
+    try:
+        lookup = await container_service.get(db, container_id, operation, force_refresh)
+        data = lookup.project(_split_fields(fields))
+    except InvalidRequestError as e:
+        raise HTTPException(status_code=400, detail={"error": "Invalid request", "message": str(e)})
+    except ContainerNotFoundError:
+        raise HTTPException(status_code=404, detail={"error": "Container data unavailable", "container_id": container_id})
+
+    etag = lookup.etag(data)
+    headers: Dict[str, str] = {
+        "ETag": etag,
+        "Last-Modified": format_datetime(lookup.last_modified, usegmt=True),
+        "Cache-Control": f"max-age={max(0, lookup.max_age - lookup.age_seconds)}",
+    }
+
+    if _not_modified(request, etag, lookup.last_modified):
+        metrics.increment("container_not_modified", operation=operation)
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+
+    return ContainerResponse(
+        data=data,
+        cached=lookup.cached,
+        last_updated=lookup.last_modified.isoformat(),
+        metadata={
+            "container_id": lookup.container_id,
+            "operation": operation,
+            "source": lookup.source,
+            "data_age_seconds": lookup.age_seconds,
+            "workflow_id": lookup.workflow_id,
+        }
+    )
+
+
+@router.get("/containers/{container_id}", response_model=ContainerResponse)
+async def get_container(
+        container_id: str,
+        request: Request,
+        response: Response,
+        operation: str = Query("get_full_info", description=f"One of {', '.join(CONTAINER_OPERATIONS)}"),
+        fields: Optional[str] = Query(None, description="Comma separated fields to return"),
+        force_refresh: bool = Query(False),
+        db: AsyncSession = Depends(get_db_session),
+        container_service: ContainerService = Depends(get_container_service),
+):
+    return await _serve(request, response, db, container_service, container_id, operation, fields, force_refresh)
+
+
+@router.get("/containers/{container_id}/{view}", response_model=ContainerResponse)
+async def get_container_view(
+        container_id: str,
+        view: Literal["holds", "location", "lfd", "availability"],
+        request: Request,
+        response: Response,
+        fields: Optional[str] = Query(None, description="Comma separated fields to return"),
+        force_refresh: bool = Query(False),
+        db: AsyncSession = Depends(get_db_session),
+        container_service: ContainerService = Depends(get_container_service),
+):
+    return await _serve(
+        request, response, db, container_service, container_id, CONTAINER_VIEWS[view], fields, force_refresh
+    )
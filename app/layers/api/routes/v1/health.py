@@ -7,6 +7,7 @@ from app.shared.database.session import get_db
 from app.shared.schemas.response_schema import HealthResponse
 from app.shared.utils.logger import get_logger
 from app.shared.utils.cache import CacheManager
+from app.shared.utils.metrics import get_metrics
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -37,3 +38,7 @@ async def health_check(db: AsyncSession = Depends(get_db)):
         services=services
     )
 
+
+@router.get("/metrics")
+async def metrics_snapshot():
+    return get_metrics().snapshot()
@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.layers.api.dependencies import get_job_service
+from app.layers.api.schemas.request import JobRequest
+from app.layers.api.schemas.response import JobResponse
+from app.layers.api.services.job_service import JobService, JobNotFoundError, JobExpiredError
+from app.shared.exceptions.api_exceptions import InvalidRequestError
+from app.shared.utils.logger import get_logger
+
+router = APIRouter()
+logger = get_logger(__name__)
+
+
+@router.post("/jobs", response_model=JobResponse, status_code=202)
+async def submit_job(
+        request: JobRequest,
+        job_service: JobService = Depends(get_job_service),
+) -> JobResponse:
+    try:
+        return await job_service.submit(request)
+    except InvalidRequestError as e:
+        raise HTTPException(status_code=400, detail={"error": "Invalid request", "message": str(e)})
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job_status(
+        job_id: str,
+        job_service: JobService = Depends(get_job_service),
+) -> JobResponse:
+    try:
+        return await job_service.get_status(job_id)
+    except JobNotFoundError:
+        raise HTTPException(status_code=404, detail={"error": "Job not found", "job_id": job_id})
+
+
+@router.get("/jobs/{job_id}/result", response_model=JobResponse)
+async def get_job_result(
+        job_id: str,
+        wait: int = Query(0, ge=0, description="Seconds to long-poll for a running job"),
+        job_service: JobService = Depends(get_job_service),
+) -> JobResponse:
+    try:
+        return await job_service.get_result(job_id, wait)
+    except JobNotFoundError:
+        raise HTTPException(status_code=404, detail={"error": "Job not found", "job_id": job_id})
+    except JobExpiredError:
+        raise HTTPException(status_code=410, detail={"error": "Job result expired", "job_id": job_id})
@@ -35,6 +35,19 @@ async def process_query(
         db=db,
     )
 
+@router.post("/query/stream")
+async def stream_query(
+        request: QueryRequest,
+        agent: AgentOrchestrator = Depends(get_agent_orchestrator),
+        db: AsyncSession = Depends(get_db_session),
+) -> StreamingResponse:
+    return StreamingResponse(
+        query_service.stream_query(request=request, agent=agent, db=db),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/tools")
 async def list_tools(
         agent: AgentOrchestrator = Depends(get_agent_orchestrator),
@@ -1,8 +1,15 @@
+from typing import Literal
 from pydantic import BaseModel, Field
 
+from app.shared.config.constants.app_constants import LLMPriority
+
 
 class QueryRequest(BaseModel):
     query: str = Field(..., min_length=1, max_length=500, description="Natural language query")
+    priority: LLMPriority = Field(
+        default=LLMPriority.INTERACTIVE,
+        description="Queue priority for LLM capacity; bulk clients should send batch"
+    )
 
     class Config:
         json_schema_extra = {
@@ -21,3 +28,19 @@ class ContainerRequest(BaseModel):
                 "container_number": "MSDU1234567"
             }
         }
+
+
+class JobRequest(BaseModel):
+    container_number: str = Field(..., min_length=11, max_length=11)
+    operation: Literal[
+        "get_full_info", "check_availability", "get_location", "check_holds", "get_lfd"
+    ] = "get_full_info"
+    force_refresh: bool = False
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "container_number": "MSDU1234567",
+                "operation": "get_full_info"
+            }
+        }
@@ -31,4 +31,33 @@ class ContainerResponse(BaseModel):
     status: str = "success"
     data: Dict[str, Any]
     cached: bool = False
-    last_updated: Optional[str] = None
\ No newline at end of file
+    last_updated: Optional[str] = None
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "status": "success",
+                "data": {"holds": ["FREIGHT: PAID"], "customs_status": "Released"},
+                "cached": True,
+                "last_updated": "2025-01-15T14:02:11+00:00",
+                "metadata": {"container_id": "MSDU1234567", "operation": "check_holds", "source": "cache"}
+            }
+        }
+
+class JobResponse(BaseModel):
+    job_id: str
+    status: str
+    data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "job_id": "job-6f1c2b9e-8f0a-4c55-9a43-1b2f0e6d7c11",
+                "status": "completed",
+                "data": {"container_number": "MSDU1234567", "status": "Available"},
+                "metadata": {"operation": "get_full_info"}
+            }
+        }
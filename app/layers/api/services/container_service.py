@@ -0,0 +1,183 @@
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.layers.api.validators.container_validator import validate_container_number
+from app.layers.mcp.clients.workflow_client import WorkflowClient
+from app.layers.scraper.cache.scrape_cache import ScrapeResultCache, classify_container_state, max_age_for
+from app.layers.scraper.parsers.container_parser import ContainerParser
+from app.shared.config.constants.app_constants import INTENT_OPERATIONS
+from app.shared.exceptions.api_exceptions import InvalidRequestError
+from app.shared.utils.cache import CacheManager
+from app.shared.utils.logger import get_logger
+from app.shared.utils.metrics import get_metrics
+
+logger = get_logger(__name__)
+metrics = get_metrics()
+
+CONTAINER_OPERATIONS = list(INTENT_OPERATIONS.values())
+
+# Parser output that changes on every parse of the same page; left out of
+# the ETag so it only changes with the data
+VOLATILE_FIELDS = ("last_updated",)
+
+
+class ContainerNotFoundError(Exception):
+    pass
+
+
+@dataclass
+class ContainerLookup:
+    container_id: str
+    operation: str
+    data: Dict[str, Any]
+    source: str  # cache, store or workflow
+    scraped_at: float
+    max_age: int
+    cached: bool = True
+    workflow_id: Optional[str] = None
+
+    @property
+    def age_seconds(self) -> int:
+        return max(0, int(time.time() - self.scraped_at))
+
+    @property
+    def last_modified(self) -> datetime:
+        return datetime.fromtimestamp(int(self.scraped_at), tz=timezone.utc)
+
+    def project(self, fields: Optional[List[str]]) -> Dict[str, Any]:
+        if not fields:
+            return self.data
+
+        unknown = [field for field in fields if field not in self.data]
+        if unknown:
+            raise InvalidRequestError(
+                f"Unknown field(s) for {self.operation}: {', '.join(unknown)}. "
+                f"Available: {', '.join(self.data)}"
+            )
+
+        return {field: self.data[field] for field in fields}
+
+    def etag(self, data: Dict[str, Any]) -> str:
+        stable = {field: value for field, value in data.items() if field not in VOLATILE_FIELDS}
+        body = json.dumps([self.operation, stable], sort_keys=True, separators=(",", ":"), default=str)
+        return f'"{hashlib.sha256(body.encode()).hexdigest()[:32]}"'
+
+
+class ContainerService:
+    """Structured container data for callers that already know the container
+    and operation, without the agent. Lookups go parsed-result cache, then
+    the stored scrape (Redis or database), then a scrape workflow, and are
+    served while within the scrape freshness policy."""
+
+    def __init__(self, workflow_client: WorkflowClient = None, cache: CacheManager = None):
+        self.workflow_client = workflow_client or WorkflowClient()
+        self.cache = cache or CacheManager()
+        self.scrape_cache = ScrapeResultCache(self.cache)
+        self.parser = ContainerParser()
+
+    async def startup(self):
+        await self.cache.connect()
+
+    async def shutdown(self):
+        await self.cache.disconnect()
+
+    @staticmethod
+    def _key(container_id: str, operation: str) -> str:
+        return f"container:data:{container_id}:{operation}"
+
+    async def get(
+            self,
+            db: AsyncSession,
+            container_number: str,
+            operation: str = "get_full_info",
+            force_refresh: bool = False
+    ) -> ContainerLookup:
+        container_id = validate_container_number(container_number)
+
+        if operation not in CONTAINER_OPERATIONS:
+            raise InvalidRequestError(
+                f"Unknown operation: {operation}. Available: {', '.join(CONTAINER_OPERATIONS)}"
+            )
+
+        lookup = None
+        if not force_refresh:
+            lookup = await self._from_cache(container_id, operation) or await self._from_store(db, container_id, operation)
+
+        if lookup is None:
+            lookup = await self._from_workflow(container_id, operation, force_refresh)
+
+        if lookup.source != "cache":
+            await self.cache.set(
+                self._key(container_id, operation),
+                {"data": lookup.data, "scraped_at": lookup.scraped_at, "max_age": lookup.max_age},
+                ttl=max(1, lookup.max_age - lookup.age_seconds),
+            )
+
+        metrics.increment("container_lookup", operation=operation, source=lookup.source)
+        return lookup
+
+    async def _from_cache(self, container_id: str, operation: str) -> Optional[ContainerLookup]:
+        entry = await self.cache.get(self._key(container_id, operation))
+        if entry is None or time.time() - entry["scraped_at"] > entry["max_age"]:
+            return None
+
+        return ContainerLookup(
+            container_id=container_id,
+            operation=operation,
+            data=entry["data"],
+            source="cache",
+            scraped_at=entry["scraped_at"],
+            max_age=entry["max_age"],
+        )
+
+    async def _from_store(self, db: AsyncSession, container_id: str, operation: str) -> Optional[ContainerLookup]:
+        try:
+            cached = await self.scrape_cache.lookup(db, container_id, operation)
+            if cached is None:
+                return None
+
+            data = self.parser.parse(cached.html_content, operation)
+        except Exception as e:
+            # A broken store must never block a fresh scrape
+            logger.warning(f"Stored scrape lookup failed for {container_id}: {e}")
+            return None
+
+        return ContainerLookup(
+            container_id=container_id,
+            operation=operation,
+            data=data,
+            source="store",
+            scraped_at=cached.scraped_at,
+            max_age=max_age_for(operation, cached.state or classify_container_state(data, operation)),
+        )
+
+    async def _from_workflow(self, container_id: str, operation: str, force_refresh: bool) -> ContainerLookup:
+        result = await self.workflow_client.start_workflow(
+            workflow_name="container_scraper_workflow",
+            workflow_input={
+                "container_id": container_id,
+                "operation": operation,
+                "force_refresh": force_refresh
+            }
+        )
+
+        if result.status != "success" or not result.data:
+            raise ContainerNotFoundError(container_id)
+
+        # The workflow may itself have been served from the scrape cache
+        return ContainerLookup(
+            container_id=container_id,
+            operation=operation,
+            data=result.data,
+            source="workflow",
+            scraped_at=result.cache.get("scraped_at") or time.time(),
+            max_age=max_age_for(operation, classify_container_state(result.data, operation)),
+            cached=bool(result.cache.get("hit")),
+            workflow_id=result.workflow_id,
+        )
@@ -0,0 +1,181 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+import uuid
+
+from temporalio.client import WorkflowFailureError
+
+from app.layers.api.schemas.request import JobRequest
+from app.layers.api.schemas.response import JobResponse
+from app.layers.api.validators.container_validator import validate_container_number
+from app.layers.mcp.clients.workflow_client import WorkflowClient
+from app.shared.config.settings.base import get_settings
+from app.shared.utils.cache import CacheManager
+from app.shared.utils.logger import get_logger
+from app.shared.utils.metrics import get_metrics
+
+settings = get_settings()
+logger = get_logger(__name__)
+metrics = get_metrics()
+
+# Temporal execution status -> job status
+JOB_STATUSES = {
+    "RUNNING": "running",
+    "COMPLETED": "completed",
+    "FAILED": "failed",
+    "CANCELED": "cancelled",
+    "TERMINATED": "failed",
+    "TIMED_OUT": "failed",
+    "CONTINUED_AS_NEW": "running",
+}
+
+# Only workflows started through /jobs are jobs
+JOB_ID_PREFIX = "job-"
+
+
+class JobNotFoundError(Exception):
+    pass
+
+
+class JobExpiredError(Exception):
+    pass
+
+
+class JobService:
+    """Submits scrape workflows without waiting on them. The job ID is the
+    Temporal workflow ID, so status and results come straight from Temporal;
+    finished results are kept in Redis for JOB_RESULT_TTL seconds."""
+
+    def __init__(self, workflow_client: WorkflowClient = None, cache: CacheManager = None):
+        self.workflow_client = workflow_client or WorkflowClient()
+        self.cache = cache or CacheManager()
+
+    async def startup(self):
+        await self.cache.connect()
+
+    async def shutdown(self):
+        await self.cache.disconnect()
+
+    @staticmethod
+    def _result_key(job_id: str) -> str:
+        return f"job:result:{job_id}"
+
+    async def submit(self, request: JobRequest) -> JobResponse:
+        container_id = validate_container_number(request.container_number)
+
+        job_id = await self.workflow_client.submit_workflow(
+            workflow_name="container_scraper_workflow",
+            workflow_input={
+                "container_id": container_id,
+                "operation": request.operation,
+                "force_refresh": request.force_refresh
+            },
+            workflow_id=f"{JOB_ID_PREFIX}{uuid.uuid4()}"
+        )
+        metrics.increment("jobs_submitted", operation=request.operation)
+
+        return JobResponse(
+            job_id=job_id,
+            status="running",
+            metadata={"container_id": container_id, "operation": request.operation}
+        )
+
+    @staticmethod
+    def _check_job_id(job_id: str):
+        if not job_id.startswith(JOB_ID_PREFIX):
+            raise JobNotFoundError(job_id)
+
+    async def _describe(self, job_id: str) -> Dict[str, Any]:
+        status = await self.workflow_client.get_workflow_status(job_id)
+        if status["status"] == "unknown":
+            raise JobNotFoundError(job_id)
+
+        return status
+
+    async def get_status(self, job_id: str) -> JobResponse:
+        self._check_job_id(job_id)
+
+        cached = await self.cache.get(self._result_key(job_id))
+        if cached:
+            return JobResponse(job_id=job_id, status=cached["status"], metadata={"cached": True})
+
+        status = await self._describe(job_id)
+        job_status = JOB_STATUSES.get(status["status"], status["status"].lower())
+
+        # The workflow reports scrape failures in its result, not by failing
+        if status["status"] == "COMPLETED":
+            response = await self._fetch_result(job_id)
+            job_status = response.status
+
+            remaining_ttl = self._remaining_ttl(status.get("close_time"))
+            if remaining_ttl > 0:
+                await self._retain(response, remaining_ttl)
+
+        return JobResponse(
+            job_id=job_id,
+            status=job_status,
+            metadata={
+                "started_at": status["start_time"].isoformat() if status.get("start_time") else None,
+                "finished_at": status["close_time"].isoformat() if status.get("close_time") else None,
+            }
+        )
+
+    async def get_result(self, job_id: str, wait: int = 0) -> JobResponse:
+        self._check_job_id(job_id)
+
+        cached = await self.cache.get(self._result_key(job_id))
+        if cached:
+            metrics.increment("job_result_fetch", source="cache")
+            return JobResponse(**cached)
+
+        status = await self._describe(job_id)
+
+        if status["status"] == "RUNNING":
+            wait = min(wait, settings.JOB_RESULT_MAX_WAIT_SECONDS)
+            if wait <= 0:
+                return JobResponse(job_id=job_id, status="running")
+
+            # Cancelling the wait on timeout only drops the long-poll; the
+            # workflow keeps running.
+            try:
+                response = await asyncio.wait_for(self._fetch_result(job_id), timeout=wait)
+            except asyncio.TimeoutError:
+                metrics.increment("job_result_fetch", source="long_poll_timeout")
+                return JobResponse(job_id=job_id, status="running")
+
+            metrics.increment("job_result_fetch", source="long_poll")
+            return await self._retain(response, settings.JOB_RESULT_TTL)
+
+        remaining_ttl = self._remaining_ttl(status.get("close_time"))
+        if remaining_ttl <= 0:
+            raise JobExpiredError(job_id)
+
+        metrics.increment("job_result_fetch", source="temporal")
+        return await self._retain(await self._fetch_result(job_id), remaining_ttl)
+
+    async def _fetch_result(self, job_id: str) -> JobResponse:
+        try:
+            result = await self.workflow_client.wait_for_result(job_id)
+        except WorkflowFailureError as e:
+            logger.warning(f"Job {job_id} did not complete: {e.cause or e}")
+            return JobResponse(job_id=job_id, status="failed", error=str(e.cause or e))
+
+        return JobResponse(
+            job_id=job_id,
+            status="completed" if result.status == "success" else result.status,
+            data=result.data,
+            error=result.error,
+            metadata={"cache": result.cache, "timings": result.timings}
+        )
+
+    async def _retain(self, response: JobResponse, ttl: int) -> JobResponse:
+        await self.cache.set(self._result_key(response.job_id), response.model_dump(), ttl=ttl)
+        return response
+
+    @staticmethod
+    def _remaining_ttl(close_time: Optional[datetime]) -> int:
+        if not close_time:
+            return settings.JOB_RESULT_TTL
+
+        age = (datetime.now(timezone.utc) - close_time).total_seconds()
+        return int(settings.JOB_RESULT_TTL - age)
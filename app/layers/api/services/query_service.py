@@ -3,22 +3,35 @@ import asyncio
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import AsyncGenerator
-from typing import AsyncGenerator
-from datetime import datetime
+from typing import AsyncGenerator, Any, Dict
+from datetime import datetime, timezone
 import time
 
+from pydantic import BaseModel
+
 from app.layers.api.schemas.request import QueryRequest
 from app.layers.api.schemas.response import QueryResponse
 from app.layers.api.validators.query_validator import validate_query
 from app.layers.api.dependencies import get_agent_orchestrator, get_db_session
 from app.layers.ai_agent.agent.agent_orchestrator import AgentOrchestrator
+from app.layers.ai_agent.llm.governor import LLMCapacityError
 from app.shared.database.repositories.repository_factory import RepositoryFactory
 from app.shared.utils.logger import get_logger
 from app.shared.config.constants.app_constants import ProcessingStep, StepStatus
-from app.shared.schemas.sse_schema import SSEStepUpdate
+from app.shared.schemas.sse_schema import SSECompleteUpdate, SSEErrorUpdate, SSEStepUpdate, SSETextUpdate
+from app.shared.utils.metrics import get_metrics
+from app.shared.utils.query_stream import QueryStream
 
 logger = get_logger(__name__)
+metrics = get_metrics()
+
+SSE_EVENT_NAMES = {
+    SSEStepUpdate: "step",
+    SSETextUpdate: "text",
+    SSEErrorUpdate: "error",
+    SSECompleteUpdate: "complete",
+}
+
 
 class QueryService:
     async def execute_query(self, request:QueryRequest,
@@ -35,34 +48,17 @@ class QueryService:
             repo_factory = RepositoryFactory()
             query_log_repo = repo_factory.get_query_log_repository(db)
 
-            result = await agent.process_query(request.query)
+            result = await agent.process_query(request.query, request.priority)
             processing_time = int((time.time() - start_time) * 1000)
 
-            container_id = result.data.container_id if result.data else None
-            intent = result.data.intent if result.data else None
-
-            await query_log_repo.create(
-                user_query=request.query,
-                extracted_container=container_id,
-                intent=intent,
-                response_time_ms=processing_time,
-                status="success" if not result.data.has_errors else "partial_success",
-                workflow_id=None,
-                error_message=result.data.error_message if result.data.has_errors else None,
-                query_result=None
-            )
-            await db.commit()
+            await self._log_result(query_log_repo, db, request, result, processing_time)
 
             logger.info(f"Query processed successfully in {processing_time}ms")
 
             return QueryResponse(
                 status="success",
                 data=result.raw_data,
-                metadata={
-                    "query_time_ms": processing_time,
-                    "cached": result.cached,
-                    "timestamp": datetime.utcnow().isoformat()
-                }
+                metadata=self._metadata(result, processing_time)
             )
 
         except ValueError as e:
@@ -91,6 +87,32 @@ class QueryService:
                 }
             )
 
+        except LLMCapacityError as e:
+            logger.warning(f"Query shed: {e.message}")
+            processing_time = int((time.time() - start_time) * 1000)
+
+            if query_log_repo:
+                try:
+                    await query_log_repo.create(
+                        user_query=request.query,
+                        response_time_ms=processing_time,
+                        status="failed",
+                        error_message=e.message
+                    )
+                    await db.commit()
+                except Exception as log_error:
+                    logger.error(f"Failed to log capacity error: {log_error}")
+
+            raise HTTPException(
+                status_code=503,
+                detail={
+                    "error": "Service overloaded",
+                    "message": "Too many queries in progress. Please retry shortly.",
+                    "query_time_ms": processing_time
+                },
+                headers={"Retry-After": str(e.retry_after)}
+            )
+
         except Exception as e:
             logger.error(f"Query processing failed: {str(e)}", exc_info=True)
             processing_time = int((time.time() - start_time) * 1000)
@@ -114,4 +136,111 @@ class QueryService:
                     "message": "An error occurred while processing your query. Please try again.",
                     "query_time_ms": processing_time
                 }
-            )
\ No newline at end of file
+            )
+
+    @staticmethod
+    def _metadata(result, processing_time: int) -> Dict[str, Any]:
+        return {
+            "query_time_ms": processing_time,
+            "cached": result.cached,
+            "path": result.path,
+            "served_from_cache": result.data.served_from_cache,
+            "data_age_seconds": result.data.data_age_seconds,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
+    @staticmethod
+    async def _log_result(query_log_repo, db: AsyncSession, request: QueryRequest, result, processing_time: int):
+        container_id = result.data.container_id if result.data else None
+        intent = result.data.intent if result.data else None
+
+        await query_log_repo.create(
+            user_query=request.query,
+            extracted_container=container_id,
+            intent=intent,
+            response_time_ms=processing_time,
+            status="success" if not result.data.has_errors else "partial_success",
+            workflow_id=None,
+            error_message=result.data.error_message if result.data.has_errors else None,
+            query_result=None
+        )
+        await db.commit()
+
+    @staticmethod
+    def _format_event(update: BaseModel) -> str:
+        return f"event: {SSE_EVENT_NAMES[type(update)]}\ndata: {update.model_dump_json()}\n\n"
+
+    async def stream_query(
+            self,
+            request: QueryRequest,
+            agent: AgentOrchestrator,
+            db: AsyncSession
+    ) -> AsyncGenerator[str, None]:
+        """Runs the regular query pipeline with a QueryStream bound, yielding
+        its stage, workflow and model text updates as SSE events and a
+        final complete (or error) event. If the client goes away first, the
+        pipeline and the workflows it started are cancelled."""
+        start_time = time.time()
+        stream = QueryStream()
+
+        try:
+            validate_query(request.query)
+        except ValueError as e:
+            yield self._format_event(SSEErrorUpdate(
+                step=ProcessingStep.VALIDATE_REQUEST,
+                error="Invalid query",
+                details={"message": str(e)},
+                timestamp=datetime.now(timezone.utc).isoformat()
+            ))
+            return
+
+        logger.info(f"Streaming query: {request.query}")
+        stream.step(ProcessingStep.VALIDATE_REQUEST)
+
+        task = stream.start(agent.process_query(request.query, request.priority))
+        finished = False
+
+        try:
+            while (update := await stream.updates.get()) is not None:
+                yield self._format_event(update)
+
+            result = await task
+            processing_time = int((time.time() - start_time) * 1000)
+
+            try:
+                query_log_repo = RepositoryFactory().get_query_log_repository(db)
+                await self._log_result(query_log_repo, db, request, result, processing_time)
+            except Exception as log_error:
+                logger.error(f"Failed to log streamed query: {log_error}")
+
+            finished = True
+            yield self._format_event(SSECompleteUpdate(
+                data={"status": "success", "data": result.raw_data, "metadata": self._metadata(result, processing_time)},
+                total_time_ms=processing_time,
+                timestamp=datetime.now(timezone.utc).isoformat()
+            ))
+
+        except LLMCapacityError as e:
+            finished = True
+            yield self._format_event(SSEErrorUpdate(
+                step=stream.last_step or ProcessingStep.PARSE_QUERY,
+                error="Service overloaded",
+                details={"message": "Too many queries in progress. Please retry shortly.", "retry_after": e.retry_after},
+                timestamp=datetime.now(timezone.utc).isoformat()
+            ))
+
+        except Exception as e:
+            logger.error(f"Streamed query failed: {str(e)}", exc_info=True)
+            finished = True
+            yield self._format_event(SSEErrorUpdate(
+                step=stream.last_step or ProcessingStep.PARSE_QUERY,
+                error="Processing failed",
+                details={"message": "An error occurred while processing your query. Please try again."},
+                timestamp=datetime.now(timezone.utc).isoformat()
+            ))
+
+        finally:
+            if not finished:
+                logger.info("Query stream closed by client, cancelling")
+                metrics.increment("query_stream_cancelled")
+                task.cancel()
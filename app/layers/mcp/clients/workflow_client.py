@@ -1,16 +1,46 @@
-from typing import Dict, Any
-from dataclasses import dataclass
+from typing import Dict, Any, AsyncIterator, List, Optional
+from dataclasses import dataclass, field
+import asyncio
+import time
 import uuid
 
 from temporalio.client import Client
 from app.shared.config.settings.base import get_settings
+from app.shared.config.constants.app_constants import ProcessingStep, StepStatus
+from app.shared.schemas.sse_schema import SSEStepUpdate
 from app.shared.utils.logger import get_logger
+from app.shared.utils.metrics import get_metrics
+from app.shared.utils.query_stream import get_query_stream
 
 from app.layers.scraper.temporal.workflows.container_workflow import (
     ContainerScraperWorkflow
 )
+from app.layers.scraper.temporal.workflows.batch_workflow import ContainerBatchWorkflow
+from app.layers.scraper.temporal.codec import get_data_converter
 settings = get_settings()
 logger = get_logger(__name__)
+metrics = get_metrics()
+
+_temporal_client: Optional[Client] = None
+_connect_lock = asyncio.Lock()
+
+
+async def connect_temporal_client() -> Client:
+    """Connect once per process; every WorkflowClient shares the connection."""
+    global _temporal_client
+
+    async with _connect_lock:
+        if _temporal_client is None:
+            start_time = time.time()
+            _temporal_client = await Client.connect(
+                f"{settings.TEMPORAL_HOST}:{settings.TEMPORAL_PORT}",
+                namespace=settings.TEMPORAL_NAMESPACE,
+                data_converter=get_data_converter(),
+            )
+            metrics.observe("temporal_connect_ms", int((time.time() - start_time) * 1000))
+            logger.info("Connected to Temporal")
+
+    return _temporal_client
 
 
 @dataclass
@@ -18,6 +48,9 @@ class WorkflowResult:
     workflow_id: str
     data: Dict[str, Any]
     status: str
+    cache: Dict[str, Any] = field(default_factory=dict)
+    timings: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
 
 
 class WorkflowClient:
@@ -28,21 +61,17 @@ class WorkflowClient:
 
     async def _get_client(self) -> Client:
         if not self._client:
-            self._client = await Client.connect(
-                f"{settings.TEMPORAL_HOST}:{settings.TEMPORAL_PORT}",
-                namespace=settings.TEMPORAL_NAMESPACE,
-            )
-            logger.info("Connected to Temporal")
+            self._client = await connect_temporal_client()
 
         return self._client
 
-    async def start_workflow(
+    async def submit_workflow(
             self,
             workflow_name: str,
-            workflow_input: Dict[str, Any]
-    ) -> WorkflowResult:
-
-        workflow_id = f"workflow-{uuid.uuid4()}"
+            workflow_input: Dict[str, Any],
+            workflow_id: Optional[str] = None
+    ) -> str:
+        workflow_id = workflow_id or f"workflow-{uuid.uuid4()}"
 
         logger.info(
             "Starting workflow",
@@ -53,31 +82,132 @@ class WorkflowClient:
 
         client = await self._get_client()
 
-
-        handle = await client.start_workflow(
+        start_time = time.time()
+        await client.start_workflow(
             ContainerScraperWorkflow.run,
             id=workflow_id,
             task_queue=settings.TEMPORAL_TASK_QUEUE,
             args=[
                 workflow_input["container_id"],
-                workflow_input["operation"]
-            ]
+                workflow_input["operation"],
+                workflow_input.get("force_refresh", False)
+            ],
+            request_eager_start=settings.TEMPORAL_EAGER_WORKFLOW_START,
         )
+        metrics.observe("workflow_start_request_ms", int((time.time() - start_time) * 1000))
+
+        stream = get_query_stream()
+        if stream:
+            stream.follow_workflow(self, workflow_id, workflow_input["container_id"])
+
+        return workflow_id
+
+    async def wait_for_result(self, workflow_id: str) -> WorkflowResult:
+        client = await self._get_client()
+        handle = client.get_workflow_handle_for(ContainerScraperWorkflow.run, workflow_id)
 
         result = await handle.result()
 
+        timings = result.get("timings", {})
+        for name, value in timings.items():
+            metrics.observe(f"workflow_{name}", value)
+
         logger.info(
             "Workflow completed",
             workflow_id=workflow_id,
-            status=result.get("status")
+            status=result.get("status"),
+            **timings
         )
 
         return WorkflowResult(
             workflow_id=workflow_id,
             data=result.get("data", {}),
-            status=result.get("status", "completed")
+            status=result.get("status", "completed"),
+            cache=result.get("cache", {}),
+            timings=timings,
+            error=result.get("error")
         )
 
+    async def start_workflow(
+            self,
+            workflow_name: str,
+            workflow_input: Dict[str, Any]
+    ) -> WorkflowResult:
+        workflow_id = await self.submit_workflow(workflow_name, workflow_input)
+        return await self.wait_for_result(workflow_id)
+
+    async def run_batch_workflow(
+            self,
+            container_ids: List[str],
+            operation: str = "get_full_info"
+    ) -> Dict[str, Any]:
+        workflow_id = f"batch-workflow-{uuid.uuid4()}"
+
+        logger.info(
+            "Starting batch workflow",
+            workflow_id=workflow_id,
+            containers=len(container_ids),
+            operation=operation
+        )
+
+        client = await self._get_client()
+
+        result = await client.execute_workflow(
+            ContainerBatchWorkflow.run,
+            args=[container_ids, operation, settings.BATCH_CHUNK_SIZE],
+            id=workflow_id,
+            task_queue=settings.TEMPORAL_TASK_QUEUE,
+        )
+
+        return {"workflow_id": workflow_id, **result}
+
+    async def get_workflow_progress(self, workflow_id: str) -> Dict[str, Any]:
+        client = await self._get_client()
+        handle = client.get_workflow_handle_for(ContainerScraperWorkflow.run, workflow_id)
+        return await handle.query(ContainerScraperWorkflow.get_progress)
+
+    async def stream_progress(
+            self,
+            workflow_id: str,
+            poll_interval: float = None
+    ) -> AsyncIterator[SSEStepUpdate]:
+        poll_interval = poll_interval or settings.WORKFLOW_PROGRESS_POLL_INTERVAL
+        seen = 0
+
+        while True:
+            try:
+                progress = await self.get_workflow_progress(workflow_id)
+            except Exception as e:
+                logger.warning(f"Progress query failed for {workflow_id}: {e}")
+                status = await self.get_workflow_status(workflow_id)
+                if status["status"] != "RUNNING":
+                    return
+                await asyncio.sleep(poll_interval)
+                continue
+
+            events = progress.get("events", [])
+            for event in events[seen:]:
+                yield SSEStepUpdate(
+                    step=ProcessingStep(event["step"]),
+                    status=StepStatus(event["status"]),
+                    message=event.get("message"),
+                    progress=event["progress"],
+                    data={"workflow_id": workflow_id},
+                    timestamp=event["timestamp"],
+                )
+            seen = len(events)
+
+            if progress.get("completed"):
+                return
+
+            await asyncio.sleep(poll_interval)
+
+    async def cancel_workflow(self, workflow_id: str) -> None:
+        client = await self._get_client()
+        handle = client.get_workflow_handle(workflow_id)
+        await handle.cancel()
+        logger.info("Workflow cancellation requested", workflow_id=workflow_id)
+
     async def get_workflow_status(self, workflow_id: str) -> Dict[str, Any]:
         client = await self._get_client()
 
@@ -89,6 +219,7 @@ class WorkflowClient:
                 "workflow_id": workflow_id,
                 "status": result.status.name,
                 "start_time": result.start_time,
+                "close_time": result.close_time,
             }
         except Exception as e:
             logger.error(f"Error getting workflow status: {e}")
@@ -13,6 +13,7 @@ class ToolRegistry:
     _instance = None
     _tools: Dict[str, Any] = {}
     _tool_metadata: Dict[str, Dict[str, Any]] = {}
+    container_tools = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -30,40 +31,66 @@ class ToolRegistry:
         from app.layers.mcp.tools.container_tools import ContainerTools
 
         container_tools = ContainerTools(workflow_client)
+        self.container_tools = container_tools
 
         self._register_tool_method(
             name="get_container_info",
             method=container_tools.get_container_info,
             description="Retrieve complete container information from PNCT",
-            parameters={"container_id": "Container number (4 letters + 7 digits)"}
+            parameters={
+                "container_id": "Container number (4 letters + 7 digits)",
+                "force_refresh": "Bypass the scrape cache (optional)"
+            }
         )
 
         self._register_tool_method(
             name="check_container_availability",
             method=container_tools.check_container_availability,
             description="Check if container is available for pickup",
-            parameters={"container_id": "Container number"}
+            parameters={
+                "container_id": "Container number",
+                "force_refresh": "Bypass the scrape cache (optional)"
+            }
         )
 
         self._register_tool_method(
             name="get_container_location",
             method=container_tools.get_container_location,
             description="Get container yard location",
-            parameters={"container_id": "Container number"}
+            parameters={
+                "container_id": "Container number",
+                "force_refresh": "Bypass the scrape cache (optional)"
+            }
         )
 
         self._register_tool_method(
             name="check_container_holds",
             method=container_tools.check_container_holds,
             description="Check for holds or restrictions on container",
-            parameters={"container_id": "Container number"}
+            parameters={
+                "container_id": "Container number",
+                "force_refresh": "Bypass the scrape cache (optional)"
+            }
         )
 
         self._register_tool_method(
             name="get_last_free_day",
             method=container_tools.get_last_free_day,
             description="Get last free day for container",
-            parameters={"container_id": "Container number"}
+            parameters={
+                "container_id": "Container number",
+                "force_refresh": "Bypass the scrape cache (optional)"
+            }
+        )
+
+        self._register_tool_method(
+            name="get_containers_info",
+            method=container_tools.get_containers_info,
+            description="Retrieve complete information for several containers at once",
+            parameters={
+                "container_ids": "List of container numbers",
+                "force_refresh": "Bypass the scrape cache (optional)"
+            }
         )
 
         logger.info(f"Registered {len(self._tools)} container tools")
@@ -86,6 +113,9 @@ class ToolRegistry:
     def get_all_tools(self) -> List[Any]:
         return list(self._tools.values())
 
+    def get_tool(self, name: str) -> Optional[Any]:
+        return self._tools.get(name)
+
     def list_tool_names(self) -> List[str]:
         return list(self._tools.keys())
 
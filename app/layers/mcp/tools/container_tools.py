@@ -1,4 +1,6 @@
-from typing import Dict, Any
+import asyncio
+from typing import Dict, Any, List
+from app.layers.mcp.tools.speculation import ScrapeSpeculator
 from app.shared.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -10,93 +12,148 @@ class ContainerTools:
     def __init__(self, workflow_client):
 
         self.workflow_client = workflow_client
+        self.speculator = ScrapeSpeculator(workflow_client)
         logger.info("ContainerTools initialized")
 
-    async def get_container_info(self, container_id: str) -> Dict[str, Any]:
+    async def get_container_info(self, container_id: str, force_refresh: bool = False) -> Dict[str, Any]:
 
         logger.info(f"Executing get_container_info for {container_id}")
 
+        speculative = await self.speculator.join(container_id, "get_full_info", force_refresh)
+        if speculative:
+            return speculative
+
         result = await self.workflow_client.start_workflow(
             workflow_name="container_scraper_workflow",
             workflow_input={
                 "container_id": container_id,
-                "operation": "get_full_info"
+                "operation": "get_full_info",
+                "force_refresh": force_refresh
             }
         )
-        logger.info("Result from tool calll {result}" +str(result))
+        logger.debug(f"get_container_info for {container_id} finished with status {result.status}")
 
         return {
             "data": result.data,
             "workflow_id": result.workflow_id,
-            "status": result.status
+            "status": result.status,
+            "cache": result.cache
         }
 
-    async def check_container_availability(self, container_id: str) -> Dict[str, Any]:
+    async def check_container_availability(self, container_id: str, force_refresh: bool = False) -> Dict[str, Any]:
 
         logger.info(f"Checking availability for {container_id}")
 
+        speculative = await self.speculator.join(container_id, "check_availability", force_refresh)
+        if speculative:
+            return speculative
+
         result = await self.workflow_client.start_workflow(
             workflow_name="container_scraper_workflow",
             workflow_input={
                 "container_id": container_id,
-                "operation": "check_availability"
+                "operation": "check_availability",
+                "force_refresh": force_refresh
             }
         )
 
         return {
             "data": result.data,
             "workflow_id": result.workflow_id,
-            "status": result.status
+            "status": result.status,
+            "cache": result.cache
         }
 
-    async def get_container_location(self, container_id: str) -> Dict[str, Any]:
+    async def get_container_location(self, container_id: str, force_refresh: bool = False) -> Dict[str, Any]:
 
         logger.info(f"Getting location for {container_id}")
 
+        speculative = await self.speculator.join(container_id, "get_location", force_refresh)
+        if speculative:
+            return speculative
+
         result = await self.workflow_client.start_workflow(
             workflow_name="container_scraper_workflow",
             workflow_input={
                 "container_id": container_id,
-                "operation": "get_location"
+                "operation": "get_location",
+                "force_refresh": force_refresh
             }
         )
 
         return {
             "data": result.data,
             "workflow_id": result.workflow_id,
-            "status": result.status
+            "status": result.status,
+            "cache": result.cache
         }
 
-    async def check_container_holds(self, container_id: str) -> Dict[str, Any]:
+    async def check_container_holds(self, container_id: str, force_refresh: bool = False) -> Dict[str, Any]:
         logger.info(f"Checking holds for {container_id}")
 
+        speculative = await self.speculator.join(container_id, "check_holds", force_refresh)
+        if speculative:
+            return speculative
+
         result = await self.workflow_client.start_workflow(
             workflow_name="container_scraper_workflow",
             workflow_input={
                 "container_id": container_id,
-                "operation": "check_holds"
+                "operation": "check_holds",
+                "force_refresh": force_refresh
             }
         )
 
         return {
             "data": result.data,
             "workflow_id": result.workflow_id,
-            "status": result.status
+            "status": result.status,
+            "cache": result.cache
         }
 
-    async def get_last_free_day(self, container_id: str) -> Dict[str, Any]:
+    async def get_last_free_day(self, container_id: str, force_refresh: bool = False) -> Dict[str, Any]:
         logger.info(f"Getting last free day for {container_id}")
 
+        speculative = await self.speculator.join(container_id, "get_lfd", force_refresh)
+        if speculative:
+            return speculative
+
         result = await self.workflow_client.start_workflow(
             workflow_name="container_scraper_workflow",
             workflow_input={
                 "container_id": container_id,
-                "operation": "get_lfd"
+                "operation": "get_lfd",
+                "force_refresh": force_refresh
             }
         )
 
         return {
             "data": result.data,
             "workflow_id": result.workflow_id,
-            "status": result.status
+            "status": result.status,
+            "cache": result.cache
+        }
+
+    async def get_containers_info(self, container_ids: List[str], force_refresh: bool = False) -> Dict[str, Any]:
+        logger.info(f"Getting info for {len(container_ids)} containers")
+
+        # Each container runs its own workflow; they proceed side by side
+        outcomes = await asyncio.gather(
+            *(self.get_container_info(container_id, force_refresh) for container_id in container_ids),
+            return_exceptions=True
+        )
+
+        results = []
+        for container_id, outcome in zip(container_ids, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Info lookup failed for {container_id}: {outcome}")
+                results.append({"container_id": container_id, "status": "failed", "error": str(outcome)})
+            else:
+                results.append({"container_id": container_id, **outcome})
+
+        succeeded = sum(1 for result in results if result["status"] == "success")
+
+        return {
+            "results": results,
+            "status": "success" if succeeded == len(results) else "partial_success" if succeeded else "failed"
         }
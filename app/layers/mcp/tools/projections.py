@@ -0,0 +1,57 @@
+import json
+from typing import Dict, Any, List
+
+# Fields of ContainerParser output each tool shows the LLM. Everything else,
+# including workflow bookkeeping, stays server-side.
+TOOL_FIELDS: Dict[str, List[str]] = {
+    "get_container_info": [
+        "status", "location", "holds", "customs_status", "freight_status",
+        "last_free_day", "terminal_demurrage_amount", "ssco", "size", "type",
+    ],
+    "check_container_availability": [
+        "available", "available_for_pickup", "customs_released", "freight_released", "has_holds",
+    ],
+    "get_container_location": ["location", "yard", "row", "position", "status"],
+    "check_container_holds": ["holds", "customs_status", "freight_status"],
+    "get_last_free_day": ["last_free_day", "days_remaining", "terminal_demurrage_amount", "pay_through_date"],
+}
+
+
+def _project_one(fields: List[str], result: Dict[str, Any]) -> Dict[str, Any]:
+    if result.get("status") != "success" or not result.get("data"):
+        return {"found": False, "error": result.get("error", "not found")}
+
+    data = result["data"]
+    projected = {"found": True}
+    projected.update({
+        field: data[field] for field in fields
+        if data.get(field) not in (None, "", [])
+    })
+
+    cache = result.get("cache") or {}
+    if cache.get("hit"):
+        projected["data_age_s"] = cache.get("age_seconds")
+
+    return projected
+
+
+def project_tool_result(tool_name: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    if "results" in result:
+        fields = TOOL_FIELDS["get_container_info"]
+        return {
+            "containers": {
+                item.get("container_id"): _project_one(fields, item)
+                for item in result["results"]
+            }
+        }
+
+    fields = TOOL_FIELDS.get(tool_name)
+    if fields is None:
+        return result
+
+    return _project_one(fields, result)
+
+
+def estimate_tokens(value: Any) -> int:
+    # ~4 characters per token for compact JSON; close enough to compare shapes
+    return len(json.dumps(value, separators=(",", ":"), default=str)) // 4
@@ -0,0 +1,142 @@
+import asyncio
+import uuid
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
+
+from app.layers.scraper.parsers.container_parser import ContainerParser
+from app.shared.utils.helpers import normalize_container_id
+from app.shared.utils.logger import get_logger
+from app.shared.utils.metrics import get_metrics
+from app.shared.utils.query_stream import shared_context
+
+logger = get_logger(__name__)
+metrics = get_metrics()
+
+
+@dataclass
+class Speculation:
+    container_id: str
+    force_refresh: bool
+    task: Optional[asyncio.Task] = None
+    workflow_id: Optional[str] = None
+    holders: int = 0
+    used: bool = False
+
+
+class ScrapeSpeculator:
+    """Full-info scrapes started before the LLM has picked a tool.
+
+    Queries that name a container hold a speculation for it while the LLM
+    runs; concurrent queries for the same container share one. A tool call
+    for the container then waits on the in-flight scrape instead of starting
+    its own: get_container_info takes the result as is, other tools get
+    their operation's view of it. A speculation nobody used is cancelled if
+    still running when the last holder releases it."""
+
+    def __init__(self, workflow_client):
+        self.workflow_client = workflow_client
+        self._speculations: Dict[str, Speculation] = {}
+        self.parser = ContainerParser()
+
+    def speculate(self, container_id: str, force_refresh: bool = False):
+        speculation = self._speculations.get(container_id)
+
+        if speculation is None:
+            speculation = Speculation(container_id, force_refresh)
+            # Shared with other queries for the container, so not tied to
+            # the stream of the query that happened to start it
+            speculation.task = asyncio.create_task(self._scrape(speculation), context=shared_context(stream=False))
+            self._speculations[container_id] = speculation
+            metrics.increment("speculative_scrape", outcome="started")
+            logger.info(f"Speculative scrape started for {container_id}")
+        else:
+            metrics.increment("speculative_scrape", outcome="joined")
+
+        speculation.holders += 1
+
+    async def _scrape(self, speculation: Speculation) -> Dict[str, Any]:
+        # Known before the start call, so release() can cancel a workflow
+        # whose start was still in flight
+        speculation.workflow_id = f"workflow-{uuid.uuid4()}"
+
+        await self.workflow_client.submit_workflow(
+            workflow_name="container_scraper_workflow",
+            workflow_input={
+                "container_id": speculation.container_id,
+                "operation": "get_full_info",
+                "force_refresh": speculation.force_refresh
+            },
+            workflow_id=speculation.workflow_id
+        )
+
+        result = await self.workflow_client.wait_for_result(speculation.workflow_id)
+
+        return {
+            "data": result.data,
+            "workflow_id": result.workflow_id,
+            "status": result.status,
+            "cache": result.cache
+        }
+
+    async def join(self, container_id: str, operation: str, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
+        speculation = self._speculations.get(normalize_container_id(container_id) or container_id)
+
+        if speculation is None or (force_refresh and not speculation.force_refresh):
+            return None
+
+        speculation.used = True
+
+        try:
+            result = await asyncio.shield(speculation.task)
+        except Exception as e:
+            logger.warning(f"Speculative scrape for {speculation.container_id} failed: {e}")
+            return None
+
+        if operation == "get_full_info":
+            metrics.increment("speculative_scrape", outcome="served")
+            return result
+
+        if result["status"] != "success" or not result["data"]:
+            return None
+
+        try:
+            data = self.parser.derive(result["data"], operation)
+        except Exception as e:
+            logger.warning(f"Could not derive {operation} from speculative scrape of {speculation.container_id}: {e}")
+            return None
+
+        metrics.increment("speculative_scrape", outcome="derived")
+
+        return {**result, "data": data}
+
+    async def release(self, container_id: str):
+        speculation = self._speculations.get(container_id)
+        if speculation is None:
+            return
+
+        speculation.holders -= 1
+        if speculation.holders > 0:
+            return
+
+        del self._speculations[container_id]
+
+        if speculation.used:
+            return
+
+        if speculation.task.done():
+            # The scrape already landed in the scrape cache; only the LLM
+            # round trip that would have used it was skipped.
+            if not speculation.task.cancelled():
+                speculation.task.exception()
+            metrics.increment("speculative_scrape", outcome="wasted_cached")
+            return
+
+        speculation.task.cancel()
+        await asyncio.gather(speculation.task, return_exceptions=True)
+        metrics.increment("speculative_scrape", outcome="wasted_cancelled")
+
+        if speculation.workflow_id:
+            try:
+                await self.workflow_client.cancel_workflow(speculation.workflow_id)
+            except Exception as e:
+                logger.warning(f"Failed to cancel speculative workflow {speculation.workflow_id}: {e}")
@@ -0,0 +1,199 @@
+import time
+from dataclasses import dataclass, asdict
+from datetime import timezone
+from typing import Dict, Any, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.config.constants.scraper_constants import (
+    RAW_HTML_OPERATION,
+    CACHE_MAX_AGE_BY_OPERATION,
+    CACHE_MAX_AGE_BY_STATE,
+)
+from app.shared.config.settings.base import get_settings
+from app.shared.database.repositories.repository_factory import RepositoryFactory
+from app.shared.utils.cache import CacheManager
+from app.shared.utils.logger import get_logger
+from app.shared.utils.metrics import get_metrics
+
+settings = get_settings()
+logger = get_logger(__name__)
+metrics = get_metrics()
+
+
+@dataclass
+class CachedScrape:
+    container_id: str
+    html_content: str
+    source: str
+    age_seconds: int
+    scraped_at: float
+    state: Optional[str] = None
+    persisted: bool = True
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"found": True, **asdict(self)}
+
+
+# Operations whose has_holds and available fields mean misc holds and yard
+# availability. check_holds also lists unreleased customs and freight as
+# holds, and the other operations report neither field.
+FULL_STATE_OPERATIONS = ("get_full_info", "check_availability")
+STATUS_HOLD_PREFIXES = ("CUSTOMS:", "FREIGHT:")
+
+
+def _has_misc_holds(data: Dict[str, Any], operation: str) -> bool:
+    if operation in FULL_STATE_OPERATIONS:
+        return bool(data.get("has_holds"))
+
+    if operation == "check_holds":
+        return any(not hold.startswith(STATUS_HOLD_PREFIXES) for hold in data.get("holds") or [])
+
+    return False
+
+
+def classify_container_state(data: Dict[str, Any], operation: Optional[str]) -> Optional[str]:
+    """Container state from the fields the operation's output reports with
+    the same meaning as full info. Unknown operations give no state."""
+    if not data or operation is None:
+        return None
+
+    if _has_misc_holds(data, operation):
+        return "on_hold"
+
+    if operation in FULL_STATE_OPERATIONS:
+        available = bool(data.get("available"))
+    else:
+        available = data.get("status") == "Available"
+
+    return "available" if available else "unavailable"
+
+
+def max_age_for(operation: str, state: Optional[str] = None) -> int:
+    max_age = CACHE_MAX_AGE_BY_OPERATION.get(operation, settings.SCRAPE_CACHE_DEFAULT_MAX_AGE)
+
+    if state in CACHE_MAX_AGE_BY_STATE:
+        max_age = min(max_age, CACHE_MAX_AGE_BY_STATE[state])
+
+    return max_age
+
+
+class ScrapeResultCache:
+    """Two-tier cache for scraped container pages: Redis, then the
+    container_scrape_results table. Entries are served only while younger
+    than the freshness policy for the operation and last known state."""
+
+    def __init__(self, cache: CacheManager = None):
+        self.cache = cache or CacheManager()
+        self.redis_ttl = max(
+            [settings.SCRAPE_CACHE_DEFAULT_MAX_AGE,
+             *CACHE_MAX_AGE_BY_OPERATION.values(),
+             *CACHE_MAX_AGE_BY_STATE.values()]
+        )
+
+    @staticmethod
+    def _key(container_id: str) -> str:
+        return f"scrape:html:{container_id}"
+
+    async def lookup(
+            self,
+            session: Optional[AsyncSession],
+            container_id: str,
+            operation: str
+    ) -> Optional[CachedScrape]:
+        if not settings.SCRAPE_CACHE_ENABLED:
+            return None
+
+        entry = await self.cache.get(self._key(container_id))
+        source = "redis"
+
+        if entry is None and session is not None:
+            entry = await self._load_from_db(session, container_id)
+            source = "database"
+
+        if entry is None:
+            metrics.increment("scrape_cache_miss", operation=operation, reason="absent")
+            return None
+
+        age_seconds = int(time.time() - entry["scraped_at"])
+        max_age = max_age_for(operation, entry.get("state"))
+
+        if age_seconds > max_age:
+            logger.info(
+                "Cached scrape too old",
+                container_id=container_id,
+                operation=operation,
+                age_seconds=age_seconds,
+                max_age=max_age,
+            )
+            metrics.increment("scrape_cache_miss", operation=operation, reason="stale")
+            return None
+
+        if source == "database":
+            await self.cache.set(self._key(container_id), entry, ttl=self.redis_ttl)
+
+        metrics.increment("scrape_cache_hit", operation=operation, source=source)
+
+        return CachedScrape(
+            container_id=container_id,
+            html_content=entry["html_content"],
+            source=source,
+            age_seconds=age_seconds,
+            scraped_at=entry["scraped_at"],
+            state=entry.get("state"),
+            persisted=entry.get("persisted", True),
+        )
+
+    async def _load_from_db(self, session: AsyncSession, container_id: str) -> Optional[Dict[str, Any]]:
+        repo = RepositoryFactory.get_container_scraper_repository(session)
+        row = await repo.get_latest(container_id, RAW_HTML_OPERATION)
+
+        if not row or not row.raw_html or row.status != "success" or not row.scraped_at:
+            return None
+
+        scraped_at = row.scraped_at
+        if scraped_at.tzinfo is None:
+            scraped_at = scraped_at.replace(tzinfo=timezone.utc)
+
+        return {
+            "html_content": row.raw_html,
+            "scraped_at": scraped_at.timestamp(),
+            "state": (row.parsed_json or {}).get("state"),
+        }
+
+    async def cache_html(self, container_id: str, html_content: str, persisted: bool = False) -> bool:
+        """Redis tier only. Pages cached unpersisted are written to the
+        database by the workflow that next serves them."""
+        return await self.cache.set(
+            self._key(container_id),
+            {"html_content": html_content, "scraped_at": time.time(), "state": None, "persisted": persisted},
+            ttl=self.redis_ttl,
+        )
+
+    async def store_html(self, session: AsyncSession, container_id: str, html_content: str) -> None:
+        repo = RepositoryFactory.get_container_scraper_repository(session)
+        await repo.upsert(container_id, RAW_HTML_OPERATION, html_content, None, "success", None)
+
+        await self.cache_html(container_id, html_content, persisted=True)
+
+    async def record_state(
+            self,
+            session: AsyncSession,
+            container_id: str,
+            data: Dict[str, Any],
+            operation: Optional[str]
+    ) -> Optional[str]:
+        state = classify_container_state(data, operation)
+        if state is None:
+            return None
+
+        repo = RepositoryFactory.get_container_scraper_repository(session)
+        await repo.merge_parsed_json(container_id, RAW_HTML_OPERATION, {"state": state})
+
+        key = self._key(container_id)
+        entry = await self.cache.get(key)
+        if entry is not None:
+            entry["state"] = state
+            await self.cache.set(key, entry, ttl=self.redis_ttl)
+
+        return state
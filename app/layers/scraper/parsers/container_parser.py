@@ -14,23 +14,48 @@ class ContainerParser:
         try:
             soup = BeautifulSoup(html_content, 'html.parser')
 
-            if operation == "get_full_info":
-                return self._extract_full_info(soup)
-            elif operation == "check_availability":
-                return self._extract_availability(soup)
-            elif operation == "get_location":
-                return self._extract_location(soup)
-            elif operation == "check_holds":
-                return self._extract_holds(soup)
-            elif operation == "get_lfd":
-                return self._extract_lfd(soup)
-            else:
-                return self._extract_full_info(soup)
+            container_data = self._find_container_data(soup)
+
+            if not container_data:
+                raise DataExtractionError("No container data found in response")
+
+            return self._extract(container_data, operation)
 
         except Exception as e:
             logger.error(f"Data parsing failed: {str(e)}", exc_info=True)
             raise DataExtractionError(f"Failed to parse container data: {str(e)}")
 
+    def derive(self, full_info: Dict[str, Any], operation: str) -> Dict[str, Any]:
+        """Another operation's result from a get_full_info result, as
+        parse() returns it for the same page. Full info carries every table
+        field the other operations read."""
+        if operation == "get_full_info":
+            return full_info
+
+        container_data = {
+            field: full_info.get(field, "")
+            for field in (
+                "container_number", "location", "trucker", "customs_status", "freight_status",
+                "misc_holds", "terminal_demurrage_amount", "last_free_day", "last_guar_day",
+                "pay_through_date", "non_demurrage_amount",
+            )
+        }
+        container_data["available"] = "YES" if full_info.get("available") else "NO"
+
+        return self._extract(container_data, operation)
+
+    def _extract(self, container_data: Dict[str, Any], operation: str) -> Dict[str, Any]:
+        if operation == "check_availability":
+            return self._extract_availability(container_data)
+        elif operation == "get_location":
+            return self._extract_location(container_data)
+        elif operation == "check_holds":
+            return self._extract_holds(container_data)
+        elif operation == "get_lfd":
+            return self._extract_lfd(container_data)
+        else:
+            return self._extract_full_info(container_data)
+
     def _parse_table_row(self, row) -> Optional[Dict[str, Any]]:
         try:
             cells = row.find_all('td')
@@ -118,12 +143,7 @@ class ContainerParser:
             logger.error(f"Error finding containers: {str(e)}")
             return []
 
-    def _extract_full_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        container_data = self._find_container_data(soup)
-
-        if not container_data:
-            raise DataExtractionError("No container data found in response")
-
+    def _extract_full_info(self, container_data: Dict[str, Any]) -> Dict[str, Any]:
         holds = []
         misc_holds = container_data.get("misc_holds", "").strip().upper()
         if misc_holds and misc_holds != "NONE" and misc_holds != "":
@@ -145,6 +165,7 @@ class ContainerParser:
             "freight_released": freight_released,
             "holds": holds,
             "has_holds": len(holds) > 0,
+            "misc_holds": container_data.get("misc_holds", ""),
             "terminal_demurrage_amount": container_data.get("terminal_demurrage_amount", ""),
             "last_free_day": container_data.get("last_free_day", ""),
             "last_guar_day": container_data.get("last_guar_day", ""),
@@ -159,12 +180,7 @@ class ContainerParser:
             "last_updated": datetime.utcnow().isoformat()
         }
 
-    def _extract_availability(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        container_data = self._find_container_data(soup)
-
-        if not container_data:
-            raise DataExtractionError("No container data found in response")
-
+    def _extract_availability(self, container_data: Dict[str, Any]) -> Dict[str, Any]:
         available = container_data.get("available", "").upper() == "YES"
 
         holds = []
@@ -188,12 +204,7 @@ class ContainerParser:
             "has_holds": len(holds) > 0
         }
 
-    def _extract_location(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        container_data = self._find_container_data(soup)
-
-        if not container_data:
-            raise DataExtractionError("No container data found in response")
-
+    def _extract_location(self, container_data: Dict[str, Any]) -> Dict[str, Any]:
         location = container_data.get("location", "")
 
         location_parts = location.split('-')
@@ -211,12 +222,7 @@ class ContainerParser:
             "trucker": container_data.get("trucker", "")
         }
 
-    def _extract_holds(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        container_data = self._find_container_data(soup)
-
-        if not container_data:
-            raise DataExtractionError("No container data found in response")
-
+    def _extract_holds(self, container_data: Dict[str, Any]) -> Dict[str, Any]:
         holds = []
         misc_holds = container_data.get("misc_holds", "").strip().upper()
         if misc_holds and misc_holds != "NONE" and misc_holds != "":
@@ -240,12 +246,7 @@ class ContainerParser:
             "misc_holds": container_data.get("misc_holds", "")
         }
 
-    def _extract_lfd(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        container_data = self._find_container_data(soup)
-
-        if not container_data:
-            raise DataExtractionError("No container data found in response")
-
+    def _extract_lfd(self, container_data: Dict[str, Any]) -> Dict[str, Any]:
         last_free_day = container_data.get("last_free_day", "")
 
         days_remaining = None
@@ -0,0 +1,51 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, List
+
+from app.layers.scraper.scrapers.base.base_scraper import BaseScraper
+from app.shared.utils.logger import get_logger
+from app.shared.utils.metrics import get_metrics
+
+logger = get_logger(__name__)
+metrics = get_metrics()
+
+
+class ScraperPool:
+    """Fixed-size pool of initialized scrapers shared by a worker's activities."""
+
+    def __init__(self, scraper_factory: Callable[[], BaseScraper], size: int):
+        self.scraper_factory = scraper_factory
+        self.size = size
+        self._scrapers: List[BaseScraper] = []
+        self._available: asyncio.Queue = asyncio.Queue()
+
+    async def start(self):
+        for _ in range(self.size):
+            scraper = self.scraper_factory()
+            await scraper.initialize()
+            self._scrapers.append(scraper)
+            self._available.put_nowait(scraper)
+
+        metrics.set_gauge("scraper_pool_size", self.size)
+        logger.info(f"Scraper pool started with {self.size} scrapers")
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[BaseScraper]:
+        start_time = time.time()
+        scraper = await self._available.get()
+        metrics.observe("scraper_pool_wait_ms", int((time.time() - start_time) * 1000))
+        metrics.set_gauge("scraper_pool_available", self._available.qsize())
+
+        try:
+            yield scraper
+        finally:
+            self._available.put_nowait(scraper)
+            metrics.set_gauge("scraper_pool_available", self._available.qsize())
+
+    async def close(self):
+        for scraper in self._scrapers:
+            await scraper.close()
+
+        self._scrapers.clear()
+        logger.info("Scraper pool closed")
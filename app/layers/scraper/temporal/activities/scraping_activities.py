@@ -1,205 +1,341 @@
+import asyncio
 from temporalio import activity
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, Optional
 
+from app.layers.scraper.scrapers.base.base_scraper import BaseScraper
 from app.layers.scraper.scrapers.dymmy.dummy_scraper import DummyScraper
-from app.layers.scraper.scrapers.pnct.pnct_scraper import PNCTScraper
+from app.layers.scraper.scrapers.scraper_pool import ScraperPool
 from app.layers.scraper.parsers.container_parser import ContainerParser
+from app.layers.scraper.cache.scrape_cache import ScrapeResultCache
+from app.shared.config.settings.base import get_settings
+from app.shared.database.base import build_engine, build_session_maker
+from app.shared.utils.cache import CacheManager
 from app.shared.utils.logger import get_logger
-from app.shared.database.session import get_db
-from app.shared.database.repositories.repository_factory import RepositoryFactory
+from app.shared.utils.metrics import get_metrics
 
+settings = get_settings()
 logger = get_logger(__name__)
+metrics = get_metrics()
+
+
+class BrowserActivities:
+    """Browser-bound activities backed by a worker-scoped scraper pool.
+    Batch scrapes hand their pages to the Redis tier of the scrape cache,
+    where the per-container workflows pick them up."""
+
+    def __init__(self, pool_size: int, scraper_factory: Callable[[], BaseScraper] = DummyScraper):
+        self.pool = ScraperPool(scraper_factory, pool_size)
+        self.cache = CacheManager()
+        self.scrape_cache = ScrapeResultCache(self.cache)
+
+    async def startup(self):
+        await self.pool.start()
+        await self.cache.connect()
+
+    async def shutdown(self):
+        await self.pool.close()
+        await self.cache.disconnect()
+
+    def get_activities(self) -> List[Callable]:
+        return [self.init_browser, self.search_container, self.scrape_containers_batch]
+
+    @activity.defn(name="init_browser")  # Explicitly set activity name
+    async def init_browser(self) -> Dict[str, Any]:
+        activity.logger.info("Activity: Initializing browser")
+
+        try:
+            async with self.pool.acquire() as scraper:
+                session_id = scraper.get_session_id()
+
+            activity.logger.info(f"Browser initialized with session: {session_id}")
+
+            return {
+                "session_id": session_id,
+                "status": "initialized"
+            }
+
+        except Exception as e:
+            activity.logger.error(f"Browser initialization failed: {str(e)}")
+            raise
+
+    @activity.defn(name="search_container")  # Explicitly set activity name
+    async def search_container(
+            self,
+            browser_session: Dict[str, Any],
+            container_id: str
+    ) -> Dict[str, Any]:
+        activity.logger.info(f"Activity: Searching container {container_id}")
+
+        try:
+            async with self.pool.acquire() as scraper:
+                html_content = await scraper.search_container(container_id)
+
+            activity.logger.info(f"Search completed for {container_id}")
+
+            return {
+                "container_id": container_id,
+                "html_content": html_content,
+                "status": "found"
+            }
+
+        except Exception as e:
+            activity.logger.error(f"Container search failed: {str(e)}")
+            raise
+
+    async def _scrape_one(self, container_id: str, operation: str):
+        if await self.scrape_cache.lookup(None, container_id, operation):
+            return
+
+        async with self.pool.acquire() as scraper:
+            html_content = await scraper.search_container(container_id)
+
+        if not await self.scrape_cache.cache_html(container_id, html_content):
+            raise RuntimeError("Scraped page could not be cached")
+
+    @staticmethod
+    async def _heartbeat_loop(get_checkpoint: Callable[[], Dict[str, Any]]):
+        timeout = activity.info().heartbeat_timeout
+        interval = timeout.total_seconds() / 3 if timeout else 3
+
+        while True:
+            await asyncio.sleep(interval)
+            activity.heartbeat(get_checkpoint())
+
+    @activity.defn(name="scrape_containers_batch")
+    async def scrape_containers_batch(
+            self,
+            container_ids: List[str],
+            operation: str,
+            chunk_size: int
+    ) -> Dict[str, Any]:
+        """Scrape containers chunk by chunk into the scrape cache, skipping
+        pages it already holds fresh, and heartbeat a checkpoint after every
+        chunk. The checkpoint is only the chunk cursor, since the pages
+        themselves are in the cache; a retried attempt resumes after the
+        last completed chunk instead of starting over. Containers that fail
+        here are scraped by their own workflows."""
+        chunks = [container_ids[i:i + chunk_size] for i in range(0, len(container_ids), chunk_size)]
+
+        if not (settings.CACHE_ENABLED and settings.SCRAPE_CACHE_ENABLED):
+            # Nowhere to hand pages over; each container's workflow scrapes it
+            activity.logger.info("Scrape cache disabled, leaving batch scrapes to the container workflows")
+            return {"scraped": 0, "failed": 0, "chunks": len(chunks), "resumed_from_chunk": 0}
+
+        checkpoint = {"last_completed_chunk": -1}
+        details = activity.info().heartbeat_details
+        if details:
+            checkpoint = details[0]
+            activity.logger.info(
+                f"Resuming batch after chunk {checkpoint['last_completed_chunk']} of {len(chunks)}"
+            )
+
+        resumed_from_chunk = checkpoint["last_completed_chunk"] + 1
+        scraped = 0
+        failed = 0
+
+        # Single scrapes can outlast the heartbeat timeout, so liveness is
+        # reported from a background loop re-sending the latest checkpoint.
+        heartbeat_task = asyncio.create_task(self._heartbeat_loop(lambda: checkpoint))
+
+        try:
+            for index in range(resumed_from_chunk, len(chunks)):
+                chunk = chunks[index]
+                activity.logger.info(f"Activity: Scraping chunk {index + 1}/{len(chunks)} ({len(chunk)} containers)")
+
+                outcomes = await asyncio.gather(
+                    *(self._scrape_one(container_id, operation) for container_id in chunk),
+                    return_exceptions=True
+                )
+
+                for container_id, outcome in zip(chunk, outcomes):
+                    if isinstance(outcome, Exception):
+                        activity.logger.warning(f"Batch scrape of {container_id} failed: {outcome}")
+                        failed += 1
+                    else:
+                        scraped += 1
+
+                checkpoint = {"last_completed_chunk": index}
+                activity.heartbeat(checkpoint)
+        finally:
+            heartbeat_task.cancel()
+
+        activity.logger.info(
+            f"Batch scrape completed: {scraped} cached, {failed} failed in this attempt, "
+            f"resumed from chunk {resumed_from_chunk}"
+        )
 
+        return {
+            "scraped": scraped,
+            "failed": failed,
+            "chunks": len(chunks),
+            "resumed_from_chunk": resumed_from_chunk,
+        }
 
-@activity.defn(name="check_cached_html")
-async def check_cached_html(container_id: str) -> Dict[str, Any]:
-    activity.logger.info(f"Checking cached html for {container_id}")
-
-    # db = None
-    # try:
-    #     db_gen = get_db()
-    #     db = await anext(db_gen)
-    #
-    #     repo_factory = RepositoryFactory()
-    #     container_repo = repo_factory.get_container_scraper_repository(db)
-    #     cached = await container_repo.get_by_container_id(container_id)
-    #
-    #     if cached:
-    #         return {"found": True, "html_content": cached.raw_html, "container_id": container_id}
-
-    #
-    # except Exception as e:
-    #     activity.logger.error(f"Failed checking cached html: {str(e)}")
-    #     raise
-    # finally:
-    #     if db:
-    #         await db.close()
-
-# Caching Removed for now. It can be further used for faster retreival from scraping
-    return {"found": False, "container_id": container_id}
-
-
-@activity.defn(name="init_browser")  # Explicitly set activity name
-async def init_browser() -> Dict[str, Any]:
-    activity.logger.info("Activity: Initializing browser")
-
-    try:
-        scraper = DummyScraper()
-        await scraper.initialize()
-
-        session_id = scraper.get_session_id()
 
-        activity.logger.info(f"Browser initialized with session: {session_id}")
+class ParseActivities:
+    """CPU-bound parsing and validation activities sharing one parser."""
 
-        return {
-            "session_id": session_id,
-            "status": "initialized"
-        }
+    def __init__(self):
+        self.parser = ContainerParser()
 
-    except Exception as e:
-        activity.logger.error(f"Browser initialization failed: {str(e)}")
-        raise
+    async def startup(self):
+        pass
 
+    async def shutdown(self):
+        pass
 
-@activity.defn(name="search_container")  # Explicitly set activity name
-async def search_container(
-        browser_session: Dict[str, Any],
-        container_id: str
-) -> Dict[str, Any]:
-    activity.logger.info(f"Activity: Searching container {container_id}")
+    def get_activities(self) -> List[Callable]:
+        return [self.extract_data, self.validate_data]
 
-    scraper = None
-    try:
-        scraper = DummyScraper()
-        await scraper.initialize()
+    @activity.defn(name="extract_data")
+    async def extract_data(
+            self,
+            search_result: Dict[str, Any],
+            operation: str
+    ) -> Dict[str, Any]:
+        """Extract data from HTML content"""
+        activity.logger.info(f"Activity: Extracting data for operation: {operation}")
 
-        html_content = await scraper.search_container(container_id)
+        try:
+            html_content = search_result["html_content"]
+            container_id = search_result["container_id"]
 
-        activity.logger.info(f"Search completed for {container_id}")
+            data = self.parser.parse(html_content, operation)
 
-        return {
-            "container_id": container_id,
-            "html_content": html_content,
-            "status": "found"
-        }
+            activity.logger.info(f"Data extracted for {container_id}")
 
-    except Exception as e:
-        activity.logger.error(f"Container search failed: {str(e)}")
-        raise
-    finally:
-        if scraper:
-            await scraper.close()
+            return data
 
+        except Exception as e:
+            activity.logger.error(f"Data extraction failed: {str(e)}")
+            raise
 
-@activity.defn(name="extract_data")
-async def extract_data(
-        search_result: Dict[str, Any],
-        operation: str
-) -> Dict[str, Any]:
-    """Extract data from HTML content"""
-    activity.logger.info(f"Activity: Extracting data for operation: {operation}")
+    @activity.defn(name="validate_data")
+    async def validate_data(
+            self,
+            data: Dict[str, Any],
+            container_id: str
+    ) -> Dict[str, Any]:
+        activity.logger.info(f"Activity: Validating data for {container_id}")
 
-    try:
-        html_content = search_result["html_content"]
-        container_id = search_result["container_id"]
+        try:
+            required_fields = ["container_number", "status"]
 
-        parser = ContainerParser()
-        data = parser.parse(html_content, operation)
+            for field in required_fields:
+                if field not in data:
+                    raise ValueError(f"Missing required field: {field}")
 
-        activity.logger.info(f"Data extracted for {container_id}")
+            if data["container_number"] != container_id:
+                raise ValueError("Container number mismatch")
 
-        return data
+            activity.logger.info(f"Data validated for {container_id}")
 
-    except Exception as e:
-        activity.logger.error(f"Data extraction failed: {str(e)}")
-        raise
+            return data
 
+        except Exception as e:
+            activity.logger.error(f"Data validation failed: {str(e)}")
+            raise
 
-@activity.defn(name="validate_data")
-async def validate_data(
-        data: Dict[str, Any],
-        container_id: str
-) -> Dict[str, Any]:
-    activity.logger.info(f"Activity: Validating data for {container_id}")
 
-    try:
-        required_fields = ["container_number", "status"]
+class StorageActivities:
+    """Database and cache activities sharing one engine, session maker and
+    Redis connection per worker. The DB pool is sized to the worker's
+    activity concurrency so each slot can hold a connection."""
 
-        for field in required_fields:
-            if field not in data:
-                raise ValueError(f"Missing required field: {field}")
+    def __init__(self, pool_size: int):
+        self.pool_size = pool_size
+        self.engine = build_engine(pool_size=pool_size, max_overflow=0)
+        self.session_maker = build_session_maker(self.engine)
+        self.cache = CacheManager()
+        self.scrape_cache = ScrapeResultCache(self.cache)
 
-        if data["container_number"] != container_id:
-            raise ValueError("Container number mismatch")
+    async def startup(self):
+        await self.cache.connect()
+        metrics.set_gauge("worker_db_pool_size", self.pool_size)
+        logger.info(f"Storage activities started with DB pool size {self.pool_size}")
 
-        activity.logger.info(f"Data validated for {container_id}")
+    async def shutdown(self):
+        await self.cache.disconnect()
+        await self.engine.dispose()
+        logger.info("Storage activities shut down")
 
-        return data
+    def get_activities(self) -> List[Callable]:
+        return [self.check_cached_html, self.store_raw_html, self.store_data]
 
-    except Exception as e:
-        activity.logger.error(f"Data validation failed: {str(e)}")
-        raise
+    def _record_pool_usage(self):
+        metrics.set_gauge("worker_db_pool_checked_out", self.engine.pool.checkedout())
 
+    @activity.defn(name="check_cached_html")
+    async def check_cached_html(self, container_id: str, operation: str = "get_full_info") -> Dict[str, Any]:
+        activity.logger.info(f"Checking cached html for {container_id}")
 
+        try:
+            async with self.session_maker() as db:
+                self._record_pool_usage()
+                cached = await self.scrape_cache.lookup(db, container_id, operation)
 
-@activity.defn(name="store_data")
-async def store_data(
-        data: Dict[str, Any],
-        container_id: str
-) -> bool:
-    activity.logger.info(f"Activity: Storing data for {container_id}")
+            if cached:
+                activity.logger.info(
+                    f"Serving {container_id} from {cached.source} cache, age {cached.age_seconds}s"
+                )
+                return cached.to_dict()
 
-    db = None
-    try:
-        db_gen = get_db()
-        db = await anext(db_gen)
+            return {"found": False, "container_id": container_id}
 
-        # repo_factory = RepositoryFactory()
-        # container_repo = repo_factory.get_container_repository(db)
-        #
-        # # await container_repo.upsert(
-        # #     container_number=container_id,
-        # #     data=data,
-        # #     source="PNCT"
-        # # )
+        except Exception as e:
+            # A broken cache must never block a fresh scrape
+            activity.logger.error(f"Failed checking cached html: {str(e)}")
+            return {"found": False, "container_id": container_id}
 
-        await db.commit()
+    @activity.defn(name="store_data")
+    async def store_data(
+            self,
+            data: Dict[str, Any],
+            container_id: str,
+            operation: Optional[str] = None
+    ) -> bool:
+        activity.logger.info(f"Activity: Storing data for {container_id}")
 
-        activity.logger.info(f"Data stored for {container_id}")
+        async with self.session_maker() as db:
+            try:
+                self._record_pool_usage()
 
-        return True
+                state = await self.scrape_cache.record_state(db, container_id, data, operation)
+                activity.logger.info(f"Recorded state '{state}' for {container_id}")
 
-    except Exception as e:
-        if db:
-            await db.rollback()
-        activity.logger.error(f"Data storage failed: {str(e)}")
-        raise
-    finally:
-        if db:
-            await db.close()
+                # container_repo = RepositoryFactory.get_container_repository(db)
+                #
+                # # await container_repo.upsert(
+                # #     container_number=container_id,
+                # #     data=data,
+                # #     source="PNCT"
+                # # )
+
+                await db.commit()
 
-@activity.defn(name="store_raw_html")
-async def store_raw_html(container_id: str, html_content: str) -> bool:
-    activity.logger.info(f"Storing raw html for {container_id}")
+                activity.logger.info(f"Data stored for {container_id}")
 
-    db = None
-    try:
-        db_gen = get_db()
-        db = await anext(db_gen)
+                return True
 
-        repo_factory = RepositoryFactory()
-        container_scraper_repo = repo_factory.get_container_scraper_repository(db)
+            except Exception as e:
+                await db.rollback()
+                activity.logger.error(f"Data storage failed: {str(e)}")
+                raise
 
-        await container_scraper_repo.upsert(container_id,"" ,html_content,None,"success","")
-        await db.commit()
+    @activity.defn(name="store_raw_html")
+    async def store_raw_html(self, container_id: str, html_content: str) -> bool:
+        activity.logger.info(f"Storing raw html for {container_id}")
 
-        return True
+        async with self.session_maker() as db:
+            try:
+                self._record_pool_usage()
 
-    except Exception as e:
-        if db:
-            await db.rollback()
-        activity.logger.error(f"Raw html storage failed: {str(e)}")
-        raise
-    finally:
-        if db:
-            await db.close()
+                await self.scrape_cache.store_html(db, container_id, html_content)
+                await db.commit()
+
+                return True
+
+            except Exception as e:
+                await db.rollback()
+                activity.logger.error(f"Raw html storage failed: {str(e)}")
+                raise
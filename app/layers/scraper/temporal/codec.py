@@ -0,0 +1,156 @@
+import dataclasses
+import zlib
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import temporalio.converter
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import DataConverter, PayloadCodec
+
+from app.shared.config.settings.base import get_settings
+from app.shared.utils.logger import get_logger
+from app.shared.utils.metrics import get_metrics
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+settings = get_settings()
+logger = get_logger(__name__)
+metrics = get_metrics()
+
+ENCODING_KEY = "encoding"
+
+# Every encoding the codec can write, whether or not its library is
+# installed here
+COMPRESSED_ENCODINGS = {b"binary/zlib", b"binary/zstd"}
+
+Compressor = Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]
+
+
+def _zlib_compressor(level: int) -> Compressor:
+    return (
+        lambda data: zlib.compress(data, level),
+        zlib.decompress,
+    )
+
+
+def _zstd_compressor(level: int) -> Compressor:
+    compressor = zstandard.ZstdCompressor(level=level)
+    decompressor = zstandard.ZstdDecompressor()
+    return compressor.compress, decompressor.decompress
+
+
+COMPRESSORS: Dict[str, Callable[[int], Compressor]] = {
+    "zlib": _zlib_compressor,
+}
+
+if zstandard is not None:
+    COMPRESSORS["zstd"] = _zstd_compressor
+
+
+class CompressionCodec(PayloadCodec):
+    """Compresses payloads above a size threshold.
+
+    Payloads without a compression encoding are passed through on decode,
+    so histories written before the codec was enabled stay readable. A
+    compressed payload this worker cannot decompress raises instead.
+    """
+
+    def __init__(self, algorithm: str = "zlib", threshold: int = 1024, level: int = 6):
+        if algorithm == "zstd" and zstandard is None:
+            raise ValueError("zstd payload compression needs the zstandard package (the 'zstd' extra)")
+
+        if algorithm not in COMPRESSORS:
+            raise ValueError(f"Unsupported payload compression: {algorithm}")
+
+        self.algorithm = algorithm
+        self.threshold = threshold
+        self.encoding = f"binary/{algorithm}".encode()
+        self._compress, _ = COMPRESSORS[algorithm](level)
+
+        # Decoders for every available algorithm, so a worker can read
+        # payloads written by a client configured with another algorithm.
+        self._decoders = {
+            f"binary/{name}".encode(): factory(level)[1]
+            for name, factory in COMPRESSORS.items()
+        }
+
+    async def encode(self, payloads: Sequence[Payload]) -> List[Payload]:
+        encoded = []
+
+        for payload in payloads:
+            data = payload.SerializeToString()
+
+            if len(data) < self.threshold:
+                encoded.append(payload)
+                continue
+
+            compressed = self._compress(data)
+
+            if len(compressed) >= len(data):
+                encoded.append(payload)
+                continue
+
+            metrics.increment("temporal_codec_bytes_in", len(data), algorithm=self.algorithm)
+            metrics.increment("temporal_codec_bytes_out", len(compressed), algorithm=self.algorithm)
+            metrics.observe(
+                "temporal_codec_compression_ratio",
+                round(len(data) / len(compressed), 2),
+                algorithm=self.algorithm,
+            )
+            logger.debug(
+                "Payload compressed",
+                algorithm=self.algorithm,
+                original_bytes=len(data),
+                compressed_bytes=len(compressed),
+            )
+
+            encoded.append(Payload(metadata={ENCODING_KEY: self.encoding}, data=compressed))
+
+        return encoded
+
+    async def decode(self, payloads: Sequence[Payload]) -> List[Payload]:
+        decoded = []
+
+        for payload in payloads:
+            encoding = payload.metadata.get(ENCODING_KEY, b"")
+            decompress = self._decoders.get(encoding)
+
+            if decompress is None:
+                # Passing a compressed payload on would hand the converter
+                # garbage; fail the task so a capable worker can pick it up.
+                if encoding in COMPRESSED_ENCODINGS:
+                    raise ValueError(
+                        f"Cannot decode payload with encoding {encoding.decode()}; "
+                        f"is the compression library installed on this worker?"
+                    )
+
+                decoded.append(payload)
+                continue
+
+            decoded.append(Payload.FromString(decompress(payload.data)))
+
+        return decoded
+
+
+def get_payload_codec() -> Optional[PayloadCodec]:
+    algorithm = settings.TEMPORAL_PAYLOAD_CODEC.lower()
+
+    if algorithm == "none":
+        return None
+
+    # An unavailable codec fails startup: falling back would write payloads
+    # in an encoding the rest of the deployment does not expect
+    return CompressionCodec(
+        algorithm=algorithm,
+        threshold=settings.TEMPORAL_PAYLOAD_COMPRESSION_THRESHOLD,
+        level=settings.TEMPORAL_PAYLOAD_COMPRESSION_LEVEL,
+    )
+
+
+def get_data_converter() -> DataConverter:
+    return dataclasses.replace(
+        temporalio.converter.default(),
+        payload_codec=get_payload_codec(),
+    )
@@ -1,3 +1,6 @@
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
 from app.shared.config.settings.base import get_settings
 
 settings = get_settings()
@@ -6,3 +9,67 @@ TEMPORAL_HOST = settings.TEMPORAL_HOST
 TEMPORAL_PORT = settings.TEMPORAL_PORT
 TEMPORAL_NAMESPACE = settings.TEMPORAL_NAMESPACE
 TEMPORAL_TASK_QUEUE = settings.TEMPORAL_TASK_QUEUE
+TEMPORAL_BROWSER_TASK_QUEUE = settings.TEMPORAL_BROWSER_TASK_QUEUE
+TEMPORAL_PARSE_TASK_QUEUE = settings.TEMPORAL_PARSE_TASK_QUEUE
+TEMPORAL_STORAGE_TASK_QUEUE = settings.TEMPORAL_STORAGE_TASK_QUEUE
+
+
+@dataclass(frozen=True)
+class WorkerProfile:
+    name: str
+    task_queue: str
+    run_workflows: bool = False
+    max_concurrent_activities: int = 0
+    max_concurrent_workflow_tasks: int = 0
+
+
+WORKER_PROFILES: Dict[str, WorkerProfile] = {
+    "workflow": WorkerProfile(
+        name="workflow",
+        task_queue=TEMPORAL_TASK_QUEUE,
+        run_workflows=True,
+        max_concurrent_workflow_tasks=settings.WORKER_MAX_CONCURRENT_WORKFLOW_TASKS,
+    ),
+    "browser": WorkerProfile(
+        name="browser",
+        task_queue=TEMPORAL_BROWSER_TASK_QUEUE,
+        max_concurrent_activities=settings.WORKER_BROWSER_MAX_CONCURRENT_ACTIVITIES,
+    ),
+    "parse": WorkerProfile(
+        name="parse",
+        task_queue=TEMPORAL_PARSE_TASK_QUEUE,
+        max_concurrent_activities=settings.WORKER_PARSE_MAX_CONCURRENT_ACTIVITIES,
+    ),
+    "storage": WorkerProfile(
+        name="storage",
+        task_queue=TEMPORAL_STORAGE_TASK_QUEUE,
+        max_concurrent_activities=settings.WORKER_STORAGE_MAX_CONCURRENT_ACTIVITIES,
+    ),
+}
+
+# Task queue each activity is scheduled on by the workflow
+ACTIVITY_TASK_QUEUES: Dict[str, str] = {
+    "check_cached_html": TEMPORAL_STORAGE_TASK_QUEUE,
+    "init_browser": TEMPORAL_BROWSER_TASK_QUEUE,
+    "search_container": TEMPORAL_BROWSER_TASK_QUEUE,
+    "store_raw_html": TEMPORAL_STORAGE_TASK_QUEUE,
+    "extract_data": TEMPORAL_PARSE_TASK_QUEUE,
+    "validate_data": TEMPORAL_PARSE_TASK_QUEUE,
+    "store_data": TEMPORAL_STORAGE_TASK_QUEUE,
+    "scrape_containers_batch": TEMPORAL_BROWSER_TASK_QUEUE,
+}
+
+BATCH_CHUNK_SIZE = settings.BATCH_CHUNK_SIZE
+BATCH_HEARTBEAT_TIMEOUT_SECONDS = settings.BATCH_HEARTBEAT_TIMEOUT_SECONDS
+
+# Deterministic modules the workflow sandbox may share with the host
+# instead of re-importing them for every workflow run. The workflow module
+# itself must only import from these and temporalio.
+WORKFLOW_PASSTHROUGH_MODULES: Tuple[str, ...] = (
+    "app.layers.scraper.temporal.config",
+    "app.shared.config",
+    "pydantic",
+    "pydantic_core",
+    "pydantic_settings",
+    "dotenv",
+)
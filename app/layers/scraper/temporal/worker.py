@@ -1,57 +1,159 @@
+import argparse
 import asyncio
+from typing import Any, Callable, Dict, List, Optional
+
 from temporalio.client import Client
-from temporalio.worker import Worker
+from temporalio.worker import Worker, UnsandboxedWorkflowRunner, WorkflowRunner
+from temporalio.worker.workflow_sandbox import SandboxedWorkflowRunner, SandboxRestrictions
 
 from app.layers.scraper.temporal.config import (
     TEMPORAL_HOST,
     TEMPORAL_PORT,
     TEMPORAL_NAMESPACE,
-    TEMPORAL_TASK_QUEUE
+    WORKER_PROFILES,
+    WORKFLOW_PASSTHROUGH_MODULES,
+    WorkerProfile,
 )
+from app.layers.scraper.temporal.codec import get_data_converter
 from app.layers.scraper.temporal.workflows.container_workflow import (
     ContainerScraperWorkflow
 )
-from app.layers.scraper.temporal.activities.scraping_activities import (
-    init_browser,
-    search_container,
-    extract_data,
-    validate_data,
-    store_data, check_cached_html, store_raw_html,
-)
+from app.layers.scraper.temporal.workflows.batch_workflow import ContainerBatchWorkflow
+from app.shared.config.settings.base import get_settings
 from app.shared.utils.logger import get_logger
 
+settings = get_settings()
 logger = get_logger(__name__)
 
 
-async def main():
+# Activity modules pull in Playwright, SQLAlchemy and BeautifulSoup, so they
+# are imported only by the profiles that run them. A workflow-only worker
+# never loads them.
+
+def _browser_activities(profile: WorkerProfile):
+    from app.layers.scraper.temporal.activities.scraping_activities import BrowserActivities
+    return BrowserActivities(pool_size=profile.max_concurrent_activities)
+
+
+def _parse_activities(profile: WorkerProfile):
+    from app.layers.scraper.temporal.activities.scraping_activities import ParseActivities
+    return ParseActivities()
+
+
+def _storage_activities(profile: WorkerProfile):
+    from app.layers.scraper.temporal.activities.scraping_activities import StorageActivities
+    return StorageActivities(pool_size=profile.max_concurrent_activities)
+
+
+# Worker-scoped activity classes per profile, created once per worker
+PROFILE_ACTIVITIES: Dict[str, Optional[Callable[[WorkerProfile], Any]]] = {
+    "workflow": None,
+    "browser": _browser_activities,
+    "parse": _parse_activities,
+    "storage": _storage_activities,
+}
+
+
+def resolve_profiles(value: str) -> List[WorkerProfile]:
+    names = [name.strip() for name in value.split(",") if name.strip()]
+
+    if not names or "all" in names:
+        return list(WORKER_PROFILES.values())
+
+    unknown = [name for name in names if name not in WORKER_PROFILES]
+    if unknown:
+        raise ValueError(
+            f"Unknown worker profile(s): {', '.join(unknown)}. "
+            f"Available: all, {', '.join(WORKER_PROFILES)}"
+        )
+
+    return [WORKER_PROFILES[name] for name in names]
+
+
+def build_workflow_runner(sandboxed: bool = settings.WORKER_WORKFLOW_SANDBOX_ENABLED) -> WorkflowRunner:
+    if not sandboxed:
+        logger.warning("Workflow sandbox disabled, workflows run unsandboxed")
+        return UnsandboxedWorkflowRunner()
+
+    return SandboxedWorkflowRunner(
+        restrictions=SandboxRestrictions.default.with_passthrough_modules(
+            *WORKFLOW_PASSTHROUGH_MODULES
+        )
+    )
+
+
+def build_worker(
+        client: Client,
+        profile: WorkerProfile,
+        activities: Any,
+        workflow_runner: Optional[WorkflowRunner] = None
+) -> Worker:
+    options = {}
+    if profile.max_concurrent_activities:
+        options["max_concurrent_activities"] = profile.max_concurrent_activities
+    if profile.max_concurrent_workflow_tasks:
+        options["max_concurrent_workflow_tasks"] = profile.max_concurrent_workflow_tasks
+
+    logger.info(
+        "Configuring worker profile",
+        profile=profile.name,
+        task_queue=profile.task_queue,
+        **options,
+    )
+
+    return Worker(
+        client,
+        task_queue=profile.task_queue,
+        workflows=[ContainerScraperWorkflow, ContainerBatchWorkflow] if profile.run_workflows else [],
+        activities=activities.get_activities() if activities else [],
+        workflow_runner=workflow_runner or build_workflow_runner(),
+        **options,
+    )
+
+
+async def main(profiles: str = settings.WORKER_PROFILES):
     logger.info("🕷️  Starting Temporal worker (Layer 5: Scraper)")
-    logger.info(f"Task queue: {TEMPORAL_TASK_QUEUE}")
+
+    selected = resolve_profiles(profiles)
+    logger.info(f"Worker profiles: {[profile.name for profile in selected]}")
 
     client = await Client.connect(
         f"{TEMPORAL_HOST}:{TEMPORAL_PORT}",
         namespace=TEMPORAL_NAMESPACE,
+        data_converter=get_data_converter(),
     )
 
-    worker = Worker(
-        client,
-        task_queue=TEMPORAL_TASK_QUEUE,
-        workflows=[ContainerScraperWorkflow],
-        activities=[
-            check_cached_html,
-            init_browser,
-            search_container,
-            store_raw_html,
-            extract_data,
-            validate_data,
-            store_data,
-        ]
+    resources = {}
+    for profile in selected:
+        factory = PROFILE_ACTIVITIES[profile.name]
+        resources[profile.name] = factory(profile) if factory else None
 
-    )
+    try:
+        for instance in resources.values():
+            if instance is not None:
+                await instance.startup()
+
+        workers = [build_worker(client, profile, resources[profile.name]) for profile in selected]
 
-    logger.info("✅ Worker started successfully")
+        logger.info("✅ Worker started successfully")
 
-    await worker.run()
+        await asyncio.gather(*(worker.run() for worker in workers))
+
+    finally:
+        for instance in resources.values():
+            if instance is not None:
+                await instance.shutdown()
+
+        logger.info("Worker resources released")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="PNCT Temporal worker")
+    parser.add_argument(
+        "--profile",
+        default=settings.WORKER_PROFILES,
+        help="Comma separated worker profiles: all, workflow, browser, parse, storage",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(main(args.profile))
@@ -0,0 +1,90 @@
+import asyncio
+from datetime import timedelta
+from temporalio import workflow
+from temporalio.common import RetryPolicy
+from typing import Dict, Any, List
+
+with workflow.unsafe.imports_passed_through():
+    from app.layers.scraper.temporal.config import (
+        ACTIVITY_TASK_QUEUES,
+        BATCH_CHUNK_SIZE,
+        BATCH_HEARTBEAT_TIMEOUT_SECONDS,
+        TEMPORAL_TASK_QUEUE,
+    )
+
+from app.layers.scraper.temporal.workflows.container_workflow import ContainerScraperWorkflow
+
+
+@workflow.defn
+class ContainerBatchWorkflow:
+
+    @workflow.run
+    async def run(
+            self,
+            container_ids: List[str],
+            operation: str = "get_full_info",
+            chunk_size: int = BATCH_CHUNK_SIZE
+    ) -> Dict[str, Any]:
+        container_ids = list(dict.fromkeys(container_ids))
+
+        workflow.logger.info(f"Starting batch workflow for {len(container_ids)} containers")
+
+        # Heartbeat timeout detects dead workers within seconds; the retry
+        # resumes from the heartbeat checkpoint, so a generous start-to-close
+        # timeout only bounds a single healthy attempt.
+        scrape = await workflow.execute_activity(
+            "scrape_containers_batch",
+            task_queue=ACTIVITY_TASK_QUEUES["scrape_containers_batch"],
+            args=[container_ids, operation, chunk_size],
+            start_to_close_timeout=timedelta(minutes=60),
+            heartbeat_timeout=timedelta(seconds=BATCH_HEARTBEAT_TIMEOUT_SECONDS),
+            retry_policy=RetryPolicy(
+                initial_interval=timedelta(seconds=1),
+                maximum_interval=timedelta(seconds=10),
+                maximum_attempts=5,
+                backoff_coefficient=2.0,
+            ),
+        )
+
+        # The pages now sit in the scrape cache, so every container goes
+        # through the same cache, extract, validate and store steps as a
+        # single lookup. Containers the batch failed on scrape on their own.
+        results: Dict[str, Any] = {}
+        errors: Dict[str, str] = {}
+
+        for start in range(0, len(container_ids), chunk_size):
+            chunk = container_ids[start:start + chunk_size]
+
+            outcomes = await asyncio.gather(
+                *(
+                    workflow.execute_child_workflow(
+                        ContainerScraperWorkflow.run,
+                        args=[container_id, operation, False],
+                        id=f"{workflow.info().workflow_id}-{container_id}",
+                        task_queue=TEMPORAL_TASK_QUEUE,
+                    )
+                    for container_id in chunk
+                ),
+                return_exceptions=True
+            )
+
+            for container_id, outcome in zip(chunk, outcomes):
+                if isinstance(outcome, BaseException):
+                    errors[container_id] = str(outcome)
+                elif outcome.get("status") != "success":
+                    errors[container_id] = outcome.get("error", "failed")
+                else:
+                    results[container_id] = outcome["data"]
+
+        workflow.logger.info(
+            f"Batch workflow completed: {len(results)} succeeded, {len(errors)} failed"
+        )
+
+        return {
+            "status": "success" if not errors else "partial_success" if results else "failed",
+            "operation": operation,
+            "results": results,
+            "errors": errors,
+            "chunks": scrape["chunks"],
+            "resumed_from_chunk": scrape["resumed_from_chunk"],
+        }
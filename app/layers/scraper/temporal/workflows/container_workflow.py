@@ -1,18 +1,102 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
 from temporalio import workflow
 from temporalio.common import RetryPolicy
-from typing import Dict, Any
+from temporalio.exceptions import is_cancelled_exception
+from typing import Dict, Any, List, Optional
 
+with workflow.unsafe.imports_passed_through():
+    from app.layers.scraper.temporal.config import ACTIVITY_TASK_QUEUES
+    from app.shared.config.constants.app_constants import (
+        ProcessingStep,
+        StepStatus,
+        WORKFLOW_STEPS,
+    )
 
 
 @workflow.defn
 class ContainerScraperWorkflow:
 
+    def __init__(self):
+        self._events: List[Dict[str, Any]] = []
+        self._current_step: Optional[str] = None
+        self._finished_steps = 0
+        self._completed = False
+        self._timings: Dict[str, int] = {}
+
+    @workflow.query
+    def get_progress(self) -> Dict[str, Any]:
+        return {
+            "current_step": self._current_step,
+            "progress": self._progress(),
+            "completed": self._completed,
+            "events": self._events,
+            "timings": self._timings,
+        }
+
+    def _elapsed_ms(self, since: datetime) -> int:
+        return int((workflow.now() - since).total_seconds() * 1000)
+
+    def _progress(self) -> int:
+        return int(self._finished_steps * 100 / len(WORKFLOW_STEPS))
+
+    def _record_step(self, step: ProcessingStep, status: StepStatus, message: Optional[str] = None):
+        if status == StepStatus.IN_PROGRESS:
+            self._current_step = step.value
+        else:
+            self._finished_steps += 1
+
+        self._events.append({
+            "step": step.value,
+            "status": status.value,
+            "message": message,
+            "progress": self._progress(),
+            "timestamp": workflow.now().isoformat(),
+        })
+
+    async def _execute_step(
+            self,
+            step: ProcessingStep,
+            activity: str,
+            args: List[Any],
+            timeout: timedelta,
+            retry_policy: RetryPolicy
+    ) -> Any:
+        self._record_step(step, StepStatus.IN_PROGRESS)
+
+        # Taken as the first activity is scheduled, so it covers the hop from
+        # start to runnable work and not the activity's own runtime
+        if "start_to_first_activity_ms" not in self._timings:
+            self._timings["start_to_first_activity_ms"] = self._elapsed_ms(workflow.info().workflow_start_time)
+
+        try:
+            result = await workflow.execute_activity(
+                activity,
+                task_queue=ACTIVITY_TASK_QUEUES[activity],
+                args=args,
+                start_to_close_timeout=timeout,
+                retry_policy=retry_policy,
+            )
+        except Exception as e:
+            self._record_step(step, StepStatus.FAILED, str(e))
+            raise
+
+        self._record_step(step, StepStatus.COMPLETED)
+        return result
+
     @workflow.run
-    async def run(self, container_id: str, operation: str = "get_full_info") -> Dict[str, Any]:
+    async def run(
+            self,
+            container_id: str,
+            operation: str = "get_full_info",
+            force_refresh: bool = False
+    ) -> Dict[str, Any]:
 
         workflow.logger.info(f"Starting workflow for {container_id}, operation: {operation}")
 
+        # workflow.now() is the start time of the current workflow task, so on
+        # the first task this measures how long the workflow waited in queue.
+        self._timings["queue_to_start_ms"] = self._elapsed_ms(workflow.info().workflow_start_time)
+
         retry_policy = RetryPolicy(
             initial_interval=timedelta(seconds=1),
             maximum_interval=timedelta(seconds=10),
@@ -20,13 +104,20 @@ class ContainerScraperWorkflow:
             backoff_coefficient=2.0,
         )
 
+        cache_info = {"hit": False}
+
         try:
-            cached = await workflow.execute_activity(
-                "check_cached_html",
-                args=[container_id],
-                start_to_close_timeout=timedelta(seconds=10),
-                retry_policy=retry_policy,
-            )
+            cached = {"found": False}
+            if force_refresh:
+                self._record_step(ProcessingStep.CHECK_CACHE, StepStatus.SKIPPED, "Force refresh requested")
+            else:
+                cached = await self._execute_step(
+                    ProcessingStep.CHECK_CACHE,
+                    "check_cached_html",
+                    args=[container_id, operation],
+                    timeout=timedelta(seconds=10),
+                    retry_policy=retry_policy,
+                )
 
             if cached.get("found"):
                 workflow.logger.info(f"Cached html found for {container_id}")
@@ -35,54 +126,83 @@ class ContainerScraperWorkflow:
                     "html_content": cached["html_content"],
                     "status": "cached"
                 }
+                cache_info = {
+                    "hit": True,
+                    "source": cached.get("source"),
+                    "age_seconds": cached.get("age_seconds"),
+                    "scraped_at": cached.get("scraped_at"),
+                }
+
+                for step in (ProcessingStep.INIT_BROWSER, ProcessingStep.SEARCH_CONTAINER):
+                    self._record_step(step, StepStatus.SKIPPED, "Served from cache")
+
+                # Batch scrapes cache pages in Redis only; persist them here
+                if cached.get("persisted", True):
+                    self._record_step(ProcessingStep.STORE_RAW_HTML, StepStatus.SKIPPED, "Served from cache")
+                else:
+                    await self._execute_step(
+                        ProcessingStep.STORE_RAW_HTML,
+                        "store_raw_html",
+                        args=[container_id, cached["html_content"]],
+                        timeout=timedelta(seconds=20),
+                        retry_policy=retry_policy,
+                    )
 
             else:
-                browser_session = await workflow.execute_activity(
+                browser_session = await self._execute_step(
+                    ProcessingStep.INIT_BROWSER,
                     "init_browser",
-                    start_to_close_timeout=timedelta(seconds=30),
+                    args=[],
+                    timeout=timedelta(seconds=30),
                     retry_policy=retry_policy,
                 )
 
                 workflow.logger.info("Browser initialized")
 
-                search_result = await workflow.execute_activity(
+                search_result = await self._execute_step(
+                    ProcessingStep.SEARCH_CONTAINER,
                     "search_container",
                     args=[browser_session, container_id],
-                    start_to_close_timeout=timedelta(seconds=45),
+                    timeout=timedelta(seconds=45),
                     retry_policy=retry_policy,
                 )
 
                 workflow.logger.info("Container search completed")
+                cache_info["scraped_at"] = workflow.now().timestamp()
 
-                await workflow.execute_activity(
+                await self._execute_step(
+                    ProcessingStep.STORE_RAW_HTML,
                     "store_raw_html",
                     args=[container_id, search_result["html_content"]],
-                    start_to_close_timeout=timedelta(seconds=20),
+                    timeout=timedelta(seconds=20),
                     retry_policy=retry_policy,
                 )
 
-            extracted_data = await workflow.execute_activity(
+            extracted_data = await self._execute_step(
+                ProcessingStep.EXTRACT_DATA,
                 "extract_data",
                 args=[search_result, operation],
-                start_to_close_timeout=timedelta(seconds=30),
+                timeout=timedelta(seconds=30),
                 retry_policy=retry_policy,
             )
 
             workflow.logger.info("Data extracted")
 
-            validated_data = await workflow.execute_activity(
+            validated_data = await self._execute_step(
+                ProcessingStep.VALIDATE_DATA,
                 "validate_data",
                 args=[extracted_data, container_id],
-                start_to_close_timeout=timedelta(seconds=10),
+                timeout=timedelta(seconds=10),
                 retry_policy=retry_policy,
             )
 
             workflow.logger.info("Data validated")
 
-            await workflow.execute_activity(
+            await self._execute_step(
+                ProcessingStep.STORE_DATA,
                 "store_data",
-                args=[validated_data, container_id],
-                start_to_close_timeout=timedelta(seconds=20),
+                args=[validated_data, container_id, operation],
+                timeout=timedelta(seconds=20),
                 retry_policy=retry_policy,
             )
 
@@ -92,14 +212,24 @@ class ContainerScraperWorkflow:
                 "status": "success",
                 "container_id": container_id,
                 "data": validated_data,
-                "operation": operation
+                "operation": operation,
+                "cache": cache_info,
+                "timings": self._timings
             }
 
         except Exception as e:
+            if is_cancelled_exception(e):
+                workflow.logger.info(f"Workflow cancelled for {container_id}")
+                raise
+
             workflow.logger.error(f"Workflow failed: {str(e)}")
             return {
                 "status": "failed",
                 "container_id": container_id,
                 "error": str(e),
-                "operation": operation
+                "operation": operation,
+                "timings": self._timings
             }
+
+        finally:
+            self._completed = True
@@ -9,6 +9,37 @@ class QueryIntent(str, Enum):
     GET_LAST_FREE_DAY = "get_lfd"
 
 
+# Tool answering each intent, used when the query is resolved without the LLM
+INTENT_TOOLS = {
+    QueryIntent.GET_INFO: "get_container_info",
+    QueryIntent.CHECK_AVAILABILITY: "check_container_availability",
+    QueryIntent.GET_LOCATION: "get_container_location",
+    QueryIntent.CHECK_HOLDS: "check_container_holds",
+    QueryIntent.GET_LAST_FREE_DAY: "get_last_free_day",
+}
+
+# Scraper operation behind each intent
+INTENT_OPERATIONS = {
+    QueryIntent.GET_INFO: "get_full_info",
+    QueryIntent.CHECK_AVAILABILITY: "check_availability",
+    QueryIntent.GET_LOCATION: "get_location",
+    QueryIntent.CHECK_HOLDS: "check_holds",
+    QueryIntent.GET_LAST_FREE_DAY: "get_lfd",
+}
+
+
+class LLMPriority(str, Enum):
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+
+# Queue order of LLM runs waiting for a slot, lowest first
+LLM_PRIORITY_ORDER = {
+    LLMPriority.INTERACTIVE: 0,
+    LLMPriority.BATCH: 1,
+}
+
+
 class WorkflowStatus(str, Enum):
     PENDING = "pending"
     RUNNING = "running"
@@ -32,9 +63,34 @@ class ProcessingStep(str, Enum):
     CLASSIFY_INTENT = "classify_intent"
     SELECT_TOOL = "select_tool"
     TRIGGER_WORKFLOW = "trigger_workflow"
+    CHECK_CACHE = "check_cache"
     INIT_BROWSER = "init_browser"
     SEARCH_CONTAINER = "search_container"
+    STORE_RAW_HTML = "store_raw_html"
     EXTRACT_DATA = "extract_data"
     VALIDATE_DATA = "validate_data"
     STORE_DATA = "store_data"
-    FORMAT_RESPONSE = "format_response"
\ No newline at end of file
+    FORMAT_RESPONSE = "format_response"
+
+
+# Overall progress of a streamed query at each pipeline stage. Workflow
+# step progress is scaled into the band between TRIGGER_WORKFLOW and
+# FORMAT_RESPONSE.
+QUERY_STAGE_PROGRESS = {
+    ProcessingStep.VALIDATE_REQUEST: 5,
+    ProcessingStep.PARSE_QUERY: 15,
+    ProcessingStep.SELECT_TOOL: 25,
+    ProcessingStep.TRIGGER_WORKFLOW: 30,
+    ProcessingStep.FORMAT_RESPONSE: 95,
+}
+
+# Ordered steps executed inside ContainerScraperWorkflow, used for progress
+WORKFLOW_STEPS = [
+    ProcessingStep.CHECK_CACHE,
+    ProcessingStep.INIT_BROWSER,
+    ProcessingStep.SEARCH_CONTAINER,
+    ProcessingStep.STORE_RAW_HTML,
+    ProcessingStep.EXTRACT_DATA,
+    ProcessingStep.VALIDATE_DATA,
+    ProcessingStep.STORE_DATA,
+]
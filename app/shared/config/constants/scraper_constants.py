@@ -1,6 +1,29 @@
 
 CONTAINER_ID_PATTERN = r"^[A-Z]{4}\d{7}$"
 
+# ISO 6346 equipment category identifiers: freight container, detachable
+# freight container equipment, trailer or chassis
+CONTAINER_CATEGORY_IDENTIFIERS = "UJZ"
+
+RAW_HTML_OPERATION = "raw_html"
+
+# Maximum age (seconds) of a cached scrape, per requested operation
+CACHE_MAX_AGE_BY_OPERATION = {
+    "get_full_info": 300,
+    "check_availability": 120,
+    "get_location": 300,
+    "check_holds": 180,
+    "get_lfd": 3600,
+}
+
+# Maximum age (seconds) of a cached scrape, per last known container state.
+# The effective max age is the lower of the operation and state limits.
+CACHE_MAX_AGE_BY_STATE = {
+    "available": 120,
+    "on_hold": 600,
+    "unavailable": 300,
+}
+
 MAX_RETRIES = 3
 RETRY_DELAY = 2
 RETRY_BACKOFF = 2
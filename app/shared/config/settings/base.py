@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 from functools import lru_cache
 import os
 
@@ -25,14 +25,80 @@ class Settings(BaseSettings):
     REDIS_URL: str = "redis://localhost:6379/0"
     CACHE_TTL: int = 300
     CACHE_ENABLED: bool = True
+    SCRAPE_CACHE_ENABLED: bool = True
+    SCRAPE_CACHE_DEFAULT_MAX_AGE: int = 300
+    QUERY_CACHE_ENABLED: bool = True
+    QUERY_CACHE_STALE_SECONDS: int = 600
 
     TEMPORAL_HOST: str = "localhost"
     TEMPORAL_PORT: int = 7233
     TEMPORAL_NAMESPACE: str = "default"
     TEMPORAL_TASK_QUEUE: str = "pnct-container-tasks"
+    TEMPORAL_BROWSER_TASK_QUEUE: str = "pnct-browser-tasks"
+    TEMPORAL_PARSE_TASK_QUEUE: str = "pnct-parse-tasks"
+    TEMPORAL_STORAGE_TASK_QUEUE: str = "pnct-storage-tasks"
+    # Eager start only saves the first task round trip when the API process
+    # runs a workflow worker of its own (API_EMBEDDED_WORKFLOW_WORKER)
+    TEMPORAL_EAGER_WORKFLOW_START: bool = True
+    API_EMBEDDED_WORKFLOW_WORKER: bool = False
+    BATCH_CHUNK_SIZE: int = 10
+    BATCH_HEARTBEAT_TIMEOUT_SECONDS: int = 10
+    WORKFLOW_PROGRESS_POLL_INTERVAL: float = 0.25
+    JOB_RESULT_TTL: int = 3600
+    JOB_RESULT_MAX_WAIT_SECONDS: int = 30
+    TEMPORAL_PAYLOAD_CODEC: str = "zlib"
+    TEMPORAL_PAYLOAD_COMPRESSION_THRESHOLD: int = 1024
+    TEMPORAL_PAYLOAD_COMPRESSION_LEVEL: int = 6
+
+    WORKER_PROFILES: str = "all"
+    WORKER_MAX_CONCURRENT_WORKFLOW_TASKS: int = 100
+    WORKER_WORKFLOW_SANDBOX_ENABLED: bool = True
+    WORKER_BROWSER_MAX_CONCURRENT_ACTIVITIES: int = 4
+    WORKER_PARSE_MAX_CONCURRENT_ACTIVITIES: int = 8
+    WORKER_STORAGE_MAX_CONCURRENT_ACTIVITIES: int = 20
 
     GOOGLE_API_KEY: str = "your key"
 
+    AGENT_MAX_CONCURRENT_RUNS: int = 16
+    LLM_QUEUE_TIMEOUT_SECONDS: float = 10.0
+    LLM_RETRY_AFTER_SECONDS: int = 5
+    LLM_GOVERNOR_REDIS_ENABLED: bool = False
+    LLM_GLOBAL_MAX_CONCURRENT_RUNS: int = 64
+    LLM_LEASE_TTL_SECONDS: int = 30
+    LLM_LEASE_POLL_INTERVAL: float = 0.05
+    LLM_BACKEND: str = "gemini"
+    LLM_MODEL: str = "gemini-2.0-flash-exp"
+    LLM_FAST_MODEL: str = "gemini-2.0-flash-lite"
+    LLM_CASCADE_ENABLED: bool = True
+    LLM_CASCADE_CONFIDENCE_THRESHOLD: float = 0.7
+    LLM_CASCADE_MAX_WORDS: int = 25
+    LLM_HEDGE_ENABLED: bool = True
+    LLM_HEDGE_AFTER_MS: int = 2500
+    LLM_HEDGE_MIN_CONFIDENCE: float = 0.6
+    LLM_RESPONSE_CACHE_ENABLED: bool = True
+    LLM_RESPONSE_CACHE_TTL_SECONDS: int = 300
+    LLM_RESPONSE_CACHE_MAX_ENTRIES: int = 2048
+    LLM_RESPONSE_CACHE_MAX_ENTRY_BYTES: int = 16384
+    SCRIPTED_LLM_LATENCY_DISTRIBUTION: str = "lognormal"
+    SCRIPTED_LLM_LATENCY_MS: float = 400.0
+    SCRIPTED_LLM_FAST_LATENCY_MS: float = 150.0
+    SCRIPTED_LLM_LATENCY_JITTER_MS: float = 150.0
+    SCRIPTED_LLM_LATENCY_PER_TOKEN_MS: float = 0.05
+    SCRIPTED_LLM_SEED: Optional[int] = None
+    PROMPT_VARIANT: str = "full"
+    LLM_CONTEXT_CACHE_ENABLED: bool = True
+    LLM_CONTEXT_CACHE_MIN_TOKENS: int = 1024
+    LLM_CONTEXT_CACHE_TTL_SECONDS: int = 1800
+    LLM_CONTEXT_CACHE_INTERVALS: int = 10
+
+    FAST_PATH_ENABLED: bool = True
+    FAST_PATH_CONFIDENCE_THRESHOLD: float = 0.8
+    FAST_PATH_MAX_WORDS: int = 15
+    MAX_CONTAINERS_PER_QUERY: int = 10
+
+    SPECULATIVE_SCRAPE_ENABLED: bool = True
+    SPECULATIVE_SCRAPE_MAX_CONTAINERS: int = 3
+
     ALLOWED_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:8000"]
 
     RATE_LIMIT_ENABLED: bool = True
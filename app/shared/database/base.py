@@ -1,5 +1,5 @@
 """Database base configuration"""
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from app.shared.config.settings.base import get_settings
 
@@ -11,18 +11,27 @@ DATABASE_URL = settings.DATABASE_URL.replace(
     "postgres://", "postgresql+asyncpg://"
 )
 
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=settings.DB_ECHO,
-    pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_pre_ping=True,
-)
 
-async_session_maker = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+def build_engine(pool_size: int = settings.DB_POOL_SIZE, max_overflow: int = settings.DB_MAX_OVERFLOW) -> AsyncEngine:
+    return create_async_engine(
+        DATABASE_URL,
+        echo=settings.DB_ECHO,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_pre_ping=True,
+    )
+
+
+def build_session_maker(bind: AsyncEngine) -> async_sessionmaker:
+    return async_sessionmaker(
+        bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+
+engine = build_engine()
+
+async_session_maker = build_session_maker(engine)
 
 Base = declarative_base()
\ No newline at end of file
@@ -1,5 +1,5 @@
 from typing import List, Optional
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.shared.database.models.container_scrape_result import ContainerScrapeResult
 from app.shared.database.repositories.base_repository import BaseRepository
@@ -47,6 +47,8 @@ class ContainerScrapeResultRepository(BaseRepository[ContainerScrapeResult]):
         existing = await self.get_latest(container_number, operation)
 
         if existing:
+            if raw_html is not None:
+                existing.scraped_at = func.now()
             existing.raw_html = raw_html
             existing.parsed_json = parsed_json
             existing.status = status
@@ -67,6 +69,22 @@ class ContainerScrapeResultRepository(BaseRepository[ContainerScrapeResult]):
         await self.session.flush()
         return new_entry
 
+    async def merge_parsed_json(
+        self,
+        container_number: str,
+        operation: str,
+        values: dict
+    ) -> Optional[ContainerScrapeResult]:
+        existing = await self.get_latest(container_number, operation)
+
+        if not existing:
+            return None
+
+        # A new dict, so the JSON column registers the change
+        existing.parsed_json = {**(existing.parsed_json or {}), **values}
+        await self.session.flush()
+        return existing
+
     async def get_by_container_id(self,id:str) -> Optional[ContainerScrapeResult]:
         result = await self.session.execute(
             select(ContainerScrapeResult)
@@ -13,6 +13,12 @@ class SSEStepUpdate(BaseModel):
     timestamp: str
 
 
+class SSETextUpdate(BaseModel):
+    delta: str
+    replace: bool = False  # discard the text so far; delta starts it anew
+    timestamp: str
+
+
 class SSEErrorUpdate(BaseModel):
     step: ProcessingStep
     error: str
@@ -1,4 +1,6 @@
 import json
+import time
+import uuid
 from typing import Any, Optional
 import redis.asyncio as redis
 from app.shared.config.settings.base import get_settings
@@ -78,3 +80,50 @@ class CacheManager:
             logger.error(f"Cache clear error: {e}")
             return 0
 
+    async def acquire_lease(self, key: str, limit: int, ttl: int) -> Optional[str]:
+        """Takes one of limit leases on key, shared by every process using
+        this Redis. Leases of holders that died expire after ttl seconds.
+        Returns the lease ID, or None when all leases are taken; if Redis
+        is unreachable the lease is granted uncoordinated."""
+        lease_id = str(uuid.uuid4())
+
+        try:
+            await self.connect()
+            now = time.time()
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.zremrangebyscore(key, "-inf", now)
+                pipe.zadd(key, {lease_id: now + ttl})
+                pipe.zcard(key)
+                pipe.expire(key, ttl)
+                _, _, holders, _ = await pipe.execute()
+
+            if holders > limit:
+                await self._redis.zrem(key, lease_id)
+                return None
+
+            return lease_id
+        except Exception as e:
+            logger.error(f"Cache lease error: {e}")
+            return lease_id
+
+    async def renew_lease(self, key: str, lease_id: str, ttl: int) -> bool:
+        """Extends a held lease by ttl seconds from now"""
+        try:
+            await self.connect()
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.zadd(key, {lease_id: time.time() + ttl}, xx=True)
+                pipe.expire(key, ttl)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Cache lease renew error: {e}")
+            return False
+
+    async def release_lease(self, key: str, lease_id: str) -> bool:
+        try:
+            await self.connect()
+            await self._redis.zrem(key, lease_id)
+            return True
+        except Exception as e:
+            logger.error(f"Cache lease release error: {e}")
+            return False
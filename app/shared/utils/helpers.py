@@ -1,7 +1,22 @@
 import re
+import string
 from typing import Optional
 from datetime import datetime, timezone
-from app.shared.config.constants.scraper_constants import CONTAINER_ID_PATTERN
+from app.shared.config.constants.scraper_constants import CONTAINER_ID_PATTERN, CONTAINER_CATEGORY_IDENTIFIERS
+
+
+def _letter_values() -> dict:
+    # ISO 6346: letters count from 10 upwards, skipping multiples of 11
+    values, value = {}, 10
+    for letter in string.ascii_uppercase:
+        if value % 11 == 0:
+            value += 1
+        values[letter] = value
+        value += 1
+    return values
+
+
+_LETTER_VALUES = _letter_values()
 
 
 def validate_container_id(container_id: str) -> bool:
@@ -10,6 +25,24 @@ def validate_container_id(container_id: str) -> bool:
     return bool(re.match(CONTAINER_ID_PATTERN, container_id.upper()))
 
 
+def container_check_digit(container_id: str) -> int:
+    total = sum(
+        (_LETTER_VALUES[char] if char.isalpha() else int(char)) * 2 ** position
+        for position, char in enumerate(container_id[:10])
+    )
+    return total % 11 % 10
+
+
+def validate_container_check_digit(container_id: str) -> bool:
+    """Full ISO 6346 check: owner code with a category identifier and a
+    matching check digit, on top of the format."""
+    return (
+        validate_container_id(container_id)
+        and container_id[3].upper() in CONTAINER_CATEGORY_IDENTIFIERS
+        and container_check_digit(container_id.upper()) == int(container_id[10])
+    )
+
+
 def normalize_container_id(container_id: str) -> Optional[str]:
     if not container_id:
         return None
@@ -0,0 +1,79 @@
+import threading
+from collections import defaultdict, deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, Tuple
+
+from app.shared.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MAX_SAMPLES = 1000
+
+
+def _key(name: str, labels: Dict[str, Any]) -> str:
+    if not labels:
+        return name
+    label_str = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
+    return f"{name}{{{label_str}}}"
+
+
+class MetricsRegistry:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._gauges: Dict[str, float] = {}
+        self._samples: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=MAX_SAMPLES))
+        self._totals: Dict[str, Tuple[int, float]] = defaultdict(lambda: (0, 0.0))
+
+    def increment(self, name: str, value: float = 1, **labels) -> None:
+        with self._lock:
+            self._counters[_key(name, labels)] += value
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        with self._lock:
+            self._gauges[_key(name, labels)] = value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            self._samples[key].append(value)
+            count, total = self._totals[key]
+            self._totals[key] = (count + 1, total + value)
+
+    def get_counter(self, name: str, **labels) -> float:
+        with self._lock:
+            return self._counters.get(_key(name, labels), 0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            summaries = {}
+            for key, samples in self._samples.items():
+                ordered = sorted(samples)
+                count, total = self._totals[key]
+                summaries[key] = {
+                    "count": count,
+                    "avg": round(total / count, 3) if count else 0,
+                    "p50": ordered[len(ordered) // 2] if ordered else 0,
+                    "p95": ordered[int(len(ordered) * 0.95)] if ordered else 0,
+                    "p99": ordered[int(len(ordered) * 0.99)] if ordered else 0,
+                    "max": ordered[-1] if ordered else 0,
+                }
+
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "summaries": summaries,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._samples.clear()
+            self._totals.clear()
+
+
+@lru_cache()
+def get_metrics() -> MetricsRegistry:
+    return MetricsRegistry()
@@ -0,0 +1,147 @@
+import asyncio
+import contextvars
+from datetime import datetime, timezone
+from typing import Any, Coroutine, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from app.shared.config.constants.app_constants import ProcessingStep, StepStatus, QUERY_STAGE_PROGRESS
+from app.shared.config.settings.base import get_settings
+from app.shared.schemas.sse_schema import SSEStepUpdate, SSETextUpdate
+from app.shared.utils.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+_current_stream: contextvars.ContextVar[Optional["QueryStream"]] = contextvars.ContextVar(
+    "query_stream", default=None
+)
+
+
+# False while running work shared with other queries: the stream follows
+# its workflows but does not own them, so a disconnect leaves them running
+_owns_workflows: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "query_stream_owns_workflows", default=True
+)
+
+
+def get_query_stream() -> Optional["QueryStream"]:
+    return _current_stream.get()
+
+
+def shared_context(stream: bool = True) -> contextvars.Context:
+    """A copy of the current context for a task shared beyond the query that
+    starts it. With stream=False the task reports to no stream at all."""
+    context = contextvars.copy_context()
+    context.run(_owns_workflows.set, False)
+    if not stream:
+        context.run(_current_stream.set, None)
+    return context
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class QueryStream:
+    """SSE updates of one streamed query. Pipeline stages find the active
+    stream through a context variable, so the regular query path runs
+    unchanged and reports progress only while a client is listening. It
+    also reaches the agent's tools, which take no extra arguments."""
+
+    def __init__(self):
+        self.updates: asyncio.Queue = asyncio.Queue()
+        self.workflows: Dict[str, Any] = {}
+        self.last_step: Optional[ProcessingStep] = None
+        self._progress_tasks: List[asyncio.Task] = []
+
+    def start(self, coro: Coroutine) -> asyncio.Task:
+        """Runs coro with this stream active; updates end with None once it
+        and the workflow progress it started have finished. Cancelling the
+        task also cancels the workflows it owns."""
+        context = contextvars.copy_context()
+        context.run(_current_stream.set, self)
+
+        async def run():
+            try:
+                result = await coro
+                await self.drain_progress()
+                return result
+            except asyncio.CancelledError:
+                await self.cancel_workflows()
+                raise
+            finally:
+                self.close()
+                self.updates.put_nowait(None)
+
+        return asyncio.create_task(run(), context=context)
+
+    def emit(self, update: BaseModel):
+        self.updates.put_nowait(update)
+
+    def step(
+            self,
+            step: ProcessingStep,
+            status: StepStatus = StepStatus.COMPLETED,
+            message: Optional[str] = None,
+            data: Optional[Dict[str, Any]] = None
+    ):
+        self.last_step = step
+        self.emit(SSEStepUpdate(
+            step=step,
+            status=status,
+            message=message,
+            progress=QUERY_STAGE_PROGRESS[step],
+            data=data,
+            timestamp=_now(),
+        ))
+
+    def text(self, delta: str):
+        self.emit(SSETextUpdate(delta=delta, timestamp=_now()))
+
+    def replace_text(self, text: str = ""):
+        """Tells the client to discard the reply text streamed so far and
+        start over with text"""
+        self.emit(SSETextUpdate(delta=text, replace=True, timestamp=_now()))
+
+    def follow_workflow(self, workflow_client, workflow_id: str, container_id: str):
+        if _owns_workflows.get():
+            self.workflows[workflow_id] = workflow_client
+        self.step(
+            ProcessingStep.TRIGGER_WORKFLOW,
+            message=f"Workflow started for {container_id}",
+            data={"workflow_id": workflow_id, "container_id": container_id},
+        )
+        self._progress_tasks.append(asyncio.create_task(self._forward_progress(workflow_client, workflow_id)))
+
+    async def _forward_progress(self, workflow_client, workflow_id: str):
+        start = QUERY_STAGE_PROGRESS[ProcessingStep.TRIGGER_WORKFLOW]
+        band = QUERY_STAGE_PROGRESS[ProcessingStep.FORMAT_RESPONSE] - start
+
+        try:
+            async for update in workflow_client.stream_progress(workflow_id):
+                update.progress = start + update.progress * band // 100
+                self.emit(update)
+        except Exception as e:
+            logger.warning(f"Progress stream for {workflow_id} failed: {e}")
+
+    async def drain_progress(self):
+        # Workflows are done once the answer is; wait for their last polls
+        pending = [task for task in self._progress_tasks if not task.done()]
+        if pending:
+            await asyncio.wait(pending, timeout=settings.WORKFLOW_PROGRESS_POLL_INTERVAL * 2)
+
+    def close(self):
+        for task in self._progress_tasks:
+            task.cancel()
+
+    async def cancel_workflows(self):
+        for workflow_id, workflow_client in self.workflows.items():
+            status = await workflow_client.get_workflow_status(workflow_id)
+            if status["status"] != "RUNNING":
+                continue
+
+            try:
+                await workflow_client.cancel_workflow(workflow_id)
+            except Exception as e:
+                logger.warning(f"Failed to cancel workflow {workflow_id}: {e}")
@@ -0,0 +1,145 @@
+"""Prompt variant benchmark for the tool agent.
+
+Runs a fixed query set through GeminiAgent.parse_query once per prompt
+variant and reports answer quality (container and intent match against the
+expected values), latency and prompt tokens per LLM call. Workflows are
+replaced with a stub returning parsed dummy data, so only the agent is timed.
+
+    python -m benchmarks.prompt_variants --rounds 3
+    python -m benchmarks.prompt_variants --backend gemini
+
+The default scripted backend is deterministic: it shows how prompt size
+drives prompt tokens and latency, but only the gemini backend can show
+whether a variant changes what the model answers.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.layers.ai_agent.agent.gemini_agent import GeminiAgent
+from app.layers.ai_agent.llm.scripted_llm import ScriptedLlm
+from app.layers.ai_agent.prompts.prompt_manager import PROMPT_VARIANTS
+from app.layers.mcp.clients.workflow_client import WorkflowResult
+from app.layers.scraper.parsers.container_parser import ContainerParser
+from app.layers.scraper.scrapers.dymmy.dummy_data import build_dummy_html
+from app.shared.config.settings.base import get_settings
+from app.shared.exceptions.scraper_exceptions import DataExtractionError
+from app.shared.utils.metrics import get_metrics
+
+settings = get_settings()
+metrics = get_metrics()
+
+# (query, expected container, expected intent)
+QUERIES: List[Tuple[str, Optional[str], Optional[str]]] = [
+    ("Where is MSDU4234521?", "MSDU4234521", "get_location"),
+    ("Is MSDU 423 4521 available for pickup?", "MSDU4234521", "check_availability"),
+    ("Any holds on msmu-8317127", "MSMU8317127", "check_holds"),
+    ("What's the last free day for MSBU5011443", "MSBU5011443", "get_lfd"),
+    ("Give me everything you have on MSMU8317127", "MSMU8317127", "get_info"),
+    ("Can I pick up MSDU4234521 tomorrow or is customs still blocking it?", "MSDU4234521", None),
+    ("Check MSDU4234521 and MSBU5011443", "MSDU4234521", "get_info"),
+    ("Is TGHU1234567 ready?", "TGHU1234567", "check_availability"),
+    ("Where is my container?", None, None),
+]
+
+
+class StubWorkflowClient:
+
+    def __init__(self):
+        self.parser = ContainerParser()
+
+    async def start_workflow(self, workflow_name: str, workflow_input: Dict[str, Any]) -> WorkflowResult:
+        workflow_id = f"bench-{uuid.uuid4()}"
+        html_content = build_dummy_html(workflow_input["container_id"])
+
+        try:
+            data = self.parser.parse(html_content, workflow_input["operation"])
+        except DataExtractionError:
+            return WorkflowResult(workflow_id=workflow_id, data={}, status="failed")
+
+        return WorkflowResult(workflow_id=workflow_id, data=data, status="success")
+
+
+def _build_agent(variant: str, args) -> GeminiAgent:
+    model = None
+    if args.backend == "scripted":
+        model = ScriptedLlm(latency_ms=args.latency_ms, latency_per_token_ms=args.latency_per_token_ms)
+
+    agent = GeminiAgent(model=model, prompt_variant=variant)
+    agent.tool_registry.container_tools.workflow_client = StubWorkflowClient()
+
+    return agent
+
+
+def _avg(name: str, variant: str) -> float:
+    # Calls from both cascade tiers count
+    summaries = [
+        metrics.snapshot()["summaries"].get(f"{name}{{agent={agent},variant={variant}}}", {})
+        for agent in ("fast_tool_agent", "tool_agent")
+    ]
+    count = sum(summary.get("count", 0) for summary in summaries)
+    total = sum(summary.get("count", 0) * summary.get("avg", 0) for summary in summaries)
+
+    return round(total / count, 1) if count else 0
+
+
+async def run_variant(variant: str, args) -> Dict[str, Any]:
+    agent = _build_agent(variant, args)
+    latencies: List[float] = []
+    correct = 0
+    answered = 0
+
+    try:
+        for _ in range(args.rounds):
+            for query, expected_container, expected_intent in QUERIES:
+                start = time.perf_counter()
+                schema = await agent.parse_query(query)
+                latencies.append((time.perf_counter() - start) * 1000)
+
+                intent = schema.intent.value if hasattr(schema.intent, "value") else schema.intent
+                if schema.container_id == expected_container and (expected_intent is None or intent == expected_intent):
+                    correct += 1
+                if schema.message:
+                    answered += 1
+    finally:
+        await agent.shutdown()
+
+    runs = args.rounds * len(QUERIES)
+
+    return {
+        "variant": agent.prompts.version,
+        "accuracy": round(correct / runs, 3),
+        "answered": round(answered / runs, 3),
+        "p50_ms": round(statistics.median(latencies), 1),
+        "avg_ms": round(statistics.fmean(latencies), 1),
+        "prompt_tokens": _avg("llm_prompt_tokens", variant),
+        "cached_tokens": _avg("llm_cached_prompt_tokens", variant),
+    }
+
+
+async def main(args):
+    # Rounds repeat the same queries, so cached replies would time the
+    # response cache instead of the prompt variant
+    settings.LLM_RESPONSE_CACHE_ENABLED = False
+
+    results = [await run_variant(variant, args) for variant in args.variants]
+
+    columns = ["variant", "accuracy", "answered", "p50_ms", "avg_ms", "prompt_tokens", "cached_tokens"]
+    print(" | ".join(f"{c:>20}" for c in columns))
+    for result in results:
+        print(" | ".join(f"{str(result[c]):>20}" for c in columns))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", choices=["scripted", "gemini"], default="scripted")
+    parser.add_argument("--variants", nargs="+", choices=list(PROMPT_VARIANTS), default=list(PROMPT_VARIANTS))
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=150.0)
+    parser.add_argument("--latency-per-token-ms", type=float, default=0.05)
+    args = parser.parse_args()
+
+    asyncio.run(main(args))
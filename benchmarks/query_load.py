@@ -0,0 +1,95 @@
+"""Query API load test.
+
+Drives POST /api/v1/query on a running API with a fixed number of concurrent
+clients for a set duration and reports throughput, latency percentiles and
+error counts. Run the API with LLM_BACKEND=scripted to find the throughput
+ceiling of everything except the model (API, agent, tools, workflows):
+
+    LLM_BACKEND=scripted uvicorn main:app
+    python -m benchmarks.query_load --concurrency 32 --duration 60
+"""
+import argparse
+import asyncio
+import itertools
+import statistics
+import time
+from collections import Counter
+from typing import Dict, List
+
+import httpx
+
+QUERIES = [
+    "Where is MSDU4234521?",
+    "Is MSMU8317127 available for pickup?",
+    "Any holds on MSBU5011443",
+    "What's the last free day for MSDU4234521",
+    "Give me the status of MSMU8317127",
+    "Check MSDU4234521 and MSBU5011443",
+]
+
+
+async def client_loop(
+        client: httpx.AsyncClient,
+        queries,
+        deadline: float,
+        latencies: List[float],
+        outcomes: Counter
+):
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            response = await client.post("/api/v1/query", json={"query": next(queries)})
+            outcomes[str(response.status_code)] += 1
+            if response.status_code == 200:
+                latencies.append((time.perf_counter() - start) * 1000)
+        except httpx.HTTPError as e:
+            outcomes[type(e).__name__] += 1
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    return round(ordered[min(int(len(ordered) * fraction), len(ordered) - 1)], 1) if ordered else 0
+
+
+async def main(url: str, concurrency: int, duration: float, timeout: float) -> Dict:
+    latencies: List[float] = []
+    outcomes: Counter = Counter()
+    queries = itertools.cycle(QUERIES)
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, timeout=timeout, limits=limits) as client:
+        start = time.perf_counter()
+        deadline = start + duration
+        await asyncio.gather(*(
+            client_loop(client, queries, deadline, latencies, outcomes)
+            for _ in range(concurrency)
+        ))
+        elapsed = time.perf_counter() - start
+
+    ordered = sorted(latencies)
+    result = {
+        "concurrency": concurrency,
+        "requests": sum(outcomes.values()),
+        "ok_per_s": round(len(latencies) / elapsed, 1),
+        "p50_ms": _percentile(ordered, 0.5),
+        "p95_ms": _percentile(ordered, 0.95),
+        "p99_ms": _percentile(ordered, 0.99),
+        "avg_ms": round(statistics.fmean(ordered), 1) if ordered else 0,
+    }
+
+    columns = list(result)
+    print(" | ".join(f"{c:>12}" for c in columns))
+    print(" | ".join(f"{str(result[c]):>12}" for c in columns))
+    print(f"outcomes: {dict(outcomes)}")
+
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.url, args.concurrency, args.duration, args.timeout))
@@ -0,0 +1,192 @@
+"""Workflow task latency benchmark for ContainerScraperWorkflow.
+
+Runs the workflow against a local Temporal dev server with stub activities,
+once per workflow runner configuration, and reports workflow task latency
+(WorkflowTaskStarted -> WorkflowTaskCompleted, taken from history) for the
+first task on a fresh worker and for steady state, plus worker CPU time.
+Each configuration runs in its own process, so every one starts cold.
+
+    python -m benchmarks.workflow_task_latency --workflows 50
+
+The dev server binary is downloaded by temporalio on first use.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from temporalio import activity
+from temporalio.api.enums.v1 import EventType
+from temporalio.client import Client
+from temporalio.testing import WorkflowEnvironment
+from temporalio.worker import Worker, WorkflowRunner
+from temporalio.worker.workflow_sandbox import SandboxedWorkflowRunner
+
+from app.layers.scraper.scrapers.dymmy.dummy_data import build_dummy_html
+from app.layers.scraper.temporal.codec import get_data_converter
+from app.layers.scraper.temporal.config import WORKER_PROFILES
+from app.layers.scraper.temporal.worker import build_workflow_runner
+from app.layers.scraper.temporal.workflows.container_workflow import ContainerScraperWorkflow
+
+CONTAINER_ID = "MSDU4234521"
+
+
+@activity.defn(name="check_cached_html")
+async def check_cached_html(container_id: str, operation: str = "get_full_info") -> Dict:
+    return {"found": False, "container_id": container_id}
+
+
+@activity.defn(name="init_browser")
+async def init_browser() -> Dict:
+    return {"session_id": "benchmark", "status": "initialized"}
+
+
+@activity.defn(name="search_container")
+async def search_container(browser_session: Dict, container_id: str) -> Dict:
+    return {"container_id": container_id, "html_content": build_dummy_html(container_id), "status": "found"}
+
+
+@activity.defn(name="store_raw_html")
+async def store_raw_html(container_id: str, html_content: str) -> bool:
+    return True
+
+
+@activity.defn(name="extract_data")
+async def extract_data(search_result: Dict, operation: str) -> Dict:
+    return {"container_number": search_result["container_id"], "status": "Available"}
+
+
+@activity.defn(name="validate_data")
+async def validate_data(data: Dict, container_id: str) -> Dict:
+    return data
+
+
+@activity.defn(name="store_data")
+async def store_data(data: Dict, container_id: str, operation: Optional[str] = None) -> bool:
+    return True
+
+
+STUB_ACTIVITIES = [
+    check_cached_html, init_browser, search_container, store_raw_html,
+    extract_data, validate_data, store_data,
+]
+
+
+def _runners() -> Dict[str, WorkflowRunner]:
+    return {
+        "default_sandbox": SandboxedWorkflowRunner(),
+        "tuned_sandbox": build_workflow_runner(sandboxed=True),
+        "unsandboxed": build_workflow_runner(sandboxed=False),
+    }
+
+
+async def _task_latencies_ms(handle) -> List[float]:
+    history = await handle.fetch_history()
+    started = {}
+    latencies = []
+
+    for event in history.events:
+        if event.event_type == EventType.EVENT_TYPE_WORKFLOW_TASK_STARTED:
+            started[event.event_id] = event.event_time.ToDatetime()
+        elif event.event_type == EventType.EVENT_TYPE_WORKFLOW_TASK_COMPLETED:
+            start = started.get(event.workflow_task_completed_event_attributes.started_event_id)
+            if start:
+                latencies.append((event.event_time.ToDatetime() - start).total_seconds() * 1000)
+
+    return latencies
+
+
+async def run_mode(client: Client, name: str, runner: WorkflowRunner, workflows: int) -> Dict:
+    workers = []
+    for profile in WORKER_PROFILES.values():
+        workers.append(Worker(
+            client,
+            task_queue=profile.task_queue,
+            workflows=[ContainerScraperWorkflow] if profile.run_workflows else [],
+            activities=[] if profile.run_workflows else STUB_ACTIVITIES,
+            workflow_runner=runner,
+        ))
+
+    cpu_start = time.process_time()
+    first_task_ms = None
+    steady_ms: List[float] = []
+
+    async with asyncio.TaskGroup() as group:
+        for worker in workers:
+            group.create_task(worker.run())
+
+        try:
+            for i in range(workflows):
+                handle = await client.start_workflow(
+                    ContainerScraperWorkflow.run,
+                    args=[CONTAINER_ID, "get_full_info", True],
+                    id=f"bench-{name}-{uuid.uuid4()}",
+                    task_queue=WORKER_PROFILES["workflow"].task_queue,
+                )
+                result = await handle.result()
+                # A failing stub would time retries of a broken path
+                assert result["status"] == "success", f"Workflow failed: {result.get('error')}"
+
+                latencies = await _task_latencies_ms(handle)
+                if i == 0 and latencies:
+                    first_task_ms = latencies[0]
+                    latencies = latencies[1:]
+                steady_ms.extend(latencies)
+        finally:
+            for worker in workers:
+                await worker.shutdown()
+
+    return {
+        "mode": name,
+        "first_task_ms": round(first_task_ms or 0, 2),
+        "steady_p50_ms": round(statistics.median(steady_ms), 2) if steady_ms else 0,
+        "steady_avg_ms": round(statistics.fmean(steady_ms), 2) if steady_ms else 0,
+        "cpu_ms_per_workflow": round((time.process_time() - cpu_start) * 1000 / workflows, 2),
+    }
+
+
+async def run_mode_in_process(target: str, name: str, workflows: int):
+    client = await Client.connect(target, data_converter=get_data_converter())
+    print(json.dumps(await run_mode(client, name, _runners()[name], workflows)))
+
+
+async def _run_mode_subprocess(target: str, name: str, workflows: int) -> Dict:
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "benchmarks.workflow_task_latency",
+        "--workflows", str(workflows), "--mode", name, "--target", target,
+        stdout=asyncio.subprocess.PIPE,
+    )
+    stdout, _ = await process.communicate()
+
+    if process.returncode != 0:
+        raise RuntimeError(f"Benchmark mode {name} failed with exit code {process.returncode}")
+
+    return json.loads(stdout.decode().strip().splitlines()[-1])
+
+
+async def main(workflows: int):
+    async with await WorkflowEnvironment.start_local(data_converter=get_data_converter()) as env:
+        target = env.client.service_client.config.target_host
+        results = [await _run_mode_subprocess(target, name, workflows) for name in _runners()]
+
+    columns = ["mode", "first_task_ms", "steady_p50_ms", "steady_avg_ms", "cpu_ms_per_workflow"]
+    print(" | ".join(f"{c:>20}" for c in columns))
+    for result in results:
+        print(" | ".join(f"{str(result[c]):>20}" for c in columns))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workflows", type=int, default=20)
+    parser.add_argument("--mode", choices=list(_runners()), help="Run one mode against --target (used internally)")
+    parser.add_argument("--target", help="Temporal server address for --mode")
+    args = parser.parse_args()
+
+    if args.mode:
+        asyncio.run(run_mode_in_process(args.target, args.mode, args.workflows))
+    else:
+        asyncio.run(main(args.workflows))
@@ -0,0 +1,57 @@
+import asyncio
+import os
+import unittest
+from unittest import mock
+
+from temporalio.api.common.v1 import Payload
+
+from app.layers.scraper.temporal import codec
+from app.layers.scraper.temporal.codec import ENCODING_KEY, CompressionCodec
+
+
+def _payload(size: int) -> Payload:
+    return Payload(metadata={"encoding": b"json/plain"}, data=b"a" * size)
+
+
+class CompressionCodecTest(unittest.TestCase):
+
+    def setUp(self):
+        self.codec = CompressionCodec(algorithm="zlib", threshold=1024)
+
+    def test_round_trip(self):
+        payloads = [_payload(10), _payload(4096)]
+
+        encoded = asyncio.run(self.codec.encode(payloads))
+        decoded = asyncio.run(self.codec.decode(encoded))
+
+        self.assertEqual(decoded, payloads)
+
+    def test_only_payloads_above_threshold_are_compressed(self):
+        small, large = asyncio.run(self.codec.encode([_payload(10), _payload(4096)]))
+
+        self.assertEqual(small.metadata[ENCODING_KEY], b"json/plain")
+        self.assertEqual(large.metadata[ENCODING_KEY], b"binary/zlib")
+        self.assertLess(len(large.data), 4096)
+
+    def test_incompressible_payload_is_sent_as_is(self):
+        payload = Payload(metadata={"encoding": b"binary/plain"}, data=os.urandom(2048))
+
+        encoded, = asyncio.run(self.codec.encode([payload]))
+
+        self.assertEqual(encoded, payload)
+
+    def test_undecodable_compressed_payload_raises(self):
+        payload = Payload(metadata={ENCODING_KEY: b"binary/zstd"}, data=b"\x28\xb5\x2f\xfd")
+
+        with mock.patch.dict(self.codec._decoders, clear=True):
+            with self.assertRaises(ValueError):
+                asyncio.run(self.codec.decode([payload]))
+
+    def test_zstd_without_library_is_rejected(self):
+        with mock.patch.object(codec, "zstandard", None):
+            with self.assertRaises(ValueError):
+                CompressionCodec(algorithm="zstd")
+
+
+if __name__ == "__main__":
+    unittest.main()
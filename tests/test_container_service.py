@@ -0,0 +1,101 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import mock
+
+from starlette.requests import Request
+
+from app.layers.api.routes.v1.containers import _not_modified
+from app.layers.api.services.container_service import ContainerNotFoundError, ContainerService
+from app.layers.mcp.clients.workflow_client import WorkflowResult
+from app.shared.config.settings.base import get_settings
+
+settings = get_settings()
+
+
+class StubWorkflowClient:
+
+    def __init__(self, *results: WorkflowResult):
+        self.results = list(results)
+
+    async def start_workflow(self, workflow_name: str, workflow_input: dict) -> WorkflowResult:
+        return self.results.pop(0)
+
+
+def _result(last_updated: str, location: str = "YARD A") -> WorkflowResult:
+    return WorkflowResult(
+        workflow_id=f"workflow-{last_updated}",
+        data={"container_number": "MSDU4234521", "location": location, "last_updated": last_updated},
+        status="success",
+    )
+
+
+def _request(**headers) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()],
+    })
+
+
+class ContainerServiceTest(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(settings, "CACHE_ENABLED", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _lookup(self, workflow_client: StubWorkflowClient):
+        service = ContainerService(workflow_client=workflow_client)
+        return asyncio.run(service.get(None, "MSDU4234521", "get_location", force_refresh=True))
+
+    def _etag(self, result: WorkflowResult) -> str:
+        lookup = self._lookup(StubWorkflowClient(result))
+        return lookup.etag(lookup.data)
+
+    def test_etag_ignores_parse_timestamp(self):
+        self.assertEqual(self._etag(_result("2026-10-19T10:00:00")), self._etag(_result("2026-10-19T10:05:00")))
+
+    def test_etag_changes_with_data(self):
+        moved = _result("2026-10-19T10:00:00", location="YARD B")
+
+        self.assertNotEqual(self._etag(_result("2026-10-19T10:00:00")), self._etag(moved))
+
+    def test_failed_workflow_is_not_found(self):
+        failed = WorkflowResult(workflow_id="workflow-1", data={}, status="failed")
+
+        with self.assertRaises(ContainerNotFoundError):
+            self._lookup(StubWorkflowClient(failed))
+
+
+class NotModifiedTest(unittest.TestCase):
+
+    def setUp(self):
+        self.etag = '"abc"'
+        self.last_modified = datetime(2026, 10, 19, 10, 0, tzinfo=timezone.utc)
+
+    def test_matching_etag_is_not_modified(self):
+        self.assertTrue(_not_modified(_request(if_none_match='W/"abc", "def"'), self.etag, self.last_modified))
+        self.assertTrue(_not_modified(_request(if_none_match="*"), self.etag, self.last_modified))
+        self.assertFalse(_not_modified(_request(if_none_match='"def"'), self.etag, self.last_modified))
+
+    def test_if_none_match_takes_precedence(self):
+        request = _request(
+            if_none_match='"def"',
+            if_modified_since=format_datetime(self.last_modified + timedelta(hours=1), usegmt=True),
+        )
+
+        self.assertFalse(_not_modified(request, self.etag, self.last_modified))
+
+    def test_if_modified_since(self):
+        since = format_datetime(self.last_modified, usegmt=True)
+        earlier = format_datetime(self.last_modified - timedelta(seconds=1), usegmt=True)
+
+        self.assertTrue(_not_modified(_request(if_modified_since=since), self.etag, self.last_modified))
+        self.assertFalse(_not_modified(_request(if_modified_since=earlier), self.etag, self.last_modified))
+        self.assertFalse(_not_modified(_request(if_modified_since="not a date"), self.etag, self.last_modified))
+
+
+if __name__ == "__main__":
+    unittest.main()
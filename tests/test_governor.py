@@ -0,0 +1,65 @@
+import asyncio
+import unittest
+
+from app.layers.ai_agent.llm.governor import LLMCapacityError, LLMGovernor
+from app.shared.config.constants.app_constants import LLMPriority
+
+
+class LLMGovernorTest(unittest.TestCase):
+
+    def test_interactive_waiters_are_served_before_batch(self):
+        governor = LLMGovernor(max_in_flight=1, queue_timeout=5)
+        order = []
+
+        async def run(name: str, priority: LLMPriority):
+            async with governor.slot(priority):
+                order.append(name)
+                await asyncio.sleep(0)
+
+        async def scenario():
+            async with governor.slot(LLMPriority.INTERACTIVE):
+                tasks = [
+                    asyncio.create_task(run("batch-1", LLMPriority.BATCH)),
+                    asyncio.create_task(run("batch-2", LLMPriority.BATCH)),
+                    asyncio.create_task(run("interactive", LLMPriority.INTERACTIVE)),
+                ]
+                await asyncio.sleep(0.01)
+            await asyncio.gather(*tasks)
+
+        asyncio.run(scenario())
+
+        self.assertEqual(order, ["interactive", "batch-1", "batch-2"])
+        self.assertEqual(governor.in_flight, 0)
+
+    def test_slot_is_released_when_the_call_fails(self):
+        governor = LLMGovernor(max_in_flight=1, queue_timeout=1)
+
+        async def scenario():
+            with self.assertRaises(RuntimeError):
+                async with governor.slot(LLMPriority.INTERACTIVE):
+                    raise RuntimeError("model error")
+
+        asyncio.run(scenario())
+
+        self.assertEqual(governor.in_flight, 0)
+
+    def test_waiter_times_out_with_capacity_error(self):
+        governor = LLMGovernor(max_in_flight=1, queue_timeout=0.05)
+
+        async def scenario():
+            async with governor.slot(LLMPriority.INTERACTIVE):
+                with self.assertRaises(LLMCapacityError):
+                    async with governor.slot(LLMPriority.BATCH):
+                        pass
+
+            # A timed-out waiter leaves no claim on the slot
+            async with governor.slot(LLMPriority.BATCH):
+                pass
+
+        asyncio.run(scenario())
+
+        self.assertEqual(governor.in_flight, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.layers.api.dependencies import get_job_service
+from app.layers.api.routes.v1 import jobs
+from app.layers.api.services.job_service import JobExpiredError, JobNotFoundError, JobService
+from app.layers.mcp.clients.workflow_client import WorkflowResult
+from app.shared.config.settings.base import get_settings
+
+settings = get_settings()
+
+JOB_ID = "job-1"
+
+
+class StubWorkflowClient:
+
+    def __init__(self, status: str, closed_seconds_ago: float = None, result_status: str = "success"):
+        now = datetime.now(timezone.utc)
+        self.status = {
+            "status": status,
+            "start_time": now - timedelta(seconds=(closed_seconds_ago or 0) + 5),
+            "close_time": now - timedelta(seconds=closed_seconds_ago) if closed_seconds_ago is not None else None,
+        }
+        self.result = WorkflowResult(workflow_id=JOB_ID, data={"location": "YARD A"}, status=result_status)
+
+    async def get_workflow_status(self, workflow_id: str) -> dict:
+        return self.status
+
+    async def wait_for_result(self, workflow_id: str) -> WorkflowResult:
+        return self.result
+
+
+class JobTestCase(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(settings, "CACHE_ENABLED", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _service(self, *args, **kwargs) -> JobService:
+        return JobService(workflow_client=StubWorkflowClient(*args, **kwargs))
+
+
+class JobServiceTest(JobTestCase):
+
+    def test_result_within_ttl_is_served(self):
+        response = asyncio.run(self._service("COMPLETED", closed_seconds_ago=10).get_result(JOB_ID))
+
+        self.assertEqual(response.status, "completed")
+        self.assertEqual(response.data, {"location": "YARD A"})
+
+    def test_result_past_ttl_is_expired(self):
+        service = self._service("COMPLETED", closed_seconds_ago=settings.JOB_RESULT_TTL + 1)
+
+        with self.assertRaises(JobExpiredError):
+            asyncio.run(service.get_result(JOB_ID))
+
+    def test_running_job_without_wait_reports_running(self):
+        response = asyncio.run(self._service("RUNNING").get_result(JOB_ID))
+
+        self.assertEqual(response.status, "running")
+
+    def test_status_comes_from_the_workflow_result(self):
+        service = self._service("COMPLETED", closed_seconds_ago=10, result_status="failed")
+
+        self.assertEqual(asyncio.run(service.get_status(JOB_ID)).status, "failed")
+
+    def test_other_workflow_ids_are_not_jobs(self):
+        with self.assertRaises(JobNotFoundError):
+            asyncio.run(self._service("COMPLETED", closed_seconds_ago=10).get_result("container-scraper-1"))
+
+
+class JobRoutesTest(JobTestCase):
+
+    def _client(self, service: JobService) -> TestClient:
+        app = FastAPI()
+        app.include_router(jobs.router)
+        app.dependency_overrides[get_job_service] = lambda: service
+        return TestClient(app)
+
+    def test_expired_result_is_gone(self):
+        client = self._client(self._service("COMPLETED", closed_seconds_ago=settings.JOB_RESULT_TTL + 1))
+
+        response = client.get(f"/jobs/{JOB_ID}/result")
+
+        self.assertEqual(response.status_code, 410)
+
+    def test_unknown_job_is_not_found(self):
+        client = self._client(self._service("COMPLETED", closed_seconds_ago=10))
+
+        self.assertEqual(client.get("/jobs/container-scraper-1/result").status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import asyncio
+import unittest
+
+from google.genai import types
+
+from app.layers.ai_agent.cache.llm_cache import LLMResponseCache
+from app.layers.mcp.tools.projections import project_tool_result
+
+
+def _contents(age_seconds: int) -> list:
+    result = {
+        "status": "success",
+        "workflow_id": f"workflow-{age_seconds}",
+        "cache": {"hit": True, "age_seconds": age_seconds},
+        "data": {"location": "YARD A", "status": "Available", "last_updated": f"2026-10-19T10:00:{age_seconds:02d}"},
+    }
+
+    return [
+        types.Content(role="user", parts=[types.Part(text="Where is MSDU4234521?")]),
+        types.Content(role="model", parts=[types.Part(function_call=types.FunctionCall(
+            name="get_container_location", args={"container_id": "MSDU4234521"}
+        ))]),
+        types.Content(role="user", parts=[types.Part(function_response=types.FunctionResponse(
+            name="get_container_location", response=project_tool_result("get_container_location", result)
+        ))]),
+    ]
+
+
+class LLMResponseCacheKeyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = LLMResponseCache(max_entries=8, ttl=60)
+
+    def _key(self, age_seconds: int) -> str:
+        return self.cache.build_key("model", "tool_agent", "v1", _contents(age_seconds))
+
+    def test_same_scrape_data_of_similar_age_hits(self):
+        reply = types.Content(role="model", parts=[types.Part(text="MSDU4234521 is in YARD A, under a minute old.")])
+
+        asyncio.run(self.cache.put(self._key(5), reply))
+        cached = asyncio.run(self.cache.get(self._key(47)))
+
+        self.assertIsNotNone(cached)
+        self.assertEqual(cached.parts[0].text, "MSDU4234521 is in YARD A, under a minute old.")
+
+    def test_same_scrape_data_of_different_age_misses(self):
+        self.assertNotEqual(self._key(5), self._key(150))
+
+    def test_changed_scrape_data_misses(self):
+        changed = _contents(5)
+        changed[2].parts[0].function_response.response["location"] = "YARD B"
+
+        self.assertNotEqual(self._key(5), self.cache.build_key("model", "tool_agent", "v1", changed))
+
+
+if __name__ == "__main__":
+    unittest.main()
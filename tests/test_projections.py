@@ -0,0 +1,56 @@
+import unittest
+
+from app.layers.mcp.tools.projections import TOOL_FIELDS, project_tool_result
+
+
+def _result(**data) -> dict:
+    return {
+        "status": "success",
+        "workflow_id": "workflow-1",
+        "data": {"container_number": "MSDU4234521", "raw_html": "<html></html>", **data},
+    }
+
+
+class ProjectToolResultTest(unittest.TestCase):
+
+    def test_only_the_tool_fields_reach_the_model(self):
+        projected = project_tool_result("get_container_location", _result(
+            location="YARD A", holds=["CUSTOMS"], last_free_day="2026-10-20"
+        ))
+
+        self.assertEqual(projected, {"found": True, "location": "YARD A"})
+
+    def test_empty_fields_are_dropped(self):
+        projected = project_tool_result(
+            "check_container_holds", _result(holds=[], customs_status="", freight_status=None)
+        )
+
+        self.assertEqual(projected, {"found": True})
+
+    def test_failed_lookup_is_not_found(self):
+        projected = project_tool_result("get_container_info", {"status": "failed", "error": "timeout", "data": {}})
+
+        self.assertEqual(projected, {"found": False, "error": "timeout"})
+
+    def test_cache_hit_reports_data_age(self):
+        result = _result(location="YARD A")
+        result["cache"] = {"hit": True, "age_seconds": 42}
+
+        self.assertEqual(project_tool_result("get_container_location", result)["data_age_s"], 42)
+
+    def test_batch_results_are_projected_per_container(self):
+        projected = project_tool_result("get_containers_info", {"results": [
+            {**_result(status="Available"), "container_id": "MSDU4234521"},
+            {"container_id": "MSBU5011443", "status": "failed", "error": "not found"},
+        ]})
+
+        self.assertEqual(projected["containers"]["MSDU4234521"], {"found": True, "status": "Available"})
+        self.assertFalse(projected["containers"]["MSBU5011443"]["found"])
+
+    def test_unknown_tool_passes_through(self):
+        self.assertNotIn("unknown_tool", TOOL_FIELDS)
+        self.assertEqual(project_tool_result("unknown_tool", {"value": 1}), {"value": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+from app.layers.ai_agent.parsers.intent_parser import IntentParser
+from app.layers.ai_agent.parsers.query_parser import QueryParser
+from app.shared.config.settings.base import get_settings
+from app.shared.utils.helpers import container_check_digit, validate_container_check_digit
+
+settings = get_settings()
+
+
+class ContainerCheckDigitTest(unittest.TestCase):
+
+    def test_iso_6346_reference_number(self):
+        self.assertEqual(container_check_digit("CSQU305438"), 3)
+        self.assertTrue(validate_container_check_digit("CSQU3054383"))
+
+    def test_wrong_check_digit_is_rejected(self):
+        self.assertFalse(validate_container_check_digit("CSQU3054384"))
+        self.assertFalse(validate_container_check_digit("MSDU1234567"))
+
+    def test_category_identifier_must_be_u_j_or_z(self):
+        self.assertFalse(validate_container_check_digit("INFO1234567"))
+
+
+class QueryParserTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = QueryParser()
+        self.intent_parser = IntentParser()
+
+    def _confidence(self, query: str) -> float:
+        return self.intent_parser.score_confidence(
+            self.parser.parse(query), settings.FAST_PATH_MAX_WORDS, settings.MAX_CONTAINERS_PER_QUERY
+        )
+
+    def test_spaced_and_dashed_numbers_are_normalised(self):
+        self.assertEqual(self.parser.parse("Is MSDU 423 4521 available?")["container_candidates"], ["MSDU4234521"])
+        self.assertEqual(self.parser.parse("holds on msmu-8317127")["container_candidates"], ["MSMU8317127"])
+
+    def test_invalid_check_digit_is_unverified(self):
+        parsed = self.parser.parse("Where is MSDU1234567?")
+
+        self.assertEqual(parsed["container_candidates"], [])
+        self.assertEqual(parsed["unverified_candidates"], ["MSDU1234567"])
+
+    def test_specific_intent_wins_over_generic(self):
+        self.assertEqual(self.parser.parse("status of holds on MSDU4234521")["intent"], "holds")
+
+    def test_single_keyword_query_takes_the_fast_path(self):
+        self.assertGreaterEqual(self._confidence("Where is MSDU4234521?"), settings.FAST_PATH_CONFIDENCE_THRESHOLD)
+
+    def test_ambiguous_queries_fall_back_to_the_llm(self):
+        for query in (
+            "MSDU4234521 - can my driver go today?",
+            "Where is MSDU4234521 and does it have holds?",
+            "Where is MSDU1234567?",
+            "Where is my container?",
+        ):
+            self.assertLess(self._confidence(query), settings.FAST_PATH_CONFIDENCE_THRESHOLD, query)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+from app.layers.scraper.cache.scrape_cache import classify_container_state, max_age_for
+from app.layers.scraper.parsers.container_parser import ContainerParser
+from app.layers.scraper.scrapers.dymmy.dummy_data import build_dummy_html
+from app.shared.config.constants.scraper_constants import CACHE_MAX_AGE_BY_OPERATION, CACHE_MAX_AGE_BY_STATE
+
+OPERATIONS = ["get_full_info", "check_availability", "get_location", "check_holds", "get_lfd"]
+
+
+class ClassifyContainerStateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = ContainerParser()
+
+    def _states(self, container_id: str) -> dict:
+        html_content = build_dummy_html(container_id)
+        return {
+            operation: classify_container_state(self.parser.parse(html_content, operation), operation)
+            for operation in OPERATIONS
+        }
+
+    def test_operations_that_report_holds_agree_with_full_info(self):
+        for container_id in ("MSDU4234521", "MSBU5011443", "MSMU8317127"):
+            states = self._states(container_id)
+            for operation in ("check_availability", "check_holds"):
+                self.assertEqual(states[operation], states["get_full_info"], (container_id, operation))
+
+    def test_no_operation_calls_an_unavailable_container_available(self):
+        states = self._states("MSBU5011443")
+
+        self.assertEqual(states["get_full_info"], "on_hold")
+        self.assertNotIn("available", states.values())
+
+    def test_unknown_operation_gives_no_state(self):
+        self.assertIsNone(classify_container_state({"available": True}, None))
+
+
+class MaxAgeForTest(unittest.TestCase):
+
+    def test_lower_of_operation_and_state_limits(self):
+        self.assertEqual(
+            max_age_for("get_lfd", "available"),
+            min(CACHE_MAX_AGE_BY_OPERATION["get_lfd"], CACHE_MAX_AGE_BY_STATE["available"])
+        )
+        self.assertEqual(
+            max_age_for("check_availability", "on_hold"),
+            min(CACHE_MAX_AGE_BY_OPERATION["check_availability"], CACHE_MAX_AGE_BY_STATE["on_hold"])
+        )
+
+    def test_unknown_state_uses_operation_limit(self):
+        self.assertEqual(max_age_for("get_location"), CACHE_MAX_AGE_BY_OPERATION["get_location"])
+
+
+if __name__ == "__main__":
+    unittest.main()